@@ -10,7 +10,12 @@ function doPost(e) {
       return createErrorResponse("해시 검증 실패: 유효하지 않은 해시 값입니다. 개발자에게 연락하여 검증된 프로그램을 다시 다운로드해주세요.");
     }
 
-    // 3. OpenAI API 호출
+    // 3. 일괄 요청: items 배열의 각 항목을 처리하고 항목별 결과를 반환
+    if (Array.isArray(requestData.items)) {
+      return createBatchResponse(processOpenAiBatch(requestData.items));
+    }
+
+    // 4. OpenAI API 호출
     const openAiResponse = processOpenAiRequest(requestData.content);
     return openAiResponse.success
       ? createSuccessResponse(openAiResponse.correctedText)
@@ -60,7 +65,7 @@ function verifyHashWithCache(hash) {
 
 // OpenAI API 호출 처리 함수
 function processOpenAiRequest(content) {
-  if (!content || content.trim() === "") return { success: false, error: "content가 비어있습니다." };
+  if (typeof content !== "string" || content.trim() === "") return { success: false, error: "content가 비어있습니다." };
 
   const apiKey = useApiKey();
   if (!apiKey) return { success: false, error: "OpenAI API 키가 설정되지 않았습니다." };
@@ -68,19 +73,11 @@ function processOpenAiRequest(content) {
   const model = getGPTModel();
   const prompt = getGPTPrompt();
 
-  const payload = {
-    model,
-    messages: [
-      { role: "system", content: prompt },
-      { role: "user", content }
-    ]
-  };
-
   const options = {
     method: "post",
     contentType: "application/json",
     headers: { Authorization: `Bearer ${apiKey}` },
-    payload: JSON.stringify(payload)
+    payload: JSON.stringify(createOpenAiPayload(content, model, prompt))
   };
 
   try {
@@ -100,6 +97,80 @@ function processOpenAiRequest(content) {
   }
 }
 
+// 일괄 요청 처리 함수 (UrlFetchApp.fetchAll로 항목들을 동시에 호출)
+function processOpenAiBatch(items) {
+  const maxItems = getBatchMaxItems();
+  if (items.length > maxItems) throw new Error(`일괄 요청은 최대 ${maxItems}개 항목까지 처리할 수 있습니다.`);
+
+  const apiKey = useApiKey();
+  const model = getGPTModel();
+  const prompt = getGPTPrompt();
+
+  const results = new Array(items.length);
+  const requests = [];
+  const pending = [];
+
+  items.forEach((item, i) => {
+    // 문자열이 아닌 content(숫자, null 등)는 일괄 요청 전체가 아니라 그 항목만 실패 처리
+    if (typeof item?.content !== "string" || item.content.trim() === "") {
+      results[i] = { id: item?.id, success: false, message: "content가 비어있습니다." };
+      return;
+    }
+
+    requests.push({
+      url: "https://api.openai.com/v1/chat/completions",
+      method: "post",
+      contentType: "application/json",
+      headers: { Authorization: `Bearer ${apiKey}` },
+      payload: JSON.stringify(createOpenAiPayload(item.content, model, prompt)),
+      muteHttpExceptions: true
+    });
+    pending.push(i);
+  });
+
+  if (requests.length > 0) {
+    const responses = UrlFetchApp.fetchAll(requests);
+    responses.forEach((response, k) => {
+      const i = pending[k];
+      results[i] = { id: items[i].id, ...parseBatchItemResponse(response) };
+    });
+  }
+
+  return results;
+}
+
+// 일괄 요청의 항목 하나에 대한 OpenAI 응답 해석 함수
+function parseBatchItemResponse(response) {
+  const code = response.getResponseCode();
+  try {
+    const result = JSON.parse(response.getContentText());
+    if (code === 200 && result.choices?.length > 0) {
+      return { success: true, message: result.choices[0].message.content.trim() };
+    }
+  } catch (error) {
+    Logger.log(`API 응답 해석 실패: ${error.message}`);
+  }
+
+  Logger.log(`API 응답 오류 (코드 ${code}): ${response.getContentText()}`);
+  return { success: false, message: `API 응답 오류 (코드 ${code}): 유효하지 않은 응답입니다.` };
+}
+
+// OpenAI 요청 본문 생성 함수
+function createOpenAiPayload(content, model, prompt) {
+  return {
+    model,
+    messages: [
+      { role: "system", content: prompt },
+      { role: "user", content }
+    ]
+  };
+}
+
+// 일괄 요청 최대 항목 수 가져오기 함수
+function getBatchMaxItems() {
+  return Number(PropertiesService.getScriptProperties().getProperty('BATCH_MAX_ITEMS')) || 50;
+}
+
 // GPT 모델 가져오기 함수
 function getGPTModel() {
   return PropertiesService.getScriptProperties().getProperty('OPENAI_MODEL') || "gpt-4o-mini";
@@ -138,3 +209,11 @@ function createErrorResponse(errorMessage) {
     message: errorMessage
   })).setMimeType(ContentService.MimeType.JSON);
 }
+
+// 일괄 요청 응답 생성 함수
+function createBatchResponse(results) {
+  return ContentService.createTextOutput(JSON.stringify({
+    success: true,
+    results
+  })).setMimeType(ContentService.MimeType.JSON);
+}
@@ -0,0 +1,105 @@
+"""
+Google Script/Code.gs의 doPost를 흉내 내는 로컬 중계 서버.
+
+OpenAI를 호출하지 않고 수정전 텍스트를 조금 고쳐 그대로 돌려주며, 지연 시간, 오류 비율,
+초당 요청 수 제한을 조절할 수 있습니다. 단일 요청({"hash", "content"})과
+일괄 요청({"hash", "items"}) 형식을 모두 지원합니다.
+
+    python -m benchmarks.mock_relay --port 8765 --latency 0.05 --error-rate 0.01 --rate-limit 20
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from aiohttp import web
+
+
+class MockRelay:
+    def __init__(self, latency=0.05, jitter=0.02, error_rate=0.0, rate_limit=0.0):
+        """
+        :param latency: 요청 하나의 평균 응답 지연(초)
+        :param jitter: 지연에 더하거나 빼는 무작위 범위(초)
+        :param error_rate: HTTP 500으로 응답할 비율 (0~1)
+        :param rate_limit: 초당 허용할 요청 수, 넘으면 429로 응답 (0이면 제한 없음)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self._tokens = rate_limit
+        self._last_refill = time.monotonic()
+        self.stats = {"requests": 0, "items": 0, "errors": 0, "throttled": 0}
+
+    def make_app(self):
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/", self.handle)
+        app.router.add_get("/stats", self.handle_stats)
+        return app
+
+    def _take_token(self):
+        """토큰 버킷으로 초당 요청 수를 제한합니다."""
+        if self.rate_limit <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._last_refill) * self.rate_limit)
+        self._last_refill = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def handle(self, request):
+        self.stats["requests"] += 1
+        data = await request.json()
+
+        if not self._take_token():
+            self.stats["throttled"] += 1
+            return web.json_response({"success": False, "message": "요청이 너무 많습니다."},
+                                     status=429, headers={"Retry-After": "1"})
+
+        await asyncio.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        if random.random() < self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        if "items" in data:
+            self.stats["items"] += len(data["items"])
+            results = [
+                {"id": item.get("id"), "success": True, "message": correct(item.get("content", ""))}
+                for item in data["items"]
+            ]
+            return web.json_response({"success": True, "results": results})
+
+        self.stats["items"] += 1
+        content = data.get("content", "")
+        if not content:
+            return web.json_response({"success": False, "message": "content가 비어있습니다."})
+        return web.json_response({"success": True, "message": correct(content)})
+
+    async def handle_stats(self, request):
+        return web.json_response(self.stats)
+
+
+def correct(text):
+    """교정 결과 대신 사용할, 원문과 조금 다른 텍스트를 만듭니다."""
+    return text.replace("했다", "하였다").replace("  ", " ").strip() + "."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 중계 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="응답 지연의 무작위 범위(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500으로 응답할 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="초당 허용할 요청 수 (0이면 제한 없음)")
+    args = parser.parse_args(argv)
+
+    relay = MockRelay(args.latency, args.jitter, args.error_rate, args.rate_limit)
+    web.run_app(relay.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+로컬 중계 서버와 합성 엑셀 파일로 검증 도구와 비교 도구의 성능을 측정합니다.
+
+    python -m benchmarks.run_benchmarks --rows 100 1000 10000
+    python -m benchmarks.run_benchmarks --rows 1000 --output result.json
+    python -m benchmarks.run_benchmarks --rows 1000 --baseline result.json
+
+실제 Apps Script 주소 대신 benchmarks.mock_relay를 별도 프로세스로 띄우고, 측정용 configs.txt를
+임시 디렉터리에 만들어 사용합니다. --baseline을 주면 이전 결과보다 느려진 항목을 표시하고
+종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from threading import Event
+
+from configs.config import *
+from configs.excel_handler import ExcelChunkReader, load_excel_file
+from text_differ.comparator import highlight_diff
+from text_differ.diff_engine import compute_opcodes
+from text_verifier.metrics import percentile
+from text_verifier.verifier_engine import VerifierEngine
+from benchmarks.workbooks import write_workbook
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TimedVerifierEngine(VerifierEngine):
+    """요청마다 걸린 시간을 기록하는 검증 엔진. (행별 기록은 일괄 요청의 행들이 같은 값을 공유하므로)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request_latencies = []
+
+    async def send_post_request(self, data, timing=None, url=None):
+        start = time.perf_counter()
+        try:
+            return await super().send_post_request(data, timing, url)
+        finally:
+            self.request_latencies.append(time.perf_counter() - start)
+
+
+def write_config(directory, args):
+    config_path = os.path.join(directory, "configs.txt")
+    with open(config_path, "w", encoding="utf-8") as file:
+        file.write("[DEFAULT]\n")
+        file.write(f"API_URL=http://127.0.0.1:{args.port}/\n")
+        file.write(f"MAX_CONCURRENCY={args.concurrency}\n")
+        file.write("CACHE_ENABLED=false\n")
+        file.write("TABLE_CACHE_ENABLED=false\n")
+        file.write(f"METRICS_DIR={os.path.join(directory, 'metrics')}\n")
+        file.write(f"BATCH_ENABLED={'true' if args.batch else 'false'}\n")
+        # 속도 제한기는 기본 시작값(초당 5회)에서 천천히 올라가므로, 켜 두면 처리량 대신 제한기의 상한을 재게 됩니다.
+        file.write(f"RATE_LIMIT_ENABLED={'true' if args.rate_limiter else 'false'}\n")
+        if args.rate_limiter and args.rate_limit > 0:
+            file.write(f"RATE_LIMIT_INITIAL={args.rate_limit}\n")
+    return config_path
+
+
+def describe_rate_limiter(args):
+    """결과와 함께 출력할 클라이언트 속도 제한기 설정을 반환합니다."""
+    if not args.rate_limiter:
+        return "끔"
+    initial = args.rate_limit if args.rate_limit > 0 else DEFAULT_RATE_LIMIT_INITIAL
+    return f"켬 (초당 {initial:g}회에서 시작)"
+
+
+def start_mock_relay(args):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.mock_relay", "--port", str(args.port),
+         "--latency", str(args.latency), "--jitter", str(args.jitter),
+         "--error-rate", str(args.error_rate), "--rate-limit", str(args.rate_limit)],
+        cwd=REPO_DIR
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", args.port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("로컬 중계 서버를 시작하지 못했습니다.")
+
+
+def benchmark_verify(file_path):
+    """검증 엔진으로 파일 전체를 처리하고 처리량, 요청 지연, 저장 시간, 최대 메모리를 측정합니다."""
+    errors = []
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    reader = ExcelChunkReader(file_path)
+    engine = TimedVerifierEngine(file_path, reader, Event(), on_progress=lambda message, value: None,
+                                 on_error=errors.append)
+    engine.transport.run(engine.process_text())
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "rows": engine.completed_rows,
+        "seconds": elapsed,
+        "rows_per_sec": engine.completed_rows / elapsed if elapsed else 0.0,
+        "success": engine.success_rows,
+        "fail": engine.fail_rows,
+        "requests": len(engine.request_latencies),
+        "latency_p50": percentile(engine.request_latencies, 50),
+        "latency_p99": percentile(engine.request_latencies, 99),
+        "write_seconds": sum(seconds for _, seconds in engine.metrics.checkpoints),
+        "writes": len(engine.metrics.checkpoints),
+        "peak_mb": peak / 1024 / 1024,
+        "errors": errors,
+    }
+
+
+def create_text_boxes():
+    """화면을 사용할 수 있으면 highlight_diff에 넘길 Text 위젯 두 개를 만듭니다."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    return root, tk.Text(root), tk.Text(root)
+
+
+def benchmark_diff(file_path, granularity):
+    """
+    모든 행을 비교 도구와 같은 방식으로 비교하고 처리량과 행별 비교 시간을 측정합니다.
+    화면이 없는 환경에서는 하이라이트 없이 비교(compute_opcodes)만 측정합니다.
+    """
+    tracemalloc.start()
+    df = load_excel_file(file_path)
+    widgets = create_text_boxes()
+    durations = []
+
+    start = time.perf_counter()
+    for before, after in zip(df[COLUMN_BEFORE], df[COLUMN_AFTER]):
+        row_start = time.perf_counter()
+        if widgets:
+            _, text_box1, text_box2 = widgets
+            text_box1.delete("1.0", "end")
+            text_box1.insert("end", before)
+            text_box2.delete("1.0", "end")
+            text_box2.insert("end", after)
+            highlight_diff(text_box1, text_box2, granularity)
+        else:
+            compute_opcodes(before, after, granularity)
+        durations.append(time.perf_counter() - row_start)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if widgets:
+        widgets[0].destroy()
+
+    return {
+        "rows": len(durations),
+        "seconds": elapsed,
+        "rows_per_sec": len(durations) / elapsed if elapsed else 0.0,
+        "latency_p50": percentile(durations, 50),
+        "latency_p99": percentile(durations, 99),
+        "widgets": widgets is not None,
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def print_result(name, size, result):
+    line = (f"[{name}] {size}행: {result['rows_per_sec']:.1f}행/초 ({result['seconds']:.2f}초), "
+            f"p50 {result['latency_p50'] * 1000:.1f}ms / p99 {result['latency_p99'] * 1000:.1f}ms, "
+            f"최대 메모리 {result['peak_mb']:.1f}MB")
+    if name == "verify":
+        line += (f", 요청 {result['requests']}회, 성공 {result['success']} / 실패 {result['fail']}, "
+                 f"저장 {result['write_seconds']:.2f}초 ({result['writes']}회), 속도 제한기 {result['rate_limiter']}")
+    elif not result["widgets"]:
+        line += ", 화면 없음: 하이라이트 제외"
+    print(line, flush=True)
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """이전 결과보다 처리량이 tolerance 이상 줄었거나 p99 지연이 늘어난 항목을 반환합니다."""
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = {(item["name"], item["size"]): item["result"] for item in json.load(file)["results"]}
+
+    regressions = []
+    for item in results:
+        previous = baseline.get((item["name"], item["size"]))
+        if previous is None:
+            continue
+        current = item["result"]
+        if previous.get("rate_limiter") != current.get("rate_limiter"):
+            print(f"[주의] [{item['name']}] {item['size']}행: 이전 결과와 속도 제한기 설정이 다릅니다 "
+                  f"({previous.get('rate_limiter', '알 수 없음')} → {current.get('rate_limiter')})", flush=True)
+        if current["rows_per_sec"] < previous["rows_per_sec"] * (1 - tolerance):
+            regressions.append(f"[{item['name']}] {item['size']}행: 처리량 "
+                               f"{previous['rows_per_sec']:.1f} → {current['rows_per_sec']:.1f}행/초")
+        if current["latency_p99"] > previous["latency_p99"] * (1 + tolerance):
+            regressions.append(f"[{item['name']}] {item['size']}행: p99 "
+                               f"{previous['latency_p99'] * 1000:.1f} → {current['latency_p99'] * 1000:.1f}ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GPTextVerifier 오프라인 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000], help="측정할 행 수 목록")
+    parser.add_argument("--sentences", type=int, default=5, help="행마다 만들 문장 수")
+    parser.add_argument("--port", type=int, default=8765, help="로컬 중계 서버 포트")
+    parser.add_argument("--latency", type=float, default=0.05, help="중계 서버 평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="중계 서버 응답 지연의 무작위 범위(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="중계 서버가 HTTP 500으로 응답할 비율")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="중계 서버의 초당 요청 제한 (0이면 없음)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY, help="MAX_CONCURRENCY 값")
+    parser.add_argument("--batch", action="store_true", help="일괄 요청 사용")
+    parser.add_argument("--rate-limiter", action="store_true",
+                        help="클라이언트 속도 제한기 켜기 (기본은 끔, --rate-limit이 있으면 그 값에서 시작)")
+    parser.add_argument("--granularity", default="char", help="비교 단위 (char/word/sentence)")
+    parser.add_argument("--skip-verify", action="store_true", help="검증 도구 측정 생략")
+    parser.add_argument("--skip-diff", action="store_true", help="비교 도구 측정 생략")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="느려졌다고 판단할 비율 (기본 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        ConfigSingleton(write_config(directory, args))
+        rate_limiter = describe_rate_limiter(args)
+        if not args.skip_verify:
+            print(f"[설정] 클라이언트 속도 제한기 {rate_limiter}", flush=True)
+        relay = None if args.skip_verify else start_mock_relay(args)
+        try:
+            for size in args.rows:
+                file_path = os.path.join(directory, f"bench_{size}.xlsx")
+                start = time.perf_counter()
+                write_workbook(file_path, size, args.sentences)
+                print(f"[준비] {size}행 합성 파일 생성 {time.perf_counter() - start:.2f}초", flush=True)
+
+                if not args.skip_verify:
+                    result = benchmark_verify(file_path)
+                    result["rate_limiter"] = rate_limiter
+                    print_result("verify", size, result)
+                    results.append({"name": "verify", "size": size, "result": result})
+                if not args.skip_diff:
+                    result = benchmark_diff(file_path, args.granularity)
+                    print_result("diff", size, result)
+                    results.append({"name": "diff", "size": size, "result": result})
+        finally:
+            if relay is not None:
+                relay.terminate()
+                relay.wait()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"args": vars(args), "results": results}, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for message in regressions:
+            print(f"[느려짐] {message}", flush=True)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""벤치마크에 사용할 합성 엑셀 파일을 만듭니다."""
+import random
+
+from openpyxl import Workbook
+
+from configs.config import *
+
+SYLLABLES = "가나다라마바사아자차카타파하수업시간발표활동보고서작성했다참여하며친구들과토론"
+ENDINGS = ("했다.", "함.", "하였음.", "보임.")
+
+
+def make_sentence(rng):
+    words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) for _ in range(rng.randint(4, 10))]
+    return " ".join(words) + " " + rng.choice(ENDINGS)
+
+
+def make_text(rng, sentences):
+    return " ".join(make_sentence(rng) for _ in range(sentences))
+
+
+def write_workbook(file_path, rows, sentences=5, seed=0):
+    """
+    rows개 행의 합성 학생 데이터를 저장합니다.
+
+    수정후 열은 비교 도구 벤치마크를 위해 수정전 텍스트를 조금 바꾼 값으로 채우며,
+    상태 열은 비워 두어 모든 행이 검증 대상이 되도록 합니다.
+    """
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append([COLUMN_CLASS, COLUMN_NUMBER, COLUMN_NAME, COLUMN_BEFORE, COLUMN_AFTER, COLUMN_STATUS])
+
+    for i in range(rows):
+        before = make_text(rng, sentences)
+        after = before.replace("했다", "하였다", 1) + " " + make_sentence(rng)
+        sheet.append([i // 30 + 1, i % 30 + 1, f"학생{i + 1}", before, after, ""])
+
+    workbook.save(file_path)
@@ -0,0 +1,143 @@
+"""
+화면 없이 텍스트 검증을 실행하는 명령줄 도구.
+
+서버나 컨테이너처럼 디스플레이가 없는 환경에서 여러 엑셀 파일을 차례로 검증합니다.
+
+    python cli.py 1반.xlsx 2반.xlsx --config configs.txt
+    python cli.py 1반.xlsx --report html   # 검증이 끝나면 1반_비교.html 보고서도 만듦
+
+종료 코드:
+    0 - 모든 행이 성공
+    1 - 실패한 행이 있거나 작업이 중단됨
+    2 - 설정 파일 또는 엑셀 파일을 열 수 없음
+"""
+import argparse
+import os
+import signal
+import sys
+import time
+from threading import Event
+
+from configs.config import *
+from configs.excel_handler import ExcelChunkReader, collect_excel_files
+from configs.hash import start_background_hash
+from text_differ.report import REPORT_FORMATS, export_diff_report
+from text_verifier.verifier_engine import VerifierEngine
+
+EXIT_SUCCESS = 0
+EXIT_ROWS_FAILED = 1
+EXIT_INPUT_ERROR = 2
+
+PROGRESS_INTERVAL = 1.0  # 진행 상황 출력 간격(초)
+
+
+class ConsoleProgress:
+    """진행 상황을 일정 간격으로 표준 출력에 표시합니다."""
+
+    def __init__(self, label):
+        self.label = label
+        self.last_print = 0.0
+
+    def __call__(self, message, progress_value):
+        now = time.monotonic()
+        if progress_value < 100 and now - self.last_print < PROGRESS_INTERVAL:
+            return
+        self.last_print = now
+        print(f"[{self.label}] {message} ({progress_value:.1f}%)", flush=True)
+
+    def report(self, rows, total):
+        """보고서 작성 진행 상황 (처리한 행 수, 전체 행 수) 을 표시합니다."""
+        self(f"{rows}/{total}행 비교", rows / total * 100 if total else 100)
+
+
+def print_error(message):
+    print(f"오류: {message}", file=sys.stderr, flush=True)
+
+
+def verify_file(file_path, stop_event):
+    """엑셀 파일 하나를 검증하고 종료 코드를 반환합니다."""
+    if not os.path.isfile(file_path):
+        print_error(f"{file_path}: 파일이 존재하지 않습니다.")
+        return EXIT_INPUT_ERROR
+
+    try:
+        reader = ExcelChunkReader(file_path)
+    except Exception as e:
+        print_error(f"{file_path}: {e}")
+        return EXIT_INPUT_ERROR
+
+    if COLUMN_BEFORE not in reader.columns:
+        reader.close()
+        print_error(f"{file_path}: 엑셀 파일에 {COLUMN_BEFORE} 열이 없습니다.")
+        return EXIT_INPUT_ERROR
+
+    engine = VerifierEngine(file_path, reader, stop_event, on_progress=ConsoleProgress(file_path), on_error=print_error)
+    run_engine(engine, stop_event)
+
+    success, fail, total = engine.count_status()
+    print(f"[{file_path}] 성공 {success} / 실패 {fail} / 전체 {total}", flush=True)
+    if engine.metrics_path:
+        print(f"[{file_path}] 실행 측정 결과: {engine.metrics_path}", flush=True)
+
+    if stop_event.is_set() or success < total:
+        return EXIT_ROWS_FAILED
+    return EXIT_SUCCESS
+
+
+def run_engine(engine, stop_event):
+    """
+    Ctrl+C를 누르면 진행 중인 요청을 마무리하고 결과를 저장한 뒤 멈춥니다.
+    작업은 공용 전송 계층의 이벤트 루프 스레드에서 실행되므로, 신호는 메인 스레드에서 받습니다.
+    """
+    previous = {}
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous[signum] = signal.signal(signum, lambda *args: stop_event.set())
+    try:
+        engine.transport.run(engine.process_text())
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def write_report(file_path, report_format):
+    """검증이 끝난 파일의 비교 보고서를 만들고, 실패하면 종료 코드를 반환합니다."""
+    try:
+        report_path = export_diff_report(file_path, report_format,
+                                         on_progress=ConsoleProgress(f"{file_path} 보고서").report)
+    except Exception as e:
+        print_error(f"{file_path}: 비교 보고서를 만들지 못했습니다. {e}")
+        return EXIT_INPUT_ERROR
+    print(f"[{file_path}] 비교 보고서: {report_path}", flush=True)
+    return EXIT_SUCCESS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GPTextVerifier 명령줄 검증 도구")
+    parser.add_argument("files", nargs="+", help="검증할 엑셀 파일 또는 엑셀 파일이 있는 폴더 경로")
+    parser.add_argument("--config", default="configs.txt", help="설정 파일 경로 (기본값: configs.txt)")
+    parser.add_argument("--report", choices=REPORT_FORMATS,
+                        help="검증이 끝난 파일마다 수정전·수정후 비교 보고서를 이 형식으로 엑셀 파일 옆에 만듦")
+    args = parser.parse_args(argv)
+
+    try:
+        ConfigSingleton(args.config)
+    except FileNotFoundError as e:
+        print_error(str(e))
+        return EXIT_INPUT_ERROR
+
+    start_background_hash()
+    stop_event = Event()
+    exit_code = EXIT_SUCCESS
+    for file_path in collect_excel_files(args.files):
+        if stop_event.is_set():
+            break
+        verify_code = verify_file(file_path, stop_event)
+        exit_code = max(exit_code, verify_code)
+        if args.report and verify_code != EXIT_INPUT_ERROR and not stop_event.is_set():
+            exit_code = max(exit_code, write_report(file_path, args.report))
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import atexit
+import threading
+import time
+import weakref
+
+from configs.excel_handler import save_excel_cells
+
+# 닫지 않은 CellWriter (프로그램이 종료될 때 남은 변경 사항을 저장하기 위해)
+_open_writers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_writers():
+    """
+    메인 창을 닫는 등으로 비교 창을 닫지 않고 프로그램이 끝나도, 남은 변경 사항을 저장합니다.
+    저장 쓰레드는 데몬 쓰레드이지만 atexit 처리 중에는 아직 살아 있습니다.
+    """
+    for writer in list(_open_writers):
+        writer.close()
+
+
+class CellWriter:
+    """
+    엑셀 셀 변경 사항을 모아 두었다가 백그라운드 쓰레드에서 한 번에 저장합니다.
+
+    같은 셀을 여러 번 고치면 마지막 값만 저장하며, 첫 변경 후 flush_seconds초가 지나거나
+    flush()/close()를 호출하면 save_excel_cells로 바뀐 셀만 기록합니다.
+    저장에 실패한 변경 사항은 버리지 않고 다음 저장 때 다시 시도합니다.
+    """
+
+    def __init__(self, file_path, flush_seconds):
+        self.file_path = file_path
+        self.flush_seconds = flush_seconds
+        self.error = None  # 마지막 저장에 실패한 원인 (성공하면 None)
+
+        self._pending = {}  # {행 번호: {열 이름: 값}}
+        self._deadline = None
+        self._flush_requested = False
+        self._closing = False
+        self._writing = False
+        self._started = 0  # 시작한 저장 횟수
+        self._finished = 0  # 끝난 저장 횟수
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="CellWriter", daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    @property
+    def pending_count(self):
+        """아직 저장하지 않은 행 수."""
+        with self._condition:
+            return len(self._pending)
+
+    def stage(self, idx, values):
+        """행 idx의 {열 이름: 값} 변경 사항을 저장 대기 목록에 넣습니다."""
+        with self._condition:
+            self._pending.setdefault(idx, {}).update(values)
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.flush_seconds
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        모인 변경 사항을 바로 저장하고 끝날 때까지 기다립니다.
+        저장에 실패하면 그 예외를, 성공하면 None을 반환합니다.
+        """
+        with self._condition:
+            if not self._pending and not self._writing:
+                return None
+            started = self._started
+            self._flush_requested = True
+            self._condition.notify_all()
+            # 이 호출 이후에 시작한 저장이 실패했거나, 저장할 것이 남지 않을 때까지 기다립니다.
+            self._condition.wait_for(
+                lambda: (not self._pending and not self._writing)
+                or (self._finished > started and self.error is not None)
+            )
+            return None if not self._pending and not self._writing else self.error
+
+    def close(self):
+        """남은 변경 사항을 저장하고 쓰레드를 끝냅니다. 저장에 실패하면 쓰레드를 유지하고 그 예외를 반환합니다."""
+        error = self.flush()
+        if error is None:
+            self.stop()
+        return error
+
+    def stop(self):
+        """저장하지 않은 변경 사항을 버리고 쓰레드를 끝냅니다."""
+        with self._condition:
+            self._pending = {}
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+        _open_writers.discard(self)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending or not (self._flush_requested or time.monotonic() >= self._deadline):
+                    if self._closing:
+                        return
+                    timeout = self._deadline - time.monotonic() if self._pending else None
+                    self._condition.wait(timeout)
+
+                updates, self._pending = self._pending, {}
+                self._deadline = None
+                self._flush_requested = False
+                self._writing = True
+                self._started += 1
+
+            error = None
+            try:
+                save_excel_cells(self.file_path, updates)
+            except Exception as e:
+                error = e
+
+            with self._condition:
+                self._writing = False
+                self._finished += 1
+                self.error = error
+                if error is not None:
+                    # 저장하는 동안 새로 들어온 값이 실패한 값보다 우선합니다.
+                    for idx, values in self._pending.items():
+                        updates.setdefault(idx, {}).update(values)
+                    self._pending = updates
+                    self._deadline = time.monotonic() + self.flush_seconds
+                self._condition.notify_all()
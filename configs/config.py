@@ -11,23 +11,95 @@ COLUMN_STATUS = "상태"
 PLAG_STATUS_SUCCESS = "Success"
 PLAG_STATUS_FAIL = "Fail"
 
+# 텍스트 비교 도구에서 내보내는 변경 통계 열
+COLUMN_CHANGED_CHARS = "변경 글자 수"
+COLUMN_EDIT_RATIO = "변경 비율"
+
+# 검증 및 비교에 사용하는 열 (그 외의 열은 읽지 않고 그대로 보존)
+USED_COLUMNS = (COLUMN_NAME, COLUMN_CLASS, COLUMN_NUMBER, COLUMN_BEFORE, COLUMN_AFTER, COLUMN_STATUS)
+
+# configs.txt에 값이 없을 때 사용하는 기본값
+DEFAULT_MAX_CONCURRENCY = 4  # 동시에 보낼 최대 요청 수
+DEFAULT_CHECKPOINT_ROWS = 50  # 엑셀 파일에 저장하기 전까지 모을 최대 결과 수
+DEFAULT_CHECKPOINT_SECONDS = 30  # 엑셀 파일 저장 사이의 최대 간격(초)
+DEFAULT_JOURNAL_SYNC_ROWS = 20  # 저널을 디스크에 동기화(fsync)하기 전까지 모을 최대 결과 수
+DEFAULT_JOURNAL_SYNC_SECONDS = 1.0  # 저널을 디스크에 동기화하는 최대 간격(초)
+DEFAULT_CACHE_MAX_ENTRIES = 100000  # 응답 캐시에 보관할 최대 항목 수
+DEFAULT_CACHE_MAX_AGE_DAYS = 30  # 응답 캐시 항목의 유효 기간(일)
+DEFAULT_CACHE_COMMIT_ROWS = 50  # 응답 캐시에 한 번에 모아서 기록할 최대 결과 수
+DEFAULT_BATCH_MAX_ITEMS = 20  # 일괄 요청 하나에 담을 최대 행 수
+DEFAULT_BATCH_MAX_BYTES = 50000  # 일괄 요청 하나에 담을 수정전 텍스트의 최대 바이트 수
+DEFAULT_LOAD_CHUNK_ROWS = 500  # 엑셀 파일을 나누어 읽을 때 한 번에 읽는 행 수
+DEFAULT_RETRY_MAX_ATTEMPTS = 5  # 한 행에 대해 요청을 보낼 최대 횟수 (첫 요청 포함)
+DEFAULT_RETRY_BASE_DELAY = 1.0  # 첫 재시도 전 최대 대기 시간(초), 재시도마다 두 배로 늘어남
+DEFAULT_RETRY_MAX_DELAY = 60.0  # 재시도 전 대기 시간의 상한(초)
+DEFAULT_RETRY_STOP_AFTER_FAILED_ROWS = 10  # 이 개수만큼 행이 연속으로 실패하면 작업 중단
+DEFAULT_RATE_LIMIT_INITIAL = 5.0  # 시작 시 초당 요청 수
+DEFAULT_RATE_LIMIT_MIN = 0.2  # 초당 요청 수의 하한
+DEFAULT_RATE_LIMIT_MAX = 50.0  # 초당 요청 수의 상한
+DEFAULT_RATE_LIMIT_INCREASE = 0.2  # 정상 응답마다 늘릴 초당 요청 수
+DEFAULT_RATE_LIMIT_DECREASE = 0.5  # 과부하 응답(429, 5xx 등)을 받으면 곱할 비율
+DEFAULT_HTTP_POOL_SIZE = 20  # 중계 서버와 동시에 열어 둘 최대 연결 수
+DEFAULT_HTTP_KEEPALIVE_SECONDS = 60  # 사용하지 않는 연결을 유지할 시간(초)
+DEFAULT_HTTP_CONNECT_TIMEOUT = 10  # 연결을 맺을 때까지 기다릴 최대 시간(초)
+DEFAULT_HTTP_READ_TIMEOUT = 120  # 응답 데이터를 기다릴 최대 시간(초)
+DEFAULT_HTTP_TOTAL_TIMEOUT = 180  # 요청 하나에 걸리는 전체 시간의 상한(초)
+DEFAULT_HTTP_DNS_CACHE_TTL = 300  # DNS 조회 결과를 재사용할 시간(초)
+DEFAULT_HTTP_MAX_RESPONSE_BYTES = 10 * 1024 * 1024  # 허용할 응답 본문의 최대 크기(바이트)
+DEFAULT_MULTI_FILE_PARALLEL = 3  # 여러 파일을 검증할 때 동시에 처리할 파일 수
+DEFAULT_MULTI_FILE_MAX_REQUESTS = 8  # 여러 파일을 검증할 때 모든 파일을 합친 최대 동시 요청 수
+DEFAULT_MULTI_FILE_WORKER_PROCESSES = 2  # 엑셀 파일 읽기·저장에 사용할 작업 프로세스 수
+DEFAULT_ENDPOINT_EJECT_FAILURES = 3  # 중계 서버 주소를 잠시 제외하기 전까지 허용할 연속 오류 수
+DEFAULT_ENDPOINT_EJECT_SECONDS = 30  # 중계 서버 주소를 처음 제외할 때의 제외 시간(초)
+DEFAULT_ENDPOINT_LATENCY_ALPHA = 0.3  # 주소별 평균 응답 시간에 새 응답 시간을 반영할 비율
+DEFAULT_BYTE_LIMIT = 1500  # 텍스트 비교 도구에서 수정후 텍스트가 넘지 않아야 할 UTF-8 바이트 수
+DEFAULT_DIFF_SAVE_SECONDS = 3  # 텍스트 비교 도구에서 수정후 저장을 모아 두었다가 파일에 쓰는 간격(초)
+DEFAULT_REPORT_WORKER_PROCESSES = 0  # 비교 보고서를 만들 때 사용할 작업 프로세스 수 (0이면 CPU 수)
+DEFAULT_TABLE_CACHE_MEMORY_ENTRIES = 4  # 파싱한 엑셀 표를 메모리에 보관할 최대 파일 수
+DEFAULT_TABLE_CACHE_DISK_ENTRIES = 20  # 파싱한 엑셀 표를 디스크(~/.gptextverifier/tables)에 보관할 최대 파일 수
+
 import configparser
 import os
 
 
+def get_cache_dir():
+    """캐시 파일을 보관할 사용자 디렉터리를 반환합니다."""
+    cache_dir = os.path.join(os.path.expanduser("~"), ".gptextverifier")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
 class ConfigSingleton:
     _instance = None
 
     def __new__(cls, file_path='configs.txt'):
         if cls._instance is None:
-            cls._instance = super(ConfigSingleton, cls).__new__(cls)
-            cls._instance._config = configparser.ConfigParser()
             # 파일 존재 여부 확인 및 읽기
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"{file_path} 파일이 존재하지 않습니다.")
-            cls._instance._config.read(file_path)
+            instance = super(ConfigSingleton, cls).__new__(cls)
+            instance._config = configparser.ConfigParser()
+            instance._config.read(file_path)
+            # 읽기에 성공한 뒤에만 저장해야, 파일이 없을 때 빈 설정이 재사용되지 않습니다.
+            cls._instance = instance
         return cls._instance
 
     @property
     def config(self):
         return self._config
+
+
+def get_setting_or_default(key, default):
+    """
+    configs.txt의 [DEFAULT] 값을 default와 같은 형식(bool, int, float, str)으로 읽습니다.
+    설정 파일 없이도 쓸 수 있는 기능(텍스트 비교 도구, 표 캐시 등)에서 사용하며, 파일이나 값이 없으면 default를 반환합니다.
+    """
+    try:
+        config = ConfigSingleton().config['DEFAULT']
+    except FileNotFoundError:
+        return default
+    if isinstance(default, bool):
+        return config.getboolean(key, fallback=default)
+    if isinstance(default, (int, float)):
+        return type(default)(config.getfloat(key, fallback=default))
+    return config.get(key, fallback=default)
@@ -1,12 +1,18 @@
+import os
+import tempfile
+from io import BytesIO
+
 import pandas as pd
+from openpyxl import load_workbook
 
+from configs.config import USED_COLUMNS, DEFAULT_LOAD_CHUNK_ROWS
+from configs.table_cache import TableCache, table_key
 
-def load_excel_file(file_path):
-    """
-    Excel 파일을 열고 데이터를 읽어 리스트박스에 추가합니다.
-    """
-    if not file_path:
-        return None
+
+def check_file_access(file_path):
+    """파일이 존재하고 다른 프로그램에서 열려 있지 않은지 확인합니다."""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError("파일이 존재하지 않습니다.")
 
     try:
         # 파일이 다른 프로그램에서 열려 있는지 확인
@@ -19,4 +25,204 @@ def load_excel_file(file_path):
     except Exception as e:
         raise FileNotFoundError(f"오류 발생: {e}")
 
-    return pd.read_excel(file_path, dtype=str, keep_default_na=False)
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def collect_excel_files(paths):
+    """
+    파일과 폴더가 섞인 경로 목록을 엑셀 파일 경로 목록으로 바꿉니다.
+
+    폴더는 바로 아래의 엑셀 파일을 이름순으로 포함하며, 엑셀이 열려 있을 때 생기는
+    임시 파일(~$로 시작)은 제외합니다. 같은 파일은 한 번만 포함합니다.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.listdir(path))
+            candidates = [os.path.join(path, name) for name in names
+                          if name.lower().endswith(EXCEL_EXTENSIONS) and not name.startswith("~$")]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate not in files:
+                files.append(candidate)
+    return files
+
+
+def load_excel_file(file_path):
+    """
+    Excel 파일을 열고 데이터를 읽어 리스트박스에 추가합니다.
+    같은 내용의 파일을 이미 파싱한 적이 있으면 TableCache에 보관된 표를 사용합니다.
+    """
+    if not file_path:
+        return None
+
+    check_file_access(file_path)
+
+    cache = TableCache.shared()
+    if cache is None:
+        return pd.read_excel(file_path, dtype=str, keep_default_na=False)
+
+    table = cache.get(file_path)
+    if table is None:
+        key = table_key(file_path)
+        table = pd.read_excel(file_path, dtype=str, keep_default_na=False)
+        cache.put(file_path, table, key)
+    return table
+
+
+def _cell_to_str(value):
+    """pd.read_excel(dtype=str)과 같은 방식으로 셀 값을 문자열로 바꿉니다."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class ExcelChunkReader:
+    """
+    엑셀 파일의 첫 번째 시트에서 필요한 열만 chunk_size개 행씩 DataFrame으로 읽습니다.
+
+    openpyxl의 읽기 전용 모드로 행을 차례로 순회하므로 전체 시트를 한 번에 메모리에 올리지 않으며,
+    앞쪽 묶음을 처리하는 동안 뒤쪽 행을 계속 읽을 수 있습니다.
+    각 묶음의 인덱스는 pd.read_excel과 같은 0부터 시작하는 데이터 행 번호입니다.
+
+    텍스트 비교 도구가 load_excel_file로 파싱해 TableCache에 보관한 표가 있으면, 파일을 파싱하지 않고
+    그 표의 필요한 열만 나눠 돌려줍니다. 묶음씩 읽는 경우에는 메모리 사용량을 제한하기 위해 캐시를 채우지 않습니다.
+    """
+
+    def __init__(self, file_path, columns=USED_COLUMNS, chunk_size=DEFAULT_LOAD_CHUNK_ROWS):
+        check_file_access(file_path)
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.rows_read = 0
+        self._workbook = None
+
+        cache = TableCache.shared()
+        self._table = cache.get(file_path, columns) if cache is not None else None
+        if self._table is not None:
+            self.columns = list(self._table.columns)
+            # 파일에서 읽을 때처럼 필요한 열이 모두 빈 끝쪽 행은 버립니다.
+            filled = (self._table != "").any(axis=1).to_numpy().nonzero()[0]
+            self.estimated_rows = int(filled[-1]) + 1 if len(filled) else 0
+            return
+
+        # 읽는 도중 결과 저장으로 파일이 바뀌어도 영향이 없도록 압축된 원본을 메모리에 올려 둡니다.
+        with open(file_path, 'rb') as file:
+            self._workbook = load_workbook(BytesIO(file.read()), read_only=True, data_only=True)
+        self._sheet = self._workbook.worksheets[0]
+
+        self._header = next(self._sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        # 이름이 같은 열이 여러 개이면 pd.read_excel처럼 첫 번째 열을 사용합니다.
+        positions = {}
+        for i, name in enumerate(self._header):
+            if name is not None:
+                positions.setdefault(_cell_to_str(name), i)
+        self.columns = [column for column in columns if column in positions]
+        self._positions = [positions[column] for column in self.columns]
+
+        # 시트에 기록된 범위로 추정한 행 수 (끝의 빈 행이 포함될 수 있음)
+        self.estimated_rows = max(0, (self._sheet.max_row or 1) - 1)
+
+    def __iter__(self):
+        if self._table is not None:
+            yield from self._iter_table()
+            return
+        if not self.columns:
+            self.close()
+            return
+
+        min_col = min(self._positions)
+        offsets = [position - min_col for position in self._positions]
+        rows = self._sheet.iter_rows(min_row=2, min_col=min_col + 1, max_col=max(self._positions) + 1,
+                                     values_only=True)
+
+        buffer, empty_rows = [], []
+        try:
+            for values in rows:
+                record = [_cell_to_str(values[offset]) if offset < len(values) else "" for offset in offsets]
+
+                # 끝에 붙은 빈 행은 pd.read_excel처럼 버리고, 중간의 빈 행은 행 번호를 지키기 위해 유지합니다.
+                if not any(record):
+                    empty_rows.append(record)
+                    continue
+                buffer.extend(empty_rows)
+                empty_rows = []
+                buffer.append(record)
+
+                if len(buffer) >= self.chunk_size:
+                    yield self._make_chunk(buffer)
+                    buffer = []
+
+            if buffer:
+                yield self._make_chunk(buffer)
+        finally:
+            self.close()
+
+    def _iter_table(self):
+        """캐시에 보관된 표를 chunk_size개 행씩 나눠 돌려줍니다."""
+        table = self._table
+        for start in range(0, self.estimated_rows, self.chunk_size):
+            chunk = table.iloc[start:min(start + self.chunk_size, self.estimated_rows)]
+            self.rows_read = chunk.index.stop
+            yield chunk
+        self.close()
+
+    def _make_chunk(self, records):
+        start = self.rows_read
+        self.rows_read += len(records)
+        return pd.DataFrame(records, columns=self.columns, index=pd.RangeIndex(start, self.rows_read))
+
+    def close(self):
+        self._table = None
+        if self._workbook is not None:
+            self._workbook.close()
+
+
+def save_excel_cells(file_path, updates):
+    """
+    {행 번호: {열 이름: 값}} 형태의 변경 사항을 엑셀 파일의 해당 셀에만 기록합니다.
+
+    다른 열과 서식은 그대로 유지되며, 없는 열은 머리글 끝에 새로 추가합니다. .xlsm 파일의 매크로도 유지합니다.
+    바꾸는 셀은 일부이지만 openpyxl은 셀만 고쳐 쓸 수 없어, 호출할 때마다 통합 문서 전체를 읽고 다시 저장합니다.
+    (행 수에 비례해 수 초가 걸릴 수 있으므로, 변경 사항을 모아서 호출하고 검증 엔진은 작업 프로세스에서 실행합니다)
+    저장 도중 종료되어도 원본이 손상되지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    """
+    if not updates:
+        return
+
+    key = table_key(file_path)
+    extension = os.path.splitext(file_path)[1].lower()
+    workbook = load_workbook(file_path, keep_vba=extension == ".xlsm")
+    sheet = workbook.worksheets[0]
+    header = {_cell_to_str(cell.value): cell.column for cell in sheet[1] if cell.value is not None}
+
+    for values in updates.values():
+        for column in values:
+            if column not in header:
+                header[column] = max(header.values(), default=0) + 1
+                sheet.cell(row=1, column=header[column], value=column)
+
+    for idx, values in updates.items():
+        for column, value in values.items():
+            sheet.cell(row=int(idx) + 2, column=header[column], value=value)
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(suffix=extension or ".xlsx", dir=directory)
+    os.close(fd)
+    try:
+        workbook.save(temp_path)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    # 파싱해 둔 표에도 같은 값을 반영해, 저장한 파일을 다시 열 때 파싱하지 않도록 합니다.
+    cache = TableCache.shared()
+    if cache is not None:
+        cache.update(file_path, key, {
+            idx: {column: _cell_to_str(value) for column, value in values.items()}
+            for idx, values in updates.items()
+        })
@@ -1,34 +1,106 @@
 import hashlib
+import json
+import mmap
 import os
 import sys
+import threading
+
+from configs.config import get_cache_dir
 
 # 캐시를 위한 딕셔너리 생성
 hash_cache = {}
+_hash_lock = threading.Lock()
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 한 번에 해시에 넣는 바이트 수
+HASH_CACHE_FILE = "hash_cache.json"  # 실행 파일 해시를 보관하는 파일 (캐시 디렉터리 안)
 
 
 def sha_256_hash():
+    """
+    실행 중인 프로그램 파일의 SHA-256 해시를 반환합니다.
+
+    한 번 계산한 값은 메모리와 디스크(경로, 크기, 수정 시각 기준)에 저장하므로, 같은 실행 파일은
+    다시 해시하지 않습니다. 백그라운드 계산이 진행 중이면 끝날 때까지 기다렸다가 그 결과를 사용합니다.
+    """
     # PyInstaller로 패키징된 경우 실행 파일 경로를 가져옴
     if getattr(sys, 'frozen', False):
         script_path = sys.executable  # 현재 실행 중인 바이너리 파일 경로
     else:
         script_path = __file__
 
-    # 캐시에 해시가 이미 저장되어 있는지 확인
-    if script_path in hash_cache:
-        return hash_cache[script_path]
-
-    # 바이너리 파일을 열어서 내용을 읽어들임
-    with open(script_path, 'rb') as file:
-        file_content = file.read()
+    with _hash_lock:
+        # 캐시에 해시가 이미 저장되어 있는지 확인
+        if script_path in hash_cache:
+            return hash_cache[script_path]
 
-    # SHA-256 해시 계산
-    sha256_hash = hashlib.sha256(file_content).hexdigest()
+        stat = os.stat(script_path)
+        sha256_hash = _load_cached_hash(script_path, stat)
+        if sha256_hash is None:
+            sha256_hash = _hash_file(script_path)
+            _save_cached_hash(script_path, stat, sha256_hash)
 
-    # 해시를 캐시에 저장
-    hash_cache[script_path] = sha256_hash
+        # 해시를 캐시에 저장
+        hash_cache[script_path] = sha256_hash
 
     return sha256_hash
 
 
+def start_background_hash():
+    """프로그램 시작 시 해시를 미리 계산해, 첫 요청이 해시 계산을 기다리지 않도록 합니다."""
+    threading.Thread(target=sha_256_hash, daemon=True).start()
+
+
+def _hash_file(path):
+    """파일 전체를 메모리에 올리지 않고 mmap(불가능하면 나누어 읽기)으로 SHA-256 해시를 계산합니다."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # 빈 파일이거나 mmap을 지원하지 않는 경우
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        else:
+            with mapped:
+                for offset in range(0, len(mapped), HASH_CHUNK_SIZE):
+                    digest.update(mapped[offset:offset + HASH_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+def _cache_path():
+    return os.path.join(get_cache_dir(), HASH_CACHE_FILE)
+
+
+def _read_cache():
+    try:
+        with open(_cache_path(), 'r', encoding='utf-8') as file:
+            entries = json.load(file)
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_cached_hash(path, stat):
+    """경로, 크기, 수정 시각이 모두 같은 경우에만 저장된 해시를 반환합니다."""
+    entry = _read_cache().get(os.path.abspath(path))
+    if isinstance(entry, dict) and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry.get("sha256")
+    return None
+
+
+def _save_cached_hash(path, stat, sha256_hash):
+    """해시를 디스크 캐시에 저장합니다. 저장하지 못해도 프로그램 동작에는 영향이 없습니다."""
+    entries = _read_cache()
+    entries[os.path.abspath(path)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256_hash}
+    cache_path = _cache_path()
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(entries, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
 if __name__ == "__main__":
     print("Program SHA-256 Hash:", sha_256_hash())
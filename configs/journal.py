@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import time
+
+from configs.config import DEFAULT_JOURNAL_SYNC_ROWS, DEFAULT_JOURNAL_SYNC_SECONDS
+
+
+def fingerprint(text):
+    """행이 바뀌지 않았는지 확인하기 위한 짧은 지문을 만듭니다."""
+    return hashlib.sha1(str(text).encode('utf-8')).hexdigest()[:16]
+
+
+class ResultJournal:
+    """
+    처리 결과를 엑셀 파일 옆의 .journal 파일에 한 줄씩 기록합니다.
+
+    엑셀 파일 전체를 다시 쓰기 전에 프로그램이 비정상 종료되더라도 이미 받은 결과를 잃지 않도록,
+    각 결과는 기록 즉시 운영체제에 넘깁니다. 디스크 동기화(fsync)는 sync_rows개 결과 또는 sync_seconds초마다
+    한 번만 하므로, 전원이 꺼지는 경우에는 마지막 동기화 이후의 결과를 잃고 다음 실행에서 다시 요청합니다.
+    엑셀 파일에 저장된 결과는 compact()로 저널에서 지우므로, 저널에는 아직 엑셀 파일에 반영되지 않은 결과만 남습니다.
+    """
+
+    def __init__(self, file_path, sync_rows=DEFAULT_JOURNAL_SYNC_ROWS, sync_seconds=DEFAULT_JOURNAL_SYNC_SECONDS):
+        self.path = f"{file_path}.journal"
+        self.sync_rows = max(1, sync_rows)
+        self.sync_seconds = sync_seconds
+        self._file = None
+        self._unsynced = 0  # 마지막 fsync 이후 기록한 결과 수
+        self._last_sync = time.monotonic()
+        self._unsaved = {}  # 아직 엑셀 파일에 저장되지 않은 {행 번호: 저널 항목}
+        self._dirty = False  # 파일에는 남아 있지만 더 이상 필요 없는 항목이 있음
+
+    def replay(self):
+        """저널에 남은 결과를 {행 번호: (지문, 수정후, 상태)} 형태로 읽어옵니다."""
+        results = {}
+        if not os.path.exists(self.path):
+            return results
+
+        with open(self.path, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                    results[entry["row"]] = (entry["before"], entry["after"], entry["status"])
+                    self._unsaved[entry["row"]] = entry
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # 기록 도중 종료되어 잘린 줄은 건너뜀
+
+        return results
+
+    def append(self, row, before, after, status):
+        """결과 하나를 저널에 추가합니다. 디스크 동기화는 sync_rows개 또는 sync_seconds초마다 모아서 합니다."""
+        if self._file is None:
+            self._file = self._open_for_append()
+
+        entry = {"row": int(row), "before": fingerprint(before), "after": after, "status": status}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._unsaved[entry["row"]] = entry
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_rows or time.monotonic() - self._last_sync >= self.sync_seconds:
+            self.sync()
+
+    def sync(self):
+        """기록한 결과를 디스크에 동기화합니다."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def discard(self, row):
+        """복원하지 않기로 한 이전 실행의 결과를 다음 compact() 때 저널에서 지웁니다."""
+        if self._unsaved.pop(int(row), None) is not None:
+            self._dirty = True
+
+    def compact(self, saved):
+        """
+        엑셀 파일에 저장한 결과를 저널에서 지우고, 아직 저장하지 않은 결과만 남도록 저널을 다시 씁니다.
+
+        :param saved: 방금 저장한 {행 번호: (수정후, 상태)}. 저장하는 동안 같은 행에 새 결과가 기록되었으면 그 결과는 남깁니다.
+        """
+        for row, (after, status) in saved.items():
+            entry = self._unsaved.get(int(row))
+            if entry is not None and entry["after"] == after and entry["status"] == status:
+                del self._unsaved[int(row)]
+                self._dirty = True
+        if not self._dirty:
+            return
+
+        self.close()
+        if not self._unsaved:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        else:
+            # 다시 쓰는 도중 종료되어도 기존 저널이 남도록 임시 파일에 쓴 뒤 교체합니다.
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                for entry in self._unsaved.values():
+                    file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def _open_for_append(self):
+        """잘린 마지막 줄이 있으면 줄바꿈을 채운 뒤 추가 모드로 엽니다."""
+        needs_newline = False
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, 'rb') as file:
+                file.seek(-1, os.SEEK_END)
+                needs_newline = file.read(1) != b"\n"
+
+        file = open(self.path, 'a', encoding='utf-8')
+        if needs_newline:
+            file.write("\n")
+        return file
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """모든 결과가 엑셀 파일에 저장된 뒤 저널을 삭제합니다."""
+        self.close()
+        self._unsaved = {}
+        self._dirty = False
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,105 @@
+import hashlib
+import os
+import sqlite3
+import time
+import unicodedata
+
+from configs.config import DEFAULT_CACHE_COMMIT_ROWS
+
+
+def normalize_text(text):
+    """같은 내용이 같은 키를 갖도록 줄바꿈, 유니코드 정규화, 앞뒤 공백을 통일합니다."""
+    text = str(text).replace("\r\n", "\n").replace("\r", "\n")
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def make_cache_key(content, url):
+    """정규화된 수정전 텍스트와 중계 서버 주소로 캐시 키를 만듭니다."""
+    payload = f"{url}\0{normalize_text(content)}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    교정 결과를 SQLite 파일에 보관하는 캐시.
+
+    성공한 응답만 저장하며, max_age_days보다 오래되었거나 max_entries를 넘는 항목은
+    가장 오래 사용되지 않은 것부터 정리합니다. 캐시를 사용한 시각은 메모리에 모아 두었다가
+    정리할 때 한 번에 기록하고, 새 응답도 commit_rows개씩 모아 한 번에 저장하므로
+    행마다 디스크에 쓰지 않습니다. (모아 둔 응답도 get()으로 바로 찾을 수 있음)
+    """
+
+    def __init__(self, path, max_entries, max_age_days, commit_rows=DEFAULT_CACHE_COMMIT_ROWS):
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 24 * 60 * 60
+        self.commit_rows = max(1, commit_rows)
+        self._last_used = {}  # 아직 파일에 기록하지 않은 {키: 마지막 사용 시각}
+        self._pending = {}  # 아직 파일에 기록하지 않은 {키: (교정 결과, 저장 시각)}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, message TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)")
+        self._conn.commit()
+        self.evict()
+
+    def get(self, key):
+        """저장된 교정 결과를 반환하고, 없거나 만료되었으면 None을 반환합니다."""
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending[0]
+
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT message FROM responses WHERE key = ? AND created >= ?", (key, now - self.max_age)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._last_used[key] = now
+        return row[0]
+
+    def put(self, key, message):
+        """교정 결과를 저장 대기 목록에 넣고, commit_rows개가 모이면 한 번에 기록합니다."""
+        self._last_used.pop(key, None)
+        self._pending[key] = (message, time.time())
+        if len(self._pending) >= self.commit_rows:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 교정 결과를 한 번의 트랜잭션으로 기록합니다."""
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO responses (key, message, created, last_used) VALUES (?, ?, ?, ?)",
+            [(key, message, now, now) for key, (message, now) in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending = {}
+
+    def evict(self):
+        """모아 둔 교정 결과와 사용 시각을 기록한 뒤, 만료된 항목과 최대 개수를 넘는 항목을 삭제합니다."""
+        self.flush()
+        if self._last_used:
+            self._conn.executemany(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._last_used.items()]
+            )
+            self._last_used = {}
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.max_age,))
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._conn.commit()
+
+    def close(self):
+        self.evict()
+        self._conn.close()
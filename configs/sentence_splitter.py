@@ -0,0 +1,20 @@
+import re
+
+# 문장 끝: 마침표/물음표/느낌표(와 닫는 따옴표·괄호) 뒤의 공백, 또는 줄바꿈
+SENTENCE_END = re.compile(r'[.!?…。]+["\'”’)\]]*\s+|\n+')
+
+
+def split_sentences(text):
+    """
+    텍스트를 문장 단위로 나눕니다.
+
+    각 조각은 문장 뒤의 공백과 줄바꿈을 포함하므로, 조각을 그대로 이어 붙이면 원문과 같습니다.
+    """
+    pieces = []
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        pieces.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
@@ -0,0 +1,60 @@
+import importlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from configs.config import get_cache_dir, get_setting_or_default
+
+# 메인 창이 뜬 뒤 백그라운드에서 미리 불러올 모듈 (도구 창을 처음 열 때 기다리지 않도록)
+PREWARM_MODULES = (
+    "pandas",
+    "openpyxl",
+    "aiohttp",
+    "text_verifier.gui_text_verifier",
+    "text_verifier.gui_batch_verifier",
+    "text_differ.gui_text_differ",
+)
+STARTUP_LOG_FILE = "startup_times.jsonl"  # 시작 시간 측정 결과를 한 줄씩 추가하는 파일 (캐시 디렉터리 안)
+
+
+def is_prewarm_enabled():
+    """configs.txt의 PREWARM_ENABLED 값을 확인합니다. 설정 파일이 없으면 미리 불러오기를 사용합니다."""
+    return get_setting_or_default('PREWARM_ENABLED', True)
+
+
+class ModulePrewarmer:
+    """무거운 모듈을 백그라운드 쓰레드에서 미리 import하고 모듈별 소요 시간을 기록합니다."""
+
+    def __init__(self, modules=PREWARM_MODULES):
+        self.modules = modules
+        self.timings = {}  # {모듈 이름: 소요 시간(초)}, 불러오지 못한 모듈은 None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ModulePrewarmer", daemon=True)
+        self._thread.start()
+
+    def finished(self):
+        return self._thread is not None and not self._thread.is_alive()
+
+    def _run(self):
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception:
+                # 미리 불러오기에 실패해도 도구 창을 열 때 다시 import하면서 오류를 알립니다.
+                self.timings[name] = None
+                continue
+            self.timings[name] = time.perf_counter() - start
+
+
+def record_startup_time(record):
+    """시작 시간 측정 결과에 측정 시각을 더해 캐시 디렉터리의 STARTUP_LOG_FILE에 추가하고 경로를 반환합니다."""
+    record = {"measured_at": datetime.now().isoformat(timespec="seconds"), **record}
+    log_path = os.path.join(get_cache_dir(), STARTUP_LOG_FILE)
+    with open(log_path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return log_path
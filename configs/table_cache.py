@@ -0,0 +1,188 @@
+import glob
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from configs.config import *
+
+
+def table_key(file_path):
+    """파일의 (절대 경로, 크기, 수정 시각)을 반환합니다. 파일 내용이 바뀌면 키도 바뀝니다."""
+    stat = os.stat(file_path)
+    return os.path.normcase(os.path.abspath(file_path)), stat.st_size, stat.st_mtime_ns
+
+
+def _disk_format():
+    """
+    pyarrow가 있으면 열 단위 형식인 feather를, 없으면 pickle을 사용합니다.
+    pyarrow는 선택 의존성이므로 requirements.txt에 넣지 않았습니다. (pip install pyarrow로 설치)
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "pkl"
+    return "feather"
+
+
+class TableCache:
+    """
+    엑셀 파일을 파싱한 표(DataFrame)를 메모리와 디스크에 보관합니다.
+
+    키는 (경로, 크기, 수정 시각)이므로 다른 프로그램이 파일을 고치면 자동으로 다시 파싱합니다.
+    이 프로그램이 셀을 저장할 때는 update()로 저장한 값을 표에 반영하고 새 키로 옮기므로,
+    저장 뒤에 같은 파일을 다시 열어도 파싱하지 않습니다.
+    메모리에는 최근 사용한 memory_entries개, 디스크에는 disk_entries개 파일까지 보관합니다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directory, memory_entries, disk_entries):
+        """
+        :param directory: 표 파일을 보관할 디렉터리 (None이면 디스크에 보관하지 않음)
+        :param memory_entries: 메모리에 보관할 최대 표 수
+        :param disk_entries: 디스크에 보관할 최대 표 수
+        """
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.disk_format = _disk_format()
+        self._memory = OrderedDict()  # {경로: ((경로, 크기, 수정 시각), DataFrame)}
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def shared(cls):
+        """configs.txt의 TABLE_CACHE_* 설정으로 만든 공용 캐시를 반환하고, 사용하지 않으면 None을 반환합니다."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                if not get_setting_or_default('TABLE_CACHE_ENABLED', True):
+                    cls._instance = False
+                else:
+                    memory_entries = get_setting_or_default('TABLE_CACHE_MEMORY_ENTRIES',
+                                                            DEFAULT_TABLE_CACHE_MEMORY_ENTRIES)
+                    disk_entries = get_setting_or_default('TABLE_CACHE_DISK_ENTRIES', DEFAULT_TABLE_CACHE_DISK_ENTRIES)
+                    directory = os.path.join(get_cache_dir(), "tables") if disk_entries > 0 else None
+                    cls._instance = cls(directory, max(0, memory_entries), max(0, disk_entries))
+            return cls._instance or None
+
+    def get(self, file_path, columns=None):
+        """
+        파일의 현재 내용과 같은 표가 있으면 복사본을 반환하고, 없으면 None을 반환합니다.
+
+        :param columns: 주어지면 표에 있는 열만 이 순서대로 복사합니다 (전체 표를 복사하지 않음)
+        """
+        key = table_key(file_path)
+        table = self._lookup(key)
+        if table is None:
+            return None
+        if columns is not None:
+            table = table[[column for column in columns if column in table.columns]]
+        return table.copy()
+
+    def put(self, file_path, table, key=None):
+        """
+        파싱한 표를 보관합니다.
+
+        :param key: 파싱을 시작하기 전에 table_key()로 구한 키 (파싱 도중 파일이 바뀌었으면 보관하지 않음)
+        """
+        current = table_key(file_path)
+        if key is not None and key != current:
+            return
+        self._store(current, table.copy())
+
+    def update(self, file_path, key, updates):
+        """
+        이 프로그램이 셀을 저장한 뒤 호출해, 저장 전 키(key)의 표에 {행 번호: {열 이름: 문자열 값}}을 반영하고
+        저장 후의 키로 옮깁니다. 저장 전 표가 없으면 아무것도 하지 않습니다.
+        """
+        table = self._lookup(key)
+        if table is None:
+            return
+        # 다른 곳에 나눠 준 복사본과 메모리의 원본이 같은 배열을 쓰지 않도록 복사한 뒤 고칩니다.
+        table = table.copy()
+        for idx, values in updates.items():
+            for column, value in values.items():
+                if column not in table.columns:
+                    table[column] = ""
+                table.at[int(idx), column] = value
+        self._store(table_key(file_path), table)
+
+    def _lookup(self, key):
+        path = key[0]
+        with self._lock:
+            entry = self._memory.get(path)
+            if entry is not None and entry[0] == key:
+                self._memory.move_to_end(path)
+                return entry[1]
+
+        disk_path = self._disk_path(key)
+        if disk_path is None or not os.path.exists(disk_path):
+            return None
+        try:
+            table = pd.read_feather(disk_path) if self.disk_format == "feather" else pd.read_pickle(disk_path)
+            os.utime(disk_path)  # 가장 오래 사용하지 않은 파일부터 정리하기 위해 사용 시각을 기록
+        except Exception:
+            # 깨진 캐시 파일은 지우고 엑셀 파일을 다시 파싱합니다.
+            self._remove(disk_path)
+            return None
+        self._remember(key, table)
+        return table
+
+    def _store(self, key, table):
+        self._remember(key, table)
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        os.close(fd)
+        try:
+            if self.disk_format == "feather":
+                table.to_feather(temp_path)
+            else:
+                table.to_pickle(temp_path)
+            os.replace(temp_path, disk_path)
+        except Exception:
+            # 디스크 캐시는 보조 수단이므로, 저장할 수 없는 표(숫자 열 이름 등)는 메모리에만 보관합니다.
+            self._remove(temp_path)
+            return
+
+        # 같은 엑셀 파일의 이전 내용과 한도를 넘는 오래된 파일을 정리합니다.
+        prefix = disk_path.rsplit("-", 2)[0]
+        for old_path in glob.glob(glob.escape(prefix) + "-*"):
+            if old_path != disk_path:
+                self._remove(old_path)
+        paths = glob.glob(os.path.join(self.directory, f"*.{self.disk_format}"))
+        if len(paths) > self.disk_entries:
+            paths.sort(key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0)
+            for old_path in paths[:len(paths) - self.disk_entries]:
+                self._remove(old_path)
+
+    def _remember(self, key, table):
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key[0]] = (key, table)
+            self._memory.move_to_end(key[0])
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key):
+        if not self.directory:
+            return None
+        path, size, mtime_ns = key
+        name = hashlib.sha256(path.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}-{size}-{mtime_ns}.{self.disk_format}")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,26 +1,41 @@
+import time
+
+STARTUP_STARTED = time.perf_counter()  # 시작 시간 측정 기준 (다른 모듈을 불러오기 전에 기록)
+
+import multiprocessing
+import sys
 import tkinter as tk
-import webbrowser
 from tkinter import Frame, Label, Button, StringVar, messagebox
 
 from tkinterdnd2 import TkinterDnD, DND_FILES
 
-from configs.hash import sha_256_hash
-from text_differ.gui_text_differ import TextDiffer
-from text_verifier.gui_text_verifier import TextVerifier
+from configs.hash import sha_256_hash, start_background_hash
+from configs.startup import ModulePrewarmer, is_prewarm_enabled, record_startup_time
+
+# pandas, openpyxl, aiohttp를 사용하는 도구 창 모듈은 첫 화면이 늦게 뜨지 않도록 처음 사용할 때 불러옵니다.
+# (메인 창이 뜬 뒤에는 ModulePrewarmer가 백그라운드에서 미리 불러옵니다.)
 
 # 기본 폰트 설정
 default_font = ("맑은 고딕", 25)
 xlsx_file_path = ""
+xlsx_file_paths = []  # 여러 파일이나 폴더를 끌어다 놓은 경우의 전체 파일 목록
 
 # 제작자 및 버전 정보
 AUTHOR = "운양고등학교 이종환T"
 VERSION = "2024.12.29-v1.4"
 
+STARTUP_POLL_MS = 100  # 시작 시간 측정 모드에서 미리 불러오기가 끝났는지 확인하는 간격(ms)
 
-def create_main_window():
+
+def create_main_window(measure_startup=False):
     """
     메인 창을 생성하고 GUI 요소를 배치하는 함수.
+
+    :param measure_startup: True면 첫 화면이 뜨기까지의 시간과 모듈 미리 불러오기 시간을 기록한 뒤 종료
     """
+    # 첫 검증 요청이 기다리지 않도록 프로그램 해시를 미리 계산
+    start_background_hash()
+
     root = TkinterDnD.Tk()  # Tk 대신 TkinterDnD.Tk 사용
     root.title("GPTextVerifier")
     root.geometry("800x600")
@@ -42,9 +57,73 @@ def create_main_window():
     menubar.add_cascade(label="About", menu=about_menu)
     root.config(menu=menubar)
 
+    # 하위 위젯의 <Map> 이벤트도 루트에 전달되므로 루트 창이 처음 나타날 때만 처리
+    def on_map(event):
+        if event.widget is root:
+            root.unbind("<Map>")
+            root.after_idle(lambda: on_first_frame(root, measure_startup))
+
+    root.bind("<Map>", on_map)
+    root.protocol("WM_DELETE_WINDOW", lambda: on_root_close(root))
     root.mainloop()
 
 
+def on_root_close(root):
+    """
+    메인 창을 닫기 전에 열려 있는 비교 창을 닫아, 아직 저장하지 않은 수정후 내용을 저장합니다.
+    저장에 실패해 사용자가 닫기를 취소하면 메인 창도 닫지 않습니다.
+    """
+    # 비교 창을 연 적이 없으면 모듈을 새로 불러오지 않습니다.
+    differ_module = sys.modules.get("text_differ.gui_text_differ")
+    if differ_module is not None and not differ_module.TextDiffer.close_all():
+        return
+    root.destroy()
+
+
+def on_first_frame(root, measure_startup):
+    """메인 창이 처음 화면에 그려진 뒤 한 번 호출되어, 도구 창에서 사용할 모듈을 미리 불러옵니다."""
+    first_frame_seconds = time.perf_counter() - STARTUP_STARTED
+
+    prewarmer = None
+    if is_prewarm_enabled():
+        prewarmer = ModulePrewarmer()
+        prewarmer.start()
+
+    if measure_startup:
+        finish_startup_measurement(root, first_frame_seconds, prewarmer, time.perf_counter())
+
+
+def finish_startup_measurement(root, first_frame_seconds, prewarmer, prewarm_started):
+    """
+    미리 불러오기가 끝나면 측정 결과를 기록하고 프로그램을 종료합니다.
+
+    측정은 파이썬이 main.py를 실행하기 시작한 시점부터이므로, PyInstaller 실행 파일의 압축 해제 시간은
+    포함되지 않습니다. 전체 시간은 실행 파일을 외부에서 실행해 종료까지 걸린 시간으로 함께 확인합니다.
+    """
+    if prewarmer is not None and not prewarmer.finished():
+        root.after(STARTUP_POLL_MS, lambda: finish_startup_measurement(
+            root, first_frame_seconds, prewarmer, prewarm_started
+        ))
+        return
+
+    record = {
+        "version": VERSION,
+        "frozen": bool(getattr(sys, 'frozen', False)),
+        "first_frame_seconds": first_frame_seconds,
+        "prewarm_seconds": time.perf_counter() - prewarm_started if prewarmer is not None else None,
+        "prewarm_modules": prewarmer.timings if prewarmer is not None else {},
+    }
+    log_path = record_startup_time(record)
+
+    # -w 옵션으로 만든 실행 파일에는 표준 출력이 없습니다.
+    if sys.stdout is not None:
+        print(f"첫 화면까지 {first_frame_seconds:.3f}초", flush=True)
+        if prewarmer is not None:
+            print(f"모듈 미리 불러오기 {record['prewarm_seconds']:.3f}초", flush=True)
+        print(f"측정 결과: {log_path}", flush=True)
+    root.destroy()
+
+
 def configure_root_layout(root):
     """
     루트 창의 전체 레이아웃 비율을 설정하는 함수.
@@ -69,18 +148,23 @@ def create_top_frame(root, file_path_var):
         """
         드래그 앤 드롭 이벤트 처리.
         """
-        # event.data에서 파일 경로를 가져오고 공백 처리를 포함해 정리
-        file_path = event.data.strip()
+        from configs.excel_handler import collect_excel_files
 
-        # Windows 경로의 경우 중괄호로 감싸져 있을 수 있으므로 제거
-        if file_path.startswith('{') and file_path.endswith('}'):
-            file_path = file_path[1:-1]
+        # event.data는 Tcl 목록 형식이며, 공백이 있는 경로는 중괄호로 감싸져 있음
+        file_paths = collect_excel_files(root.tk.splitlist(event.data))
+        if not file_paths:
+            file_path_var.set("엑셀 파일을 찾을 수 없습니다.")
+            return
 
         # 파일 경로를 StringVar에 설정
-        file_path_var.set(file_path)
+        if len(file_paths) == 1:
+            file_path_var.set(file_paths[0])
+        else:
+            file_path_var.set(f"{file_paths[0]} 외 {len(file_paths) - 1}개 파일")
 
-        global xlsx_file_path
-        xlsx_file_path = file_path
+        global xlsx_file_path, xlsx_file_paths
+        xlsx_file_path = file_paths[0]
+        xlsx_file_paths = file_paths
 
     root.drop_target_register(DND_FILES)  # 드래그 앤 드롭 활성화
     root.dnd_bind('<<Drop>>', on_file_drop)  # 드롭 이벤트 바인딩
@@ -100,17 +184,32 @@ def create_bottom_frame(root, file_path_var):
         "텍스트 검증 도구",
         0,
         "lightblue",
-        lambda: TextVerifier(root, xlsx_file_path)
+        lambda: open_verifier(root)
     )
     create_button(
         frame_bottom,
         "텍스트 비교 도구",
         1,
         "lightgreen",
-        lambda: TextDiffer(root, xlsx_file_path)
+        lambda: open_differ(root)
     )
 
 
+def open_verifier(root):
+    """파일이 여러 개면 여러 파일 검증 창을, 하나면 기존 검증 창을 엽니다."""
+    if len(xlsx_file_paths) > 1:
+        from text_verifier.gui_batch_verifier import BatchVerifier
+        BatchVerifier(root, xlsx_file_paths)
+    else:
+        from text_verifier.gui_text_verifier import TextVerifier
+        TextVerifier(root, xlsx_file_path)
+
+
+def open_differ(root):
+    from text_differ.gui_text_differ import TextDiffer
+    TextDiffer(root, xlsx_file_path)
+
+
 def configure_bottom_frame_layout(frame):
     """
     하단 프레임의 레이아웃 비율을 설정하는 함수.
@@ -156,6 +255,7 @@ def on_info_click():
 
 
 def on_github_click():
+    import webbrowser
     webbrowser.open("https://github.com/itmir913/GPTextVerifier/releases")
 
 
@@ -174,4 +274,6 @@ def on_hash_click(parent):
 
 
 if __name__ == "__main__":
-    create_main_window()
+    # PyInstaller로 패키징한 실행 파일에서 작업 프로세스를 사용하기 위해 필요
+    multiprocessing.freeze_support()
+    create_main_window(measure_startup="--startup-time" in sys.argv[1:])
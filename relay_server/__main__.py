@@ -0,0 +1,62 @@
+"""
+Google Apps Script 대신 직접 실행할 수 있는 중계 서버.
+
+    python -m relay_server --hashes hashes.txt --port 8080
+    python -m relay_server --allow-hash <SHA-256> --upstream stub
+
+OpenAI API 키는 OPENAI_API_KEY 환경 변수로 전달합니다. 검증 도구의 configs.txt에서
+API_URL=http://<서버 주소>:8080/ 으로 설정하면 Apps Script 대신 이 서버를 사용합니다.
+"""
+import argparse
+import os
+import sys
+
+from aiohttp import web
+
+from relay_server.hash_allowlist import HashAllowList
+from relay_server.server import RelayServer
+from relay_server.upstream import DEFAULT_MODEL, DEFAULT_PROMPT, OpenAIUpstream, StubUpstream
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GPTextVerifier 중계 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--hashes", help="허용할 프로그램 해시를 한 줄에 하나씩 적은 파일 (바뀌면 자동으로 다시 읽음)")
+    parser.add_argument("--allow-hash", action="append", default=[], help="허용할 프로그램 해시 (여러 번 지정 가능)")
+    parser.add_argument("--upstream", choices=("openai", "stub"), default="openai",
+                        help="교정에 사용할 업스트림 (stub은 OpenAI를 호출하지 않고 입력을 그대로 반환)")
+    parser.add_argument("--model", default=os.environ.get("OPENAI_MODEL", DEFAULT_MODEL), help="GPT 모델")
+    parser.add_argument("--prompt", default=os.environ.get("OPENAI_PROMPT", DEFAULT_PROMPT), help="GPT 프롬프트")
+    parser.add_argument("--max-concurrency", type=int, default=16, help="동시에 진행할 최대 OpenAI 호출 수")
+    parser.add_argument("--pool-size", type=int, default=20, help="OpenAI와 동시에 열어 둘 최대 연결 수")
+    parser.add_argument("--timeout", type=float, default=120, help="OpenAI 호출 하나의 시간 제한(초)")
+    parser.add_argument("--batch-max-items", type=int, default=50, help="일괄 요청 하나에 담을 수 있는 최대 항목 수")
+    parser.add_argument("--cache-entries", type=int, default=10000, help="메모리에 보관할 최대 교정 결과 수")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="stub 업스트림의 응답 지연(초)")
+    args = parser.parse_args(argv)
+
+    if not args.hashes and not args.allow_hash:
+        parser.error("--hashes 또는 --allow-hash로 허용할 해시를 지정해야 합니다.")
+
+    allow_list = HashAllowList(args.hashes, args.allow_hash)
+    if args.upstream == "stub":
+        upstream = StubUpstream(args.stub_latency)
+    else:
+        try:
+            upstream = OpenAIUpstream(os.environ.get("OPENAI_API_KEY"), args.model, args.prompt,
+                                      pool_size=args.pool_size, timeout=args.timeout)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+
+    server = RelayServer(allow_list, upstream, max(1, args.max_concurrency), args.batch_max_items,
+                         args.cache_entries)
+    print(f"중계 서버 시작: http://{args.host}:{args.port}/ (허용 해시 {len(allow_list)}개, 업스트림 {args.upstream})",
+          flush=True)
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import os
+import time
+
+
+class HashAllowList:
+    """
+    요청을 허용할 프로그램 해시 목록을 메모리에 보관합니다.
+
+    Code.gs가 sha-256 시트를 읽어 10분간 캐시하던 것과 달리, 해시 파일(한 줄에 하나)을
+    메모리의 집합으로 읽어 두고 파일이 바뀌면 다시 읽습니다. 파일 변경 여부는 최대
+    reload_seconds초마다 한 번만 확인하므로 요청마다 파일을 열지 않습니다.
+    """
+
+    def __init__(self, path=None, hashes=(), reload_seconds=10):
+        """
+        :param path: 허용할 해시를 한 줄에 하나씩 적은 파일 (없으면 hashes만 사용)
+        :param hashes: 파일과 별도로 허용할 해시 목록
+        :param reload_seconds: 해시 파일이 바뀌었는지 확인하는 최소 간격(초)
+        """
+        self.path = path
+        self.fixed = {value.strip().lower() for value in hashes if value.strip()}
+        self.reload_seconds = reload_seconds
+        self._hashes = set(self.fixed)
+        self._mtime = None
+        self._checked = 0.0
+        if path is not None:
+            self._reload()
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __contains__(self, value):
+        if not isinstance(value, str):
+            return False
+        if self.path is not None and time.monotonic() - self._checked >= self.reload_seconds:
+            self._reload()
+        return value.lower() in self._hashes
+
+    def _reload(self):
+        self._checked = time.monotonic()
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            hashes = {line.strip().lower() for line in file if line.strip() and not line.startswith("#")}
+        self._hashes = hashes | self.fixed
+        self._mtime = mtime
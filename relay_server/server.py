@@ -0,0 +1,123 @@
+import asyncio
+import json
+from collections import OrderedDict
+
+from aiohttp import web
+
+# Code.gs와 같은 오류 메시지 (검증 도구는 해시 검증 실패를 보고 작업을 멈춤)
+HASH_FAILURE_MESSAGE = "해시 검증 실패: 유효하지 않은 해시 값입니다. 개발자에게 연락하여 검증된 프로그램을 다시 다운로드해주세요."
+EMPTY_CONTENT_MESSAGE = "content가 비어있습니다."
+
+
+class RelayServer:
+    """
+    Google Script/Code.gs의 doPost와 같은 형식으로 요청을 받는 asyncio 중계 서버.
+
+    {"hash", "content"} 요청에는 {"success", "message"}로, {"hash", "items"} 일괄 요청에는
+    {"success", "results"}로 응답합니다. Apps Script와 달리 한 프로세스가 요청을 동시에 처리하며,
+    업스트림 호출 수는 max_concurrency로 제한합니다. 최근에 교정한 텍스트는 메모리에 보관하고,
+    같은 텍스트를 동시에 요청하면 업스트림은 한 번만 호출합니다.
+    """
+
+    def __init__(self, allow_list, upstream, max_concurrency=16, batch_max_items=50, cache_entries=10000):
+        """
+        :param allow_list: 요청을 허용할 해시 목록 (HashAllowList)
+        :param upstream: 텍스트를 교정하는 객체 (OpenAIUpstream 또는 StubUpstream)
+        :param max_concurrency: 동시에 진행할 최대 업스트림 호출 수
+        :param batch_max_items: 일괄 요청 하나에 담을 수 있는 최대 항목 수
+        :param cache_entries: 메모리에 보관할 최대 교정 결과 수 (0이면 보관하지 않음)
+        """
+        self.allow_list = allow_list
+        self.upstream = upstream
+        self.max_concurrency = max_concurrency
+        self.batch_max_items = batch_max_items
+        self.cache_entries = cache_entries
+        self._semaphore = None
+        self._cache = OrderedDict()  # {수정전: 교정 결과}, 가장 오래 사용하지 않은 항목부터 정리
+        self._in_flight = {}  # {수정전: 업스트림 호출 작업}
+        self.stats = {"requests": 0, "items": 0, "upstream_calls": 0, "cache_hits": 0, "shared_calls": 0}
+
+    def make_app(self):
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/", self.handle)
+        app.router.add_get("/stats", self.handle_stats)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    async def _on_startup(self, app):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        await self.upstream.start()
+
+    async def _on_cleanup(self, app):
+        await self.upstream.close()
+
+    async def handle(self, request):
+        self.stats["requests"] += 1
+        try:
+            try:
+                data = json.loads(await request.text())
+            except ValueError as e:
+                raise ValueError(f"유효하지 않은 JSON 데이터입니다: {e}")
+
+            if data.get("hash") not in self.allow_list:
+                return web.json_response({"success": False, "message": HASH_FAILURE_MESSAGE})
+
+            items = data.get("items")
+            if isinstance(items, list):
+                return web.json_response({"success": True, "results": await self.correct_batch(items)})
+
+            success, message = await self.correct(data.get("content"))
+            return web.json_response({"success": success, "message": message})
+        except Exception as e:
+            return web.json_response({"success": False, "message": f"서버 내부 오류: {e}"})
+
+    async def handle_stats(self, request):
+        return web.json_response({**self.stats, "in_flight": len(self._in_flight), "cached": len(self._cache)})
+
+    async def correct_batch(self, items):
+        """일괄 요청의 항목을 동시에 교정하고, 항목 순서대로 {"id", "success", "message"} 목록을 반환합니다."""
+        if len(items) > self.batch_max_items:
+            raise ValueError(f"일괄 요청은 최대 {self.batch_max_items}개 항목까지 처리할 수 있습니다.")
+
+        async def correct_item(item):
+            item = item if isinstance(item, dict) else {}
+            success, message = await self.correct(item.get("content"))
+            return {"id": item.get("id"), "success": success, "message": message}
+
+        return await asyncio.gather(*(correct_item(item) for item in items))
+
+    async def correct(self, content):
+        """텍스트 하나를 교정해 (성공 여부, 메시지) 를 반환합니다."""
+        self.stats["items"] += 1
+        if not isinstance(content, str) or not content.strip():
+            return False, EMPTY_CONTENT_MESSAGE
+
+        cached = self._cache.get(content)
+        if cached is not None:
+            self._cache.move_to_end(content)
+            self.stats["cache_hits"] += 1
+            return True, cached
+
+        task = self._in_flight.get(content)
+        if task is None:
+            task = asyncio.ensure_future(self._call_upstream(content))
+            self._in_flight[content] = task
+        else:
+            self.stats["shared_calls"] += 1
+        # 요청한 클라이언트의 연결이 끊겨도, 같은 텍스트를 기다리는 다른 요청을 위해 호출은 계속합니다.
+        return await asyncio.shield(task)
+
+    async def _call_upstream(self, content):
+        try:
+            async with self._semaphore:
+                self.stats["upstream_calls"] += 1
+                success, message = await self.upstream.correct(content)
+        finally:
+            del self._in_flight[content]
+
+        if success and self.cache_entries > 0:
+            self._cache[content] = message
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return success, message
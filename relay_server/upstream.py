@@ -0,0 +1,97 @@
+import asyncio
+
+import aiohttp
+
+OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+DEFAULT_MODEL = "gpt-4o-mini"
+# Code.gs의 getGPTPrompt 기본값과 같은 프롬프트
+DEFAULT_PROMPT = (
+    "너는 한국어 맞춤법 및 문맥 교정기 역할을 수행한다. 단어를 추가하거나 삭제하지 마라. "
+    "입력된 문장의 줄바꿈, 순서, 구조를 변경하지 마라. 반드시 교정된 결과만 출력하라. "
+    "입력과 동일하면 동일한 문장을 그대로 출력하라. 불필요한 설명, 부가적인 텍스트 또는 예시는 출력하지 마라. "
+    "입력된 내용이 이미 완벽하다면 수정 없이 그대로 출력하라."
+)
+
+
+class OpenAIUpstream:
+    """
+    OpenAI Chat Completions API로 텍스트를 교정합니다.
+
+    연결 풀을 가진 aiohttp 세션 하나를 서버가 켜져 있는 동안 재사용합니다.
+    오류 메시지는 Code.gs와 같은 형식이므로, 검증 도구는 "코드 429" 같은 응답을 보고 속도를 줄입니다.
+    """
+
+    def __init__(self, api_key, model=DEFAULT_MODEL, prompt=DEFAULT_PROMPT, url=OPENAI_URL,
+                 pool_size=20, timeout=120):
+        """
+        :param pool_size: OpenAI와 동시에 열어 둘 최대 연결 수
+        :param timeout: 요청 하나에 걸리는 전체 시간의 상한(초)
+        """
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+        self.api_key = api_key
+        self.model = model
+        self.prompt = prompt
+        self.url = url
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session = None
+
+    async def start(self):
+        connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}"}
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def correct(self, content):
+        """교정 결과를 (성공 여부, 교정된 텍스트 또는 오류 메시지) 로 반환합니다."""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.prompt},
+                {"role": "user", "content": content}
+            ]
+        }
+        try:
+            async with self._session.post(self.url, json=payload) as response:
+                status = response.status
+                try:
+                    result = await response.json(content_type=None)
+                except ValueError:
+                    result = None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return False, f"API 호출 실패: {str(e) or type(e).__name__}"
+
+        if status == 200 and isinstance(result, dict) and result.get("choices"):
+            return True, result["choices"][0]["message"]["content"].strip()
+        return False, f"API 응답 오류 (코드 {status}): 유효하지 않은 응답입니다."
+
+
+class StubUpstream:
+    """
+    OpenAI를 호출하지 않고 입력을 그대로 돌려주는 업스트림. (과금 없이 중계 서버를 시험할 때 사용)
+    """
+
+    def __init__(self, latency=0.0):
+        """
+        :param latency: 응답마다 기다릴 시간(초)
+        """
+        self.latency = latency
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def correct(self, content):
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return True, content.strip()
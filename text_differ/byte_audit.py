@@ -0,0 +1,74 @@
+import numpy as np
+
+
+def utf8_length(text):
+    return len(text.encode('utf-8'))
+
+
+def utf8_lengths(series):
+    """열의 모든 값의 UTF-8 바이트 수를 한 번에 계산해 정수 배열로 반환합니다. (빈 값은 0)"""
+    return series.fillna("").astype(str).str.encode('utf-8').str.len().to_numpy(dtype=np.int64)
+
+
+def audit_byte_limit(before_lengths, after_lengths, limit):
+    """수정전/수정후 열에서 바이트 제한을 넘는 행 수를 (수정전, 수정후) 로 반환합니다."""
+    return int((before_lengths > limit).sum()), int((after_lengths > limit).sum())
+
+
+class ByteCounter:
+    """
+    Text 위젯의 UTF-8 바이트 수를 입력한 만큼만 더하고 지운 만큼만 빼서 유지합니다.
+
+    위젯의 Tcl 명령을 가로채 insert/delete/replace 호출에서 바뀐 부분만 인코딩하므로,
+    키를 누를 때마다 전체 텍스트를 다시 인코딩하지 않습니다.
+    """
+
+    def __init__(self, text_widget, on_change=None):
+        """
+        :param on_change: 바이트 수가 바뀔 때마다 새 바이트 수를 받는 콜백
+        """
+        self.widget = text_widget
+        self.on_change = on_change
+        self.count = utf8_length(text_widget.get("1.0", "end-1c"))
+
+        self._name = str(text_widget)
+        self._original = self._name + "_original"
+        text_widget.tk.call("rename", self._name, self._original)
+        text_widget.tk.createcommand(self._name, self._dispatch)
+        text_widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _call(self, *args):
+        return self.widget.tk.call(self._original, *args)
+
+    def _deleted_length(self, start, end=None):
+        """delete로 지워질 부분의 바이트 수. (위젯 끝의 자동 줄바꿈은 지워지지 않으므로 제외)"""
+        if end is None:
+            end = f"{start}+1c"
+        if self._call("index", end) == self._call("index", "end"):
+            end = "end-1c"
+        return utf8_length(self._call("get", start, end))
+
+    def _dispatch(self, command, *args):
+        if command not in ("insert", "delete", "replace") or self._call("cget", "-state") == "disabled":
+            return self._call(command, *args)
+
+        if command == "insert":
+            # insert index chars ?tagList chars tagList ...?
+            delta = sum(utf8_length(chars) for chars in args[1::2])
+        elif command == "delete":
+            # delete index1 ?index2 index1 index2 ...?
+            delta = -sum(self._deleted_length(*args[i:i + 2]) for i in range(0, len(args), 2))
+        else:
+            # replace index1 index2 chars ?tagList chars tagList ...?
+            delta = sum(utf8_length(chars) for chars in args[2::2]) - self._deleted_length(*args[:2])
+
+        result = self._call(command, *args)
+        if delta:
+            self.count += delta
+            if self.on_change is not None:
+                self.on_change(self.count)
+        return result
+
+    def _on_destroy(self, event):
+        if event.widget is self.widget:
+            self.widget.tk.deletecommand(self._name)
@@ -1,6 +1,22 @@
-from difflib import SequenceMatcher
+from configs.config import get_setting_or_default
+from .diff_engine import (
+    GRANULARITY_CHAR, LineIndex, changed_ranges, compute_opcodes, subtract_ranges, update_opcodes
+)
 
-def highlight_diff(text_box1, text_box2):
+DEFAULT_DIFF_ENGINE = "myers"
+
+
+def load_diff_settings():
+    """configs.txt의 DIFF_GRANULARITY(char/word/sentence)와 DIFF_ENGINE(myers/difflib) 값을 읽습니다."""
+    return (get_setting_or_default('DIFF_GRANULARITY', GRANULARITY_CHAR),
+            get_setting_or_default('DIFF_ENGINE', DEFAULT_DIFF_ENGINE))
+
+
+def highlight_diff(text_box1, text_box2, granularity=GRANULARITY_CHAR, engine=DEFAULT_DIFF_ENGINE, opcodes=None):
+    """
+    두 텍스트 상자의 내용을 비교해 다른 부분을 하이라이트하고 opcode 목록을 반환합니다.
+    미리 계산한 opcodes가 주어지면 비교를 건너뜁니다.
+    """
     content1 = text_box1.get("1.0", "end-1c")
     content2 = text_box2.get("1.0", "end-1c")
 
@@ -12,14 +28,55 @@ def highlight_diff(text_box1, text_box2):
     text_box1.tag_configure("highlight", background="lightcoral")
     text_box2.tag_configure("highlight", background="lightgreen")
 
-    # 문자 단위 비교
-    matcher = SequenceMatcher(None, content1, content2)
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "replace" or tag == "delete":
-            start_idx = f"1.{i1}"
-            end_idx = f"1.{i2}"
-            text_box1.tag_add("highlight", start_idx, end_idx)
-        if tag == "replace" or tag == "insert":
-            start_idx = f"1.{j1}"
-            end_idx = f"1.{j2}"
-            text_box2.tag_add("highlight", start_idx, end_idx)
+    # 선택한 단위로 비교한 뒤, 글자 위치를 줄바꿈을 반영한 "줄.칸" 인덱스로 변환
+    if opcodes is None:
+        opcodes = compute_opcodes(content1, content2, granularity, engine)
+    ranges1, ranges2 = changed_ranges(opcodes)
+
+    index1 = LineIndex(content1)
+    for start, end in ranges1:
+        text_box1.tag_add("highlight", index1.index(start), index1.index(end))
+
+    index2 = LineIndex(content2)
+    for start, end in ranges2:
+        text_box2.tag_add("highlight", index2.index(start), index2.index(end))
+
+    return opcodes
+
+
+def rehighlight_diff(text_box1, text_box2, previous, granularity=GRANULARITY_CHAR, engine=DEFAULT_DIFF_ENGINE):
+    """
+    편집된 부분 근처만 다시 비교하고, 실제로 달라진 하이라이트 구간만 고칩니다.
+
+    :param previous: 이전 비교의 (수정전 텍스트, 수정후 텍스트, opcode 목록)
+    :return: 새 opcode 목록
+    """
+    old1, old2, old_opcodes = previous
+    content1 = text_box1.get("1.0", "end-1c")
+    content2 = text_box2.get("1.0", "end-1c")
+
+    opcodes = update_opcodes(old1, old2, old_opcodes, content1, content2, granularity, engine)
+    ranges1, ranges2 = changed_ranges(opcodes)
+
+    _sync_highlight(text_box1, LineIndex(content1), ranges1)
+    _sync_highlight(text_box2, LineIndex(content2), ranges2)
+
+    return opcodes
+
+
+def _sync_highlight(text_box, line_index, ranges):
+    """
+    위젯에 실제로 붙어 있는 하이라이트와 새 구간을 비교해, 차이 나는 부분만 지우거나 추가합니다.
+
+    편집 중 Tk가 태그를 옮기거나 새 글자에 이어 붙이므로, 현재 태그 위치는 위젯에서 직접 읽습니다.
+    """
+    marks = text_box.tag_ranges("highlight")
+    current = [
+        (line_index.offset(marks[i]), line_index.offset(marks[i + 1]))
+        for i in range(0, len(marks), 2)
+    ]
+
+    for start, end in subtract_ranges(current, ranges):
+        text_box.tag_remove("highlight", line_index.index(start), line_index.index(end))
+    for start, end in subtract_ranges(ranges, current):
+        text_box.tag_add("highlight", line_index.index(start), line_index.index(end))
@@ -0,0 +1,295 @@
+import re
+from bisect import bisect_right
+from difflib import SequenceMatcher
+
+from configs.sentence_splitter import split_sentences
+
+GRANULARITY_CHAR = "char"  # 글자 (한글은 음절) 단위
+GRANULARITY_WORD = "word"  # 어절 (공백으로 구분되는 단위)
+GRANULARITY_SENTENCE = "sentence"  # 문장 단위
+
+GRANULARITIES = {
+    GRANULARITY_CHAR: "글자",
+    GRANULARITY_WORD: "어절",
+    GRANULARITY_SENTENCE: "문장",
+}
+
+WORD_PATTERN = re.compile(r'\S+|\s+')
+NEWLINE_PATTERN = re.compile(r'\n')
+
+
+def tokenize(text, granularity=GRANULARITY_CHAR):
+    """텍스트를 비교 단위로 나눕니다. 토큰을 이어 붙이면 원문과 같습니다."""
+    if granularity == GRANULARITY_WORD:
+        return WORD_PATTERN.findall(text)
+    if granularity == GRANULARITY_SENTENCE:
+        return split_sentences(text)
+    return list(text)
+
+
+def myers_opcodes(a, b):
+    """
+    Myers의 O(ND) 차이 알고리즘(선형 공간, 중간 스네이크 분할)으로 두 시퀀스를 비교합니다.
+
+    결과는 difflib.SequenceMatcher.get_opcodes()와 같은 (tag, i1, i2, j1, j2) 목록이며,
+    D(삽입과 삭제 수의 합)가 최소인 편집을 찾습니다.
+    """
+    edits = []
+    _myers_diff(a, 0, len(a), b, 0, len(b), edits)
+    return _merge_edits(edits)
+
+
+def difflib_opcodes(a, b):
+    """기존 difflib.SequenceMatcher 기반 비교."""
+    return SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+
+
+# 사용할 수 있는 차이 알고리즘 (configs.txt의 DIFF_ENGINE으로 선택)
+DIFF_ENGINES = {
+    "myers": myers_opcodes,
+    "difflib": difflib_opcodes,
+}
+
+
+def _myers_diff(a, a_lo, a_hi, b, b_lo, b_hi, edits):
+    """a[a_lo:a_hi]와 b[b_lo:b_hi]의 편집 과정을 (tag, i1, i2, j1, j2) 형태로 edits에 추가합니다."""
+    # 공통 접두어와 접미어는 중간 스네이크를 찾기 전에 잘라냅니다.
+    prefix_end = a_lo
+    while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+        a_lo += 1
+        b_lo += 1
+    if a_lo > prefix_end:
+        edits.append(("equal", prefix_end, a_lo, b_lo - (a_lo - prefix_end), b_lo))
+
+    suffix = 0
+    while a_lo < a_hi - suffix and b_lo < b_hi - suffix and a[a_hi - suffix - 1] == b[b_hi - suffix - 1]:
+        suffix += 1
+    a_mid, b_mid = a_hi - suffix, b_hi - suffix
+
+    if a_lo == a_mid:
+        if b_lo < b_mid:
+            edits.append(("insert", a_lo, a_lo, b_lo, b_mid))
+    elif b_lo == b_mid:
+        edits.append(("delete", a_lo, a_mid, b_lo, b_lo))
+    else:
+        x1, y1, x2, y2 = _middle_snake(a, a_lo, a_mid, b, b_lo, b_mid)
+        _myers_diff(a, a_lo, a_lo + x1, b, b_lo, b_lo + y1, edits)
+        if x2 > x1:
+            edits.append(("equal", a_lo + x1, a_lo + x2, b_lo + y1, b_lo + y2))
+        _myers_diff(a, a_lo + x2, a_mid, b, b_lo + y2, b_mid, edits)
+
+    if suffix:
+        edits.append(("equal", a_mid, a_hi, b_mid, b_hi))
+
+
+def _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi):
+    """
+    최단 편집 경로의 가운데에 있는 스네이크(대각선 구간)를 찾아 구간 안의 상대 좌표로 반환합니다.
+
+    앞쪽과 뒤쪽에서 동시에 경로를 넓혀 가다가 두 경로가 겹치는 지점을 찾습니다.
+    """
+    n, m = a_hi - a_lo, b_hi - b_lo
+    delta = n - m
+    odd = delta % 2 == 1
+    forward = {1: 0}
+    backward = {1: 0}
+
+    for d in range((n + m + 1) // 2 + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                x = forward[k + 1]
+            else:
+                x = forward[k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            forward[k] = x
+
+            c = delta - k
+            if odd and -(d - 1) <= c <= d - 1 and x + backward[c] >= n:
+                return start_x, start_y, x, y
+
+        for c in range(-d, d + 1, 2):
+            if c == -d or (c != d and backward[c - 1] < backward[c + 1]):
+                x = backward[c + 1]
+            else:
+                x = backward[c - 1] + 1
+            y = x - c
+            start_x, start_y = x, y
+            while x < n and y < m and a[a_hi - x - 1] == b[b_hi - y - 1]:
+                x += 1
+                y += 1
+            backward[c] = x
+
+            k = delta - c
+            if not odd and -d <= k <= d and x + forward[k] >= n:
+                return n - x, m - y, n - start_x, m - start_y
+
+    raise AssertionError("중간 스네이크를 찾지 못했습니다.")
+
+
+def _merge_edits(edits):
+    """이웃한 같은 종류의 편집을 합치고, 삭제와 삽입이 붙어 있으면 replace로 묶습니다."""
+    merged = []
+    for tag, i1, i2, j1, j2 in edits:
+        if merged:
+            last_tag, li1, li2, lj1, lj2 = merged[-1]
+            if last_tag == tag or (last_tag != "equal" and tag != "equal"):
+                new_tag = tag if last_tag == tag else "replace"
+                merged[-1] = (new_tag, li1, i2, lj1, j2)
+                continue
+        merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
+def compute_opcodes(text1, text2, granularity=GRANULARITY_CHAR, engine="myers"):
+    """
+    두 텍스트를 주어진 단위로 비교하고, 글자 위치 기준의 opcode 목록을 반환합니다.
+    """
+    tokens1 = tokenize(text1, granularity)
+    tokens2 = tokenize(text2, granularity)
+    opcodes = DIFF_ENGINES.get(engine, myers_opcodes)(tokens1, tokens2)
+
+    if granularity == GRANULARITY_CHAR:
+        return opcodes
+
+    offsets1 = _token_offsets(tokens1)
+    offsets2 = _token_offsets(tokens2)
+    return [
+        (tag, offsets1[i1], offsets1[i2], offsets2[j1], offsets2[j2])
+        for tag, i1, i2, j1, j2 in opcodes
+    ]
+
+
+def update_opcodes(old1, old2, old_opcodes, new1, new2, granularity=GRANULARITY_CHAR, engine="myers"):
+    """
+    이전 비교 결과를 재사용해 편집된 부분 근처만 다시 비교합니다.
+
+    편집 앞뒤에서 두 텍스트 모두 바뀌지 않은 opcode 경계를 찾아 그 사이만 다시 비교하고,
+    나머지 opcode는 그대로(편집 뒤쪽은 길이 차이만큼 옮겨서) 사용합니다.
+    문장 경계는 멀리 떨어진 편집으로도 바뀔 수 있으므로, 어절·문장 단위에서는 고른 경계가
+    새 텍스트에서도 토큰 경계인지 확인하고 아니면 한 opcode씩 바깥으로 넓힙니다.
+    """
+    prefix1, suffix1 = _common_affixes(old1, new1)
+    prefix2, suffix2 = _common_affixes(old2, new2)
+    edit_end1 = len(old1) - suffix1
+    edit_end2 = len(old2) - suffix2
+    shift1 = len(new1) - len(old1)
+    shift2 = len(new2) - len(old2)
+
+    # 편집 앞쪽의 마지막 경계와 편집 뒤쪽의 첫 경계 (이전 텍스트 기준)
+    cut_before, cut_after = 0, len(old_opcodes)
+    for n, (_, i1, _, j1, _) in enumerate(old_opcodes):
+        if i1 < prefix1 and j1 < prefix2:
+            cut_before = n
+        if i1 > edit_end1 and j1 > edit_end2:
+            cut_after = n
+            break
+
+    if granularity != GRANULARITY_CHAR:
+        bounds1 = set(_token_offsets(tokenize(new1, granularity)))
+        bounds2 = set(_token_offsets(tokenize(new2, granularity)))
+        while cut_before > 0 and not (old_opcodes[cut_before][1] in bounds1
+                                      and old_opcodes[cut_before][3] in bounds2):
+            cut_before -= 1
+        while cut_after < len(old_opcodes) and not (old_opcodes[cut_after][1] + shift1 in bounds1
+                                                    and old_opcodes[cut_after][3] + shift2 in bounds2):
+            cut_after += 1
+
+    start1, start2 = (old_opcodes[cut_before][1], old_opcodes[cut_before][3]) if cut_before else (0, 0)
+    if cut_after < len(old_opcodes):
+        end1, end2 = old_opcodes[cut_after][1], old_opcodes[cut_after][3]
+    else:
+        end1, end2 = len(old1), len(old2)
+
+    window = [
+        (tag, i1 + start1, i2 + start1, j1 + start2, j2 + start2)
+        for tag, i1, i2, j1, j2 in compute_opcodes(
+            new1[start1:end1 + shift1], new2[start2:end2 + shift2], granularity, engine
+        )
+    ]
+    after = [
+        (tag, i1 + shift1, i2 + shift1, j1 + shift2, j2 + shift2)
+        for tag, i1, i2, j1, j2 in old_opcodes[cut_after:]
+    ]
+    return _merge_edits(old_opcodes[:cut_before] + window + after)
+
+
+def _common_affixes(old, new):
+    """두 텍스트의 공통 접두어 길이와 (접두어와 겹치지 않는) 공통 접미어 길이를 반환합니다."""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-suffix - 1] == new[-suffix - 1]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _token_offsets(tokens):
+    """토큰 번호를 글자 위치로 바꾸는 누적 길이 표 (길이 = 토큰 수 + 1)."""
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
+
+def changed_ranges(opcodes):
+    """opcode 목록에서 (수정전에서 바뀐 구간 목록, 수정후에서 바뀐 구간 목록)을 뽑습니다."""
+    ranges1, ranges2 = [], []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag in ("replace", "delete") and i2 > i1:
+            ranges1.append((i1, i2))
+        if tag in ("replace", "insert") and j2 > j1:
+            ranges2.append((j1, j2))
+    return ranges1, ranges2
+
+
+def edit_metrics(text1, text2, opcodes):
+    """
+    비교 결과로 (변경 글자 수, 변경 비율)을 계산합니다.
+
+    변경 글자 수는 수정전에서 지워진 글자와 수정후에 들어간 글자를 합한 값이고,
+    변경 비율은 이를 두 텍스트 길이의 합으로 나눈 0~1 사이의 값입니다.
+    """
+    ranges1, ranges2 = changed_ranges(opcodes)
+    changed = sum(end - start for start, end in ranges1) + sum(end - start for start, end in ranges2)
+    total = len(text1) + len(text2)
+    return changed, (changed / total if total else 0.0)
+
+
+class LineIndex:
+    """글자 위치를 Tk Text 위젯의 "줄.칸" 인덱스로 바꿉니다."""
+
+    def __init__(self, text):
+        self.line_starts = [0] + [match.end() for match in NEWLINE_PATTERN.finditer(text)]
+
+    def index(self, offset):
+        line = bisect_right(self.line_starts, offset) - 1
+        return f"{line + 1}.{offset - self.line_starts[line]}"
+
+    def offset(self, index):
+        """"줄.칸" 인덱스를 글자 위치로 바꿉니다."""
+        line, column = str(index).split(".")
+        return self.line_starts[int(line) - 1] + int(column)
+
+
+def subtract_ranges(ranges, removed):
+    """정렬된 구간 목록 ranges에서 정렬된 구간 목록 removed와 겹치는 부분을 뺀 구간 목록을 반환합니다."""
+    result = []
+    k = 0
+    for start, end in ranges:
+        while k < len(removed) and removed[k][1] <= start:
+            k += 1
+        n = k
+        while start < end and n < len(removed) and removed[n][0] < end:
+            if removed[n][0] > start:
+                result.append((start, removed[n][0]))
+            start = max(start, removed[n][1])
+            n += 1
+        if start < end:
+            result.append((start, end))
+    return result
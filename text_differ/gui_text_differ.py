@@ -1,17 +1,83 @@
+import os
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, simpledialog, ttk
+from configs.cell_writer import CellWriter
 from configs.config import *
 from configs.excel_handler import load_excel_file
-from .comparator import highlight_diff
+from .byte_audit import ByteCounter, audit_byte_limit, utf8_lengths
+from .comparator import highlight_diff, load_diff_settings, rehighlight_diff
+from .diff_engine import GRANULARITIES
+from .precompute import DiffPrecomputer
+from .report import REPORT_HTML, REPORT_XLSX, export_diff_report, report_path_for
+from .virtual_list import VirtualListbox
+
+DIFF_DEBOUNCE_MS = 150  # 입력이 이 시간(ms) 동안 멈추면 다시 비교
+PRECOMPUTE_POLL_MS = 200  # 백그라운드 계산 진행 상황을 확인하는 간격(ms)
+LOAD_POLL_MS = 100  # 파일 불러오기가 끝났는지 확인하는 간격(ms)
+WRITER_POLL_MS = 500  # 백그라운드 저장이 실패했는지 확인하는 간격(ms)
+REPORT_POLL_MS = 200  # 비교 보고서 작성 진행 상황을 확인하는 간격(ms)
+
+# 상태 열 값에 따른 목록 색상
+STATUS_COLORS = {
+    PLAG_STATUS_SUCCESS: {'bg': 'green', 'fg': 'white'},
+    PLAG_STATUS_FAIL: {'bg': 'red', 'fg': 'white'},
+}
+
+# 목록 정렬 방식
+SORT_ROW = "row"
+SORT_CHANGED_CHARS = "changed"
+SORT_EDIT_RATIO = "ratio"
+SORT_ORDERS = {
+    SORT_ROW: "원래 순서로 정렬",
+    SORT_CHANGED_CHARS: "변경 글자 수가 많은 순으로 정렬",
+    SORT_EDIT_RATIO: "변경 비율이 높은 순으로 정렬",
+}
 
 
 class TextDiffer:
+    open_windows = []  # 열려 있는 비교 창 (메인 창을 닫을 때 저장하지 않은 수정 내용을 확인하기 위해)
+
+    @classmethod
+    def close_all(cls):
+        """열려 있는 모든 비교 창을 닫습니다. 사용자가 저장하지 못한 수정 내용 때문에 닫기를 취소하면 False."""
+        for differ in list(cls.open_windows):
+            differ.close_window()
+            if differ in cls.open_windows:
+                return False
+        return True
+
     def __init__(self, parent, file_path=None):
         self.parent = parent
         self.file_path = file_path
         self.df = None
         self.default_font = ("맑은 고딕", 14)
+        granularity, self.diff_engine = load_diff_settings()
+        self.granularity_var = tk.StringVar(self.parent, value=granularity)
+        self.update_after_id = None
+        self.diff_state = None  # 마지막 비교의 (수정전, 수정후, 비교 단위, opcode 목록)
+        self.precomputer = None
+        self.precompute_after_id = None
+        self.load_after_id = None
+        self.load_queue = queue.Queue()
+        self.writer = None  # 수정후 셀을 모아서 저장하는 CellWriter (파일을 불러온 뒤 생성)
+        self.writer_after_id = None
+        self.writer_error_shown = False
+        self.report_after_id = None
+        self.report_queue = queue.Queue()
+        self.report_progress = (0, 0)  # 비교 보고서 작성 중 (처리한 행 수, 전체 행 수)
+        self.row_labels = []
+        self.row_colors = []
+        self.row_order = []  # 목록에 보이는 순서대로 나열한 행 번호
+        self.sort_var = tk.StringVar(self.parent, value=SORT_ROW)
+        self.changed_only_var = tk.BooleanVar(self.parent, value=False)
+        self.byte_limit = get_setting_or_default('BYTE_LIMIT', DEFAULT_BYTE_LIMIT)
+        self.over_limit_only_var = tk.BooleanVar(self.parent, value=False)
+        self.before_bytes = None  # 행마다 수정전 텍스트의 UTF-8 바이트 수 (numpy 배열)
+        self.after_bytes = None  # 행마다 수정후 텍스트의 UTF-8 바이트 수 (numpy 배열)
         self.setup_ui()
+        TextDiffer.open_windows.append(self)
         if self.file_path:
             self.open_file()
 
@@ -20,6 +86,7 @@ class TextDiffer:
         self.diff_window.title("텍스트 비교")
         self.diff_window.geometry("900x600")
         self.diff_window.minsize(700, 500)
+        self.diff_window.protocol("WM_DELETE_WINDOW", self.close_window)
 
         self.frame_left = tk.Frame(self.diff_window)
         self.frame_left.grid(row=0, column=0, sticky="nswe")
@@ -27,40 +94,67 @@ class TextDiffer:
         self.frame_right = tk.Frame(self.diff_window)
         self.frame_right.grid(row=0, column=1, sticky="nswe")
 
-        self.listbox = tk.Listbox(self.frame_left, width=30, font=self.default_font)
-        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.listbox = VirtualListbox(
+            self.frame_left, command=lambda e: self.on_select(e), width=30, font=self.default_font
+        )
+        self.listbox.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
-        scrollbar = tk.Scrollbar(self.frame_left, command=self.listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.listbox.config(yscrollcommand=scrollbar.set)
+        # 파일을 불러오는 동안에만 보이는 진행 표시줄
+        self.load_progress = ttk.Progressbar(self.frame_left, mode="indeterminate")
 
         frame_text1, self.text_box1, self.label_count1 = self.create_text_frame(
-            self.frame_right, "글자 바이트 수: 0", self.copy_to_clipboard, "수정전 복사"
+            self.frame_right, f"글자 바이트 수: 0 / {self.byte_limit}", self.copy_to_clipboard, "수정전 복사"
         )
         frame_text1.grid(row=0, column=0, sticky="nsew")
 
         frame_text2, self.text_box2, self.label_count2 = self.create_text_frame(
-            self.frame_right, "글자 바이트 수: 0", self.save_and_copy_to_clipboard, "수정후 저장 및 복사"
+            self.frame_right, f"글자 바이트 수: 0 / {self.byte_limit}", self.save_and_copy_to_clipboard, "수정후 저장 및 복사"
         )
         frame_text2.grid(row=0, column=1, sticky="nsew")
 
-        self.listbox.bind(
-            "<<ListboxSelect>>",
-            lambda e: self.on_select(e)
-        )
+        # 입력할 때마다 전체를 다시 세지 않고, 바뀐 부분만큼 바이트 수를 더하고 뺍니다.
+        self.byte_counter1 = ByteCounter(self.text_box1, lambda count: self.show_byte_count(self.label_count1, count))
+        self.byte_counter2 = ByteCounter(self.text_box2, lambda count: self.show_byte_count(self.label_count2, count))
+
         self.text_box1.bind(
             "<KeyRelease>",
-            lambda e: self.update_edittext_logic()
+            lambda e: self.schedule_update()
         )
         self.text_box2.bind(
             "<KeyRelease>",
-            lambda e: self.update_edittext_logic()
+            lambda e: self.schedule_update()
         )
 
         menu_bar = tk.Menu(self.diff_window)
         file_menu = tk.Menu(menu_bar, tearoff=0)
         file_menu.add_command(label="파일 열기", command=self.open_file)
+        file_menu.add_command(label="변경 통계 내보내기", command=self.export_metrics)
+        file_menu.add_command(label="비교 보고서 내보내기...", command=self.export_report)
         menu_bar.add_cascade(label="파일", menu=file_menu)
+        view_menu = tk.Menu(menu_bar, tearoff=0)
+        for value, label in GRANULARITIES.items():
+            view_menu.add_radiobutton(
+                label=f"{label} 단위 비교",
+                value=value,
+                variable=self.granularity_var,
+                command=self.on_granularity_change
+            )
+        view_menu.add_separator()
+        for value, label in SORT_ORDERS.items():
+            view_menu.add_radiobutton(label=label, value=value, variable=self.sort_var, command=self.refresh_listbox)
+        view_menu.add_checkbutton(
+            label="변경된 행만 보기",
+            variable=self.changed_only_var,
+            command=self.refresh_listbox
+        )
+        view_menu.add_separator()
+        view_menu.add_checkbutton(
+            label="바이트 제한 초과 행만 보기",
+            variable=self.over_limit_only_var,
+            command=self.refresh_listbox
+        )
+        view_menu.add_command(label="바이트 제한 검사...", command=self.audit_byte_limit)
+        menu_bar.add_cascade(label="보기", menu=view_menu)
         self.diff_window.config(menu=menu_bar)
 
         self.frame_left.grid_rowconfigure(0, weight=1)
@@ -74,12 +168,12 @@ class TextDiffer:
         self.diff_window.grid_columnconfigure(0, weight=1)
         self.diff_window.grid_columnconfigure(1, weight=3)
 
-    def calculate_text_length(self, content):
-        return len(content.encode('utf-8'))
+    def show_byte_count(self, label, count):
+        """바이트 수를 표시하고, 바이트 제한을 넘으면 빨간색으로 표시합니다."""
+        label.config(text=f"글자 바이트 수: {count} / {self.byte_limit}", fg="red" if count > self.byte_limit else "black")
 
-    def update_label_count(self, text_widget, label):
-        content = text_widget.get("1.0", "end-1c")
-        label.config(text=f"글자 바이트 수: {self.calculate_text_length(content)}")
+    def is_over_limit(self, idx):
+        return self.after_bytes is not None and self.after_bytes[idx] > self.byte_limit
 
     def copy_to_clipboard(self, button, text_widget):
         content = text_widget.get("1.0", "end-1c")
@@ -93,64 +187,145 @@ class TextDiffer:
         self.copy_to_clipboard(button, text_widget)
 
         try:
-            if self.df is not None:
+            if self.df is not None and self.writer is not None:
                 message = text_widget.get("1.0", "end-1c")
                 selected_index = self.listbox.curselection()
                 if selected_index:
-                    idx = selected_index[0]
+                    idx = self.row_order[selected_index[0]]
                     self.df.at[idx, COLUMN_AFTER] = message
-                    self.df.to_excel(self.file_path, index=False)
+                    # 파일 전체를 다시 쓰지 않고, 바뀐 셀만 모아 두었다가 백그라운드에서 저장합니다.
+                    self.writer.stage(idx, {COLUMN_AFTER: message})
+                    was_over_limit = self.is_over_limit(idx)
+                    self.after_bytes[idx] = self.byte_counter2.count
+                    if self.is_over_limit(idx) != was_over_limit:
+                        self.refresh_listbox()
+                    if self.precomputer is not None:
+                        self.precomputer.update(idx, str(self.df.at[idx, COLUMN_BEFORE]), message)
         except Exception as e:
             self.show_error(str(e))
 
-    def update_edittext_logic(self):
-        highlight_diff(self.text_box1, self.text_box2)
-        self.update_label_count(self.text_box1, self.label_count1)
-        self.update_label_count(self.text_box2, self.label_count2)
+    def schedule_update(self):
+        """입력이 잠시 멈춘 뒤에 한 번만 비교하도록 갱신을 미룹니다."""
+        if self.update_after_id is not None:
+            self.diff_window.after_cancel(self.update_after_id)
+        self.update_after_id = self.diff_window.after(DIFF_DEBOUNCE_MS, self.update_edittext_logic)
+
+    def on_granularity_change(self):
+        """비교 단위가 바뀌면 현재 행을 다시 비교하고, 전체 행의 미리 계산도 새 단위로 다시 시작합니다."""
+        self.update_edittext_logic()
+        if self.df is not None:
+            self.start_precompute()
+
+    def update_edittext_logic(self, full=False, opcodes=None):
+        """
+        두 텍스트를 비교해 하이라이트를 갱신합니다. (바이트 수는 ByteCounter가 입력할 때마다 갱신)
+
+        같은 비교 단위로 이미 비교한 텍스트를 편집한 경우에는 바뀐 부분 근처만 다시 비교합니다.
+        """
+        if self.update_after_id is not None:
+            self.diff_window.after_cancel(self.update_after_id)
+            self.update_after_id = None
+
+        content1 = self.text_box1.get("1.0", "end-1c")
+        content2 = self.text_box2.get("1.0", "end-1c")
+        granularity = self.granularity_var.get()
+        state = self.diff_state
+
+        if full or state is None or state[2] != granularity:
+            opcodes = highlight_diff(self.text_box1, self.text_box2, granularity, self.diff_engine, opcodes)
+        else:
+            old1, old2, _, old_opcodes = state
+            if content1 == old1 and content2 == old2:
+                return
+            opcodes = rehighlight_diff(
+                self.text_box1, self.text_box2, (old1, old2, old_opcodes), granularity, self.diff_engine
+            )
+
+        self.diff_state = (content1, content2, granularity, opcodes)
 
     def open_file(self):
-        try:
-            if not self.file_path:
-                self.file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
+        """파일을 백그라운드 스레드에서 읽고, 끝날 때까지 진행 표시줄을 보여 줍니다."""
+        if not self.file_path:
+            self.file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
+        if not self.file_path or self.load_after_id is not None:
+            self.parent.focus_force()
+            return
+        # 다시 불러오기 전에 아직 저장하지 않은 수정 내용을 파일에 반영합니다.
+        if not self.close_writer():
+            return
+
+        self.diff_window.title("텍스트 비교 - 파일을 불러오는 중")
+        self.load_progress.pack(side=tk.BOTTOM, fill=tk.X)
+        self.load_progress.start(10)
+        threading.Thread(target=self.load_in_thread, args=(self.file_path,), daemon=True).start()
+        self.load_after_id = self.diff_window.after(LOAD_POLL_MS, self.poll_load)
 
-            self.df = load_excel_file(self.file_path)
-            self.listbox.delete(0, "end")
+    def load_in_thread(self, file_path):
+        """파일을 읽고 목록 이름과 색상을 계산해 load_queue에 넣습니다. (백그라운드 스레드)"""
+        try:
+            df = load_excel_file(file_path)
 
-            if COLUMN_NAME not in self.df.columns or COLUMN_BEFORE not in self.df.columns or COLUMN_AFTER not in self.df.columns:
+            if COLUMN_NAME not in df.columns or COLUMN_BEFORE not in df.columns or COLUMN_AFTER not in df.columns:
                 raise ValueError(f"'{COLUMN_NAME}', '{COLUMN_BEFORE}', '{COLUMN_AFTER}' 열이 누락되었습니다.")
 
-            plag_class_and_number = COLUMN_CLASS in self.df.columns and COLUMN_NUMBER in self.df.columns
-            plag_status = COLUMN_STATUS in self.df.columns
-
-            for index, row in self.df.iterrows():
-                if plag_class_and_number:
-                    formatted_item = f"{row[COLUMN_CLASS]}반 {row[COLUMN_NUMBER]}번 {row[COLUMN_NAME]}"
-                else:
-                    formatted_item = row[COLUMN_NAME]
-                self.listbox.insert("end", formatted_item)
-
-                if plag_status:
-                    if row[COLUMN_STATUS] == PLAG_STATUS_SUCCESS:
-                        self.listbox.itemconfig(index, {'bg': 'green', 'fg': 'white'})
-                    elif row[COLUMN_STATUS] == PLAG_STATUS_FAIL:
-                        self.listbox.itemconfig(index, {'bg': 'red', 'fg': 'white'})
-        except ValueError as e:
-            messagebox.showerror("오류", str(e))
+            # 행마다 반복하지 않고 열 단위 연산으로 한 번에 만듭니다.
+            if COLUMN_CLASS in df.columns and COLUMN_NUMBER in df.columns:
+                labels = df[COLUMN_CLASS] + "반 " + df[COLUMN_NUMBER] + "번 " + df[COLUMN_NAME]
+            else:
+                labels = df[COLUMN_NAME]
+
+            if COLUMN_STATUS in df.columns:
+                colors = df[COLUMN_STATUS].map(STATUS_COLORS).astype(object)
+                colors = colors.where(colors.notna(), None).tolist()
+            else:
+                colors = [None] * len(df)
+
+            # 바이트 제한 검사를 위해 모든 행의 바이트 수를 열 단위로 한 번에 계산합니다.
+            before_bytes, after_bytes = utf8_lengths(df[COLUMN_BEFORE]), utf8_lengths(df[COLUMN_AFTER])
+
+            self.load_queue.put((df, labels.tolist(), colors, before_bytes, after_bytes))
         except Exception as e:
-            messagebox.showerror("오류", str(e))
-        finally:
-            self.parent.focus_force()
+            self.load_queue.put(e)
+
+    def poll_load(self):
+        try:
+            result = self.load_queue.get_nowait()
+        except queue.Empty:
+            self.load_after_id = self.diff_window.after(LOAD_POLL_MS, self.poll_load)
+            return
+
+        self.load_after_id = None
+        self.load_progress.stop()
+        self.load_progress.pack_forget()
+        self.diff_window.title("텍스트 비교")
+
+        if isinstance(result, Exception):
+            messagebox.showerror("오류", str(result))
+        else:
+            self.df, self.row_labels, self.row_colors, self.before_bytes, self.after_bytes = result
+            self.writer = CellWriter(self.file_path, get_setting_or_default('DIFF_SAVE_SECONDS', DEFAULT_DIFF_SAVE_SECONDS))
+            if self.writer_after_id is None:
+                self.writer_after_id = self.diff_window.after(WRITER_POLL_MS, self.poll_writer)
+            self.row_order = []
+            self.listbox.set_items([])
+            self.start_precompute()
+            self.refresh_listbox()
+        self.parent.focus_force()
 
     def on_select(self, event):
         selected_index = self.listbox.curselection()
         if not selected_index or self.df is None:
             return
 
-        index = selected_index[0]
+        index = self.row_order[selected_index[0]]
         try:
             text1 = str(self.df.iloc[index][COLUMN_BEFORE])
             text2 = str(self.df.iloc[index][COLUMN_AFTER])
 
+            opcodes = None
+            if self.precomputer is not None and self.precomputer.granularity == self.granularity_var.get():
+                opcodes = self.precomputer.get(index, text1, text2)[2]
+
             self.text_box1.config(state="normal")
             self.text_box1.delete("1.0", tk.END)
             self.text_box1.insert(tk.END, text1)
@@ -159,10 +334,230 @@ class TextDiffer:
             self.text_box2.delete("1.0", tk.END)
             self.text_box2.insert(tk.END, text2)
 
-            self.update_edittext_logic()
+            self.update_edittext_logic(full=True, opcodes=opcodes)
         except Exception as e:
             messagebox.showerror("오류", str(e))
 
+    def start_precompute(self):
+        """모든 행의 비교 결과와 변경 통계를 백그라운드에서 계산하기 시작합니다."""
+        if self.precomputer is not None:
+            self.precomputer.stop()
+        texts = [
+            (str(before), str(after))
+            for before, after in zip(self.df[COLUMN_BEFORE], self.df[COLUMN_AFTER])
+        ]
+        self.precomputer = DiffPrecomputer(texts, self.granularity_var.get(), self.diff_engine)
+        self.precomputer.start()
+        if self.precompute_after_id is None:
+            self.precompute_after_id = self.diff_window.after(PRECOMPUTE_POLL_MS, self.poll_precompute)
+
+    def poll_precompute(self):
+        """계산 진행 상황을 창 제목에 표시하고, 끝나면 정렬과 필터를 새 통계로 다시 적용합니다."""
+        self.precompute_after_id = None
+        precomputer = self.precomputer
+        if precomputer.finished:
+            self.diff_window.title("텍스트 비교")
+            if self.sort_var.get() != SORT_ROW or self.changed_only_var.get():
+                self.refresh_listbox()
+            return
+
+        self.diff_window.title(f"텍스트 비교 - 변경 통계 계산 중 ({precomputer.completed}/{len(precomputer.texts)})")
+        self.precompute_after_id = self.diff_window.after(PRECOMPUTE_POLL_MS, self.poll_precompute)
+
+    def refresh_listbox(self):
+        """
+        선택한 정렬 방식과 필터에 따라 목록을 다시 채웁니다.
+        아직 통계가 계산되지 않은 행은 목록 끝에 두고, 계산이 끝나면 다시 정렬합니다.
+        """
+        if self.df is None:
+            return
+
+        selected_index = self.listbox.curselection()
+        selected_row = self.row_order[selected_index[0]] if selected_index else None
+
+        sort_order = self.sort_var.get()
+        metrics = {idx: self.precomputer.metrics(idx) for idx in range(len(self.row_labels))}
+
+        order = list(range(len(self.row_labels)))
+        if self.changed_only_var.get():
+            order = [idx for idx in order if metrics[idx] is None or metrics[idx][0] > 0]
+        if self.over_limit_only_var.get():
+            order = [idx for idx in order if self.after_bytes[idx] > self.byte_limit]
+        if sort_order != SORT_ROW:
+            key = 0 if sort_order == SORT_CHANGED_CHARS else 1
+            order.sort(key=lambda idx: (metrics[idx] is None, -metrics[idx][key] if metrics[idx] else 0))
+
+        self.row_order = order
+        if sort_order == SORT_ROW:
+            labels = [self.row_labels[idx] for idx in order]
+        else:
+            labels = [
+                self.row_labels[idx] if metrics[idx] is None
+                else f"{self.row_labels[idx]} ({metrics[idx][0]}자, {metrics[idx][1]:.0%})"
+                for idx in order
+            ]
+        # 수정후 텍스트가 바이트 제한을 넘는 행은 목록에 표시합니다.
+        labels = [
+            f"{label} [{self.after_bytes[idx]}B 초과]" if self.after_bytes[idx] > self.byte_limit else label
+            for label, idx in zip(labels, order)
+        ]
+        self.listbox.set_items(labels, [self.row_colors[idx] for idx in order])
+
+        if selected_row in order:
+            self.listbox.select(order.index(selected_row))
+
+    def audit_byte_limit(self):
+        """바이트 제한을 입력받아 수정전/수정후 열에서 제한을 넘는 행 수를 보여 줍니다."""
+        limit = simpledialog.askinteger(
+            "바이트 제한 검사", "바이트 제한을 입력하세요.",
+            initialvalue=self.byte_limit, minvalue=1, parent=self.diff_window
+        )
+        if limit is None:
+            return
+
+        self.byte_limit = limit
+        self.show_byte_count(self.label_count1, self.byte_counter1.count)
+        self.show_byte_count(self.label_count2, self.byte_counter2.count)
+        if self.df is None:
+            return
+
+        self.refresh_listbox()
+        before_over, after_over = audit_byte_limit(self.before_bytes, self.after_bytes, limit)
+        messagebox.showinfo(
+            "바이트 제한 검사",
+            f"{limit}바이트를 넘는 행\n{COLUMN_BEFORE}: {before_over}행\n{COLUMN_AFTER}: {after_over}행"
+        )
+
+    def export_metrics(self):
+        """변경 글자 수와 변경 비율을 엑셀 파일의 새 열로 저장합니다."""
+        if self.df is None or self.precomputer is None:
+            return
+        if self.writer is None:
+            # 다른 파일을 불러오는 중에는 저장할 CellWriter가 없습니다.
+            messagebox.showinfo("알림", "파일을 불러오는 중입니다. 잠시 후 다시 시도해 주세요.")
+            return
+        if not self.precomputer.finished:
+            messagebox.showinfo("알림", "변경 통계를 계산하는 중입니다. 잠시 후 다시 시도해 주세요.")
+            return
+
+        try:
+            for idx in range(len(self.df)):
+                changed, ratio = self.precomputer.metrics(idx)
+                self.writer.stage(idx, {COLUMN_CHANGED_CHARS: changed, COLUMN_EDIT_RATIO: round(ratio, 4)})
+                self.df.at[idx, COLUMN_CHANGED_CHARS] = str(changed)
+                self.df.at[idx, COLUMN_EDIT_RATIO] = str(round(ratio, 4))
+            # 모아 둔 수정후 셀과 함께 한 번에 저장합니다.
+            error = self.writer.flush()
+            if error is not None:
+                raise error
+            messagebox.showinfo("알림", f"'{COLUMN_CHANGED_CHARS}', '{COLUMN_EDIT_RATIO}' 열을 저장했습니다.")
+        except Exception as e:
+            self.show_error(str(e))
+
+    def export_report(self):
+        """모든 행의 비교 결과를 HTML 또는 엑셀 보고서로 저장합니다. 보고서는 작업 프로세스에서 만듭니다."""
+        if self.df is None or self.report_after_id is not None:
+            return
+        if self.writer is None:
+            messagebox.showinfo("알림", "파일을 불러오는 중입니다. 잠시 후 다시 시도해 주세요.")
+            return
+        # 보고서는 파일에서 읽으므로, 모아 둔 수정 내용을 먼저 저장합니다.
+        error = self.writer.flush()
+        if error is not None:
+            self.show_error(f"수정 내용을 저장하지 못해 보고서를 만들 수 없습니다.\n{error}")
+            return
+
+        report_path = filedialog.asksaveasfilename(
+            parent=self.diff_window,
+            initialfile=os.path.basename(report_path_for(self.file_path, REPORT_HTML)),
+            defaultextension=".html",
+            filetypes=[("HTML", "*.html"), ("Excel files", "*.xlsx")]
+        )
+        if not report_path:
+            return
+        report_format = REPORT_XLSX if report_path.lower().endswith(".xlsx") else REPORT_HTML
+
+        self.report_progress = (0, len(self.df))
+        threading.Thread(target=self.report_in_thread, args=(report_format, report_path), daemon=True).start()
+        self.report_after_id = self.diff_window.after(REPORT_POLL_MS, self.poll_report)
+
+    def report_in_thread(self, report_format, report_path):
+        """보고서를 만들고 결과(경로 또는 예외)를 report_queue에 넣습니다. (백그라운드 스레드)"""
+        def on_progress(rows, total):
+            self.report_progress = (rows, total)
+
+        try:
+            self.report_queue.put(export_diff_report(self.file_path, report_format, report_path, on_progress=on_progress))
+        except Exception as e:
+            self.report_queue.put(e)
+
+    def poll_report(self):
+        try:
+            result = self.report_queue.get_nowait()
+        except queue.Empty:
+            rows, total = self.report_progress
+            self.diff_window.title(f"텍스트 비교 - 비교 보고서 작성 중 ({rows}/{total})")
+            self.report_after_id = self.diff_window.after(REPORT_POLL_MS, self.poll_report)
+            return
+
+        self.report_after_id = None
+        self.diff_window.title("텍스트 비교")
+        if isinstance(result, Exception):
+            self.show_error(f"비교 보고서를 만들지 못했습니다.\n{result}")
+        else:
+            messagebox.showinfo("알림", f"비교 보고서를 저장했습니다.\n{result}")
+
+    def poll_writer(self):
+        """백그라운드 저장이 실패하면 한 번 알립니다. 저장하지 못한 내용은 CellWriter가 계속 다시 시도합니다."""
+        self.writer_after_id = None
+        if self.writer is None:
+            return
+
+        error = self.writer.error
+        if error is None:
+            self.writer_error_shown = False
+        elif not self.writer_error_shown:
+            self.writer_error_shown = True
+            self.show_error(f"수정 내용을 저장하지 못했습니다. 잠시 후 다시 시도합니다.\n{error}")
+        self.writer_after_id = self.diff_window.after(WRITER_POLL_MS, self.poll_writer)
+
+    def close_writer(self):
+        """
+        남은 수정 내용을 저장하고 CellWriter를 닫습니다. 저장에 실패하면 다시 시도할지 묻고,
+        사용자가 저장하지 않고 진행하기를 고르지 않으면 False를 반환합니다.
+        """
+        if self.writer is None:
+            return True
+
+        while True:
+            count = self.writer.pending_count
+            error = self.writer.close()
+            if error is None:
+                break
+            if messagebox.askretrycancel("오류", f"수정 내용 {count}건을 저장하지 못했습니다.\n{error}\n\n"
+                                               "엑셀 파일이 열려 있다면 닫은 뒤 다시 시도해 주세요."):
+                continue
+            if not messagebox.askyesno("확인", "저장하지 않은 수정 내용을 버릴까요?"):
+                return False
+            self.writer.stop()
+            break
+
+        self.writer = None
+        return True
+
+    def close_window(self):
+        """창을 닫을 때 남은 수정 내용을 저장하고 백그라운드 계산과 예약된 작업을 멈춥니다."""
+        if not self.close_writer():
+            return
+        if self.precomputer is not None:
+            self.precomputer.stop()
+        for after_id in (self.update_after_id, self.precompute_after_id, self.load_after_id, self.writer_after_id,
+                         self.report_after_id):
+            if after_id is not None:
+                self.diff_window.after_cancel(after_id)
+        self.diff_window.destroy()
+        TextDiffer.open_windows.remove(self)
+
     def create_text_frame(self, parent, label_text, copy_command, button_text):
         frame = tk.Frame(parent)
 
@@ -0,0 +1,76 @@
+import threading
+
+from .diff_engine import compute_opcodes, edit_metrics
+
+
+class DiffPrecomputer:
+    """
+    열린 파일의 모든 행에 대해 비교 결과(opcode)와 변경 통계를 백그라운드 스레드에서 미리 계산합니다.
+
+    결과는 {행 번호: (수정전, 수정후, opcode 목록, 변경 글자 수, 변경 비율)} 형태로 보관하며,
+    행을 선택하면 저장된 결과를 바로 사용합니다. 텍스트가 바뀐 행은 다시 계산합니다.
+    """
+
+    def __init__(self, texts, granularity, engine):
+        """
+        :param texts: 행 순서대로 나열한 (수정전, 수정후) 목록
+        """
+        self.texts = texts
+        self.granularity = granularity
+        self.engine = engine
+        self.results = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    @property
+    def completed(self):
+        return len(self.results)
+
+    @property
+    def finished(self):
+        return len(self.results) >= len(self.texts)
+
+    def _run(self):
+        for idx, (text1, text2) in enumerate(self.texts):
+            if self._stop_event.is_set():
+                return
+            with self._lock:
+                if idx in self.results:
+                    continue
+            self._store(idx, text1, text2)
+
+    def _store(self, idx, text1, text2):
+        opcodes = compute_opcodes(text1, text2, self.granularity, self.engine)
+        result = (text1, text2, opcodes) + edit_metrics(text1, text2, opcodes)
+        with self._lock:
+            # 계산하는 동안 update()로 행의 텍스트가 바뀌었으면, 이전 텍스트의 결과로 새 결과를 덮어쓰지 않습니다.
+            if self.texts[idx] == (text1, text2):
+                self.results[idx] = result
+        return result
+
+    def get(self, idx, text1, text2):
+        """행의 계산 결과를 반환합니다. 아직 계산되지 않았거나 텍스트가 바뀌었으면 지금 계산합니다."""
+        with self._lock:
+            result = self.results.get(idx)
+        if result is not None and result[0] == text1 and result[1] == text2:
+            return result
+        return self._store(idx, text1, text2)
+
+    def update(self, idx, text1, text2):
+        """편집해 저장한 행의 결과를 새 텍스트로 다시 계산합니다."""
+        with self._lock:
+            self.texts[idx] = (text1, text2)
+        return self._store(idx, text1, text2)
+
+    def metrics(self, idx):
+        """(변경 글자 수, 변경 비율)을 반환하고, 아직 계산되지 않았으면 None을 반환합니다."""
+        with self._lock:
+            result = self.results.get(idx)
+        return None if result is None else result[3:]
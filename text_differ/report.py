@@ -0,0 +1,242 @@
+import html
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
+
+from configs.config import *
+from configs.excel_handler import ExcelChunkReader
+from .comparator import load_diff_settings
+from .diff_engine import changed_ranges, compute_opcodes, edit_metrics
+
+REPORT_HTML = "html"
+REPORT_XLSX = "xlsx"
+REPORT_FORMATS = (REPORT_HTML, REPORT_XLSX)
+REPORT_SUFFIX = "_비교"  # 보고서 파일 이름: <엑셀 파일 이름>_비교.html
+
+REPORT_COLUMNS = (COLUMN_CLASS, COLUMN_NUMBER, COLUMN_NAME, COLUMN_STATUS)
+DELETE_COLOR = "C00000"  # 수정전에서 지워진 부분 (빨간 취소선)
+INSERT_COLOR = "00804A"  # 수정후에 들어간 부분 (초록 밑줄)
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: "맑은 고딕", sans-serif; font-size: 14px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 6px; vertical-align: top; }}
+th {{ background: #f0f0f0; position: sticky; top: 0; }}
+td.text {{ white-space: pre-wrap; width: 35%; }}
+del {{ color: #{delete}; background: #fde2e2; }}
+ins {{ color: #{insert}; background: #dff5e3; text-decoration: underline; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<table>
+<tr><th>행</th>{header}</tr>
+"""
+HTML_TAIL = "</table>\n<p>{summary}</p>\n</body>\n</html>\n"
+
+
+def load_report_workers():
+    """configs.txt의 REPORT_WORKER_PROCESSES 값을 읽습니다. 0이면 CPU 수만큼 사용합니다."""
+    workers = get_setting_or_default('REPORT_WORKER_PROCESSES', DEFAULT_REPORT_WORKER_PROCESSES)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def report_path_for(file_path, report_format):
+    """엑셀 파일 옆에 만들 보고서 파일 경로를 반환합니다."""
+    return f"{os.path.splitext(file_path)[0]}{REPORT_SUFFIX}.{report_format}"
+
+
+def diff_rows(texts, granularity, engine):
+    """
+    (수정전, 수정후) 목록을 비교해 행마다 (수정전 변경 구간, 수정후 변경 구간, 변경 글자 수, 변경 비율)을 반환합니다.
+    작업 프로세스에서 실행하므로, 텍스트는 돌려보내지 않고 구간만 돌려보냅니다.
+    """
+    results = []
+    for text1, text2 in texts:
+        opcodes = compute_opcodes(text1, text2, granularity, engine)
+        results.append(changed_ranges(opcodes) + edit_metrics(text1, text2, opcodes))
+    return results
+
+
+def split_segments(text, ranges):
+    """텍스트를 변경 구간 기준으로 나눠 (조각, 변경 여부) 목록을 반환합니다."""
+    segments = []
+    position = 0
+    for start, end in ranges:
+        if start > position:
+            segments.append((text[position:start], False))
+        segments.append((text[start:end], True))
+        position = end
+    if position < len(text):
+        segments.append((text[position:], False))
+    return segments
+
+
+class HtmlReportWriter:
+    """비교 결과를 한 행씩 HTML 표로 기록합니다."""
+
+    def __init__(self, path, title, columns):
+        self.columns = columns
+        self._file = open(path, "w", encoding="utf-8", newline="\n")
+        header = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+        header += f"<th>{COLUMN_BEFORE}</th><th>{COLUMN_AFTER}</th><th>{COLUMN_CHANGED_CHARS}</th><th>{COLUMN_EDIT_RATIO}</th>"
+        self._file.write(HTML_HEAD.format(title=html.escape(title), header=header,
+                                          delete=DELETE_COLOR, insert=INSERT_COLOR))
+
+    def write_row(self, idx, values, text1, text2, diff):
+        ranges1, ranges2, changed, ratio = diff
+        cells = "".join(f"<td>{html.escape(value)}</td>" for value in values)
+        self._file.write(
+            f"<tr><td>{idx + 2}</td>{cells}"
+            f"<td class=\"text\">{self._mark(text1, ranges1, 'del')}</td>"
+            f"<td class=\"text\">{self._mark(text2, ranges2, 'ins')}</td>"
+            f"<td>{changed}</td><td>{ratio:.1%}</td></tr>\n"
+        )
+
+    @staticmethod
+    def _mark(text, ranges, tag):
+        return "".join(
+            f"<{tag}>{html.escape(piece)}</{tag}>" if changed else html.escape(piece)
+            for piece, changed in split_segments(text, ranges)
+        )
+
+    def close(self, summary):
+        self._file.write(HTML_TAIL.format(summary=html.escape(summary)))
+        self._file.close()
+
+    def discard(self):
+        self._file.close()
+        os.remove(self._file.name)
+
+
+class XlsxReportWriter:
+    """
+    비교 결과를 openpyxl의 쓰기 전용 모드로 한 행씩 기록합니다.
+    바뀐 부분은 셀 안의 서식 있는 텍스트로 표시하므로, 엑셀에서 수정전은 빨간 취소선, 수정후는 초록 밑줄로 보입니다.
+    """
+
+    def __init__(self, path, title, columns):
+        self.path = path
+        self.columns = columns
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(title=title[:31])
+        self._delete_font = InlineFont(color=DELETE_COLOR, strike=True)
+        self._insert_font = InlineFont(color=INSERT_COLOR, u="single", b=True)
+        self._wrap = Alignment(wrap_text=True, vertical="top")
+        self._header_font = Font(bold=True)
+
+        self._sheet.column_dimensions["A"].width = 6
+        for column in (len(columns) + 2, len(columns) + 3):
+            self._sheet.column_dimensions[get_column_letter(column)].width = 60
+        self._sheet.freeze_panes = "A2"
+        header = ("행",) + tuple(columns) + (COLUMN_BEFORE, COLUMN_AFTER, COLUMN_CHANGED_CHARS, COLUMN_EDIT_RATIO)
+        self._sheet.append([self._cell(value, font=self._header_font) for value in header])
+
+    def _cell(self, value, font=None, alignment=None):
+        cell = WriteOnlyCell(self._sheet, value=value)
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def write_row(self, idx, values, text1, text2, diff):
+        ranges1, ranges2, changed, ratio = diff
+        ratio_cell = self._cell(round(ratio, 4))
+        ratio_cell.number_format = "0.0%"
+        self._sheet.append(
+            [idx + 2] + list(values)
+            + [self._cell(self._rich(text1, ranges1, self._delete_font), alignment=self._wrap),
+               self._cell(self._rich(text2, ranges2, self._insert_font), alignment=self._wrap),
+               changed, ratio_cell]
+        )
+
+    @staticmethod
+    def _rich(text, ranges, font):
+        if not ranges:
+            return text
+        return CellRichText([
+            TextBlock(font, piece) if changed else piece for piece, changed in split_segments(text, ranges)
+        ])
+
+    def close(self, summary):
+        self._workbook.save(self.path)
+
+    def discard(self):
+        # 쓰기 전용 통합 문서는 저장하기 전까지 파일을 만들지 않습니다.
+        pass
+
+
+REPORT_WRITERS = {
+    REPORT_HTML: HtmlReportWriter,
+    REPORT_XLSX: XlsxReportWriter,
+}
+
+
+def export_diff_report(file_path, report_format=REPORT_HTML, output_path=None, workers=None, on_progress=None):
+    """
+    엑셀 파일의 모든 행을 비교해 바뀐 부분을 표시한 보고서를 만들고, 보고서 경로를 반환합니다.
+
+    행은 ExcelChunkReader로 묶음씩 읽어 작업 프로세스에 나눠 비교하고, 끝난 묶음부터 행 순서대로
+    보고서에 바로 기록합니다. 작업 프로세스에 맡긴 묶음 수를 프로세스 수의 두 배로 제한하므로,
+    행이 많아도 메모리 사용량은 거의 늘지 않습니다.
+
+    :param on_progress: (처리한 행 수, 추정 전체 행 수) 를 받는 콜백
+    """
+    if report_format not in REPORT_WRITERS:
+        raise ValueError(f"지원하지 않는 보고서 형식입니다: {report_format}")
+    output_path = output_path or report_path_for(file_path, report_format)
+    granularity, engine = load_diff_settings()
+    workers = workers or load_report_workers()
+
+    reader = ExcelChunkReader(file_path)
+    if COLUMN_BEFORE not in reader.columns or COLUMN_AFTER not in reader.columns:
+        reader.close()
+        raise ValueError(f"'{COLUMN_BEFORE}', '{COLUMN_AFTER}' 열이 누락되었습니다.")
+
+    columns = [column for column in REPORT_COLUMNS if column in reader.columns]
+    writer = REPORT_WRITERS[report_format](output_path, os.path.splitext(os.path.basename(file_path))[0], columns)
+    rows = changed_rows = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+
+            def write_next():
+                nonlocal rows, changed_rows
+                chunk, future = pending.popleft()
+                texts = zip(chunk[COLUMN_BEFORE], chunk[COLUMN_AFTER])
+                values = chunk[columns].itertuples(index=False, name=None)
+                for idx, (text1, text2), row_values, diff in zip(chunk.index, texts, values, future.result()):
+                    writer.write_row(idx, row_values, text1, text2, diff)
+                    changed_rows += diff[2] > 0
+                rows += len(chunk)
+                if on_progress is not None:
+                    on_progress(rows, max(rows, reader.estimated_rows))
+
+            for chunk in reader:
+                texts = list(zip(chunk[COLUMN_BEFORE], chunk[COLUMN_AFTER]))
+                pending.append((chunk, executor.submit(diff_rows, texts, granularity, engine)))
+                if len(pending) >= workers * 2:
+                    write_next()
+            while pending:
+                write_next()
+    except BaseException:
+        # 중간에 실패하면 일부만 기록된 보고서를 남기지 않습니다.
+        reader.close()
+        writer.discard()
+        raise
+
+    writer.close(f"전체 {rows}행 중 {changed_rows}행이 바뀌었습니다.")
+    return output_path
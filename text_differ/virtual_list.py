@@ -0,0 +1,144 @@
+import tkinter as tk
+from tkinter import font as tkfont
+
+
+class VirtualListbox(tk.Frame):
+    """
+    화면에 보이는 줄만 실제 Listbox 항목으로 만드는 목록.
+
+    전체 항목은 labels(와 colors) 목록으로만 들고 있고, 스크롤할 때마다 보이는 구간만
+    Listbox에 다시 채우므로 행이 수만 개여도 채우는 시간과 메모리가 화면 크기에만 비례합니다.
+    선택 위치(curselection)는 Listbox 안의 위치가 아니라 전체 목록에서의 위치입니다.
+    """
+
+    def __init__(self, parent, command=None, **listbox_options):
+        """
+        :param command: 사용자가 항목을 선택했을 때 호출할 함수 (이벤트를 인자로 받음)
+        :param listbox_options: 내부 tk.Listbox에 전달할 옵션 (font, width 등)
+        """
+        super().__init__(parent)
+        self.command = command
+        self.labels = []
+        self.colors = None
+        self.first = 0  # 화면 맨 위에 보이는 항목의 위치
+        self.selected = None
+
+        self.listbox = tk.Listbox(self, exportselection=False, activestyle="none", **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = tk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Tk Listbox의 한 줄 높이 = 글꼴 줄 간격 + 1 + 선택 테두리 두께 * 2
+        line_space = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace")
+        self.line_height = line_space + 1 + 2 * int(self.listbox.cget("selectborderwidth"))
+        self.rows = int(self.listbox.cget("height"))
+
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        self.listbox.bind("<Configure>", self._on_configure)
+        self.listbox.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.listbox.bind("<Up>", lambda e: self._move_selection(-1))
+        self.listbox.bind("<Down>", lambda e: self._move_selection(1))
+        self.listbox.bind("<Prior>", lambda e: self._move_selection(-self.rows))
+        self.listbox.bind("<Next>", lambda e: self._move_selection(self.rows))
+
+    def set_items(self, labels, colors=None):
+        """
+        전체 항목을 바꿉니다.
+
+        :param labels: 표시할 문자열 목록
+        :param colors: 항목별 itemconfig 옵션(dict) 목록, 색이 없는 항목은 None
+        """
+        self.labels = labels
+        self.colors = colors
+        self.selected = None
+        self.first = 0
+        self._render()
+
+    def curselection(self):
+        return () if self.selected is None else (self.selected,)
+
+    def select(self, position):
+        """position 위치의 항목을 선택하고 보이도록 스크롤합니다. (command는 호출하지 않음)"""
+        self.selected = position
+        self.see(position)
+
+    def see(self, position):
+        if position < self.first:
+            self.first = position
+        elif position >= self.first + self.rows:
+            self.first = position - self.rows + 1
+        self._clamp()
+        self._render()
+
+    def yview(self, *args):
+        """스크롤바에서 호출되는 함수. ("moveto", 비율) 또는 ("scroll", 개수, "units"/"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * len(self.labels))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.first += step * self.rows if args[2] == "pages" else step
+        self._clamp()
+        self._render()
+
+    def _scroll_by(self, units):
+        self.yview("scroll", units, "units")
+        return "break"
+
+    def _on_mouse_wheel(self, event):
+        # Windows는 한 칸에 120, macOS는 1 단위로 delta가 전달됩니다.
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _move_selection(self, step):
+        if not self.labels:
+            return "break"
+        position = 0 if self.selected is None else self.selected + step
+        self.select(max(0, min(len(self.labels) - 1, position)))
+        if self.command:
+            self.command(None)
+        return "break"
+
+    def _on_select(self, event):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        self.select(self.first + selection[0])
+        if self.command:
+            self.command(event)
+
+    def _on_configure(self, event):
+        rows = max(1, event.height // self.line_height)
+        if rows != self.rows:
+            self.rows = rows
+            self._clamp()
+            self._render()
+
+    def _clamp(self):
+        self.first = max(0, min(self.first, len(self.labels) - self.rows))
+
+    def _render(self):
+        """현재 스크롤 위치에서 보이는 항목만 Listbox에 채웁니다."""
+        self.listbox.delete(0, "end")
+        # 마지막 줄이 일부만 보일 수 있으므로 한 줄 더 채웁니다.
+        end = min(len(self.labels), self.first + self.rows + 1)
+        if end > self.first:
+            self.listbox.insert("end", *self.labels[self.first:end])
+
+        if self.colors is not None:
+            for position in range(self.first, end):
+                color = self.colors[position]
+                if color:
+                    self.listbox.itemconfig(position - self.first, color)
+
+        if self.selected is not None and self.first <= self.selected < end:
+            self.listbox.selection_set(self.selected - self.first)
+        self.listbox.yview_moveto(0)
+
+        total = len(self.labels)
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -0,0 +1,114 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from threading import Event
+
+from configs.config import *
+from configs.excel_handler import ExcelChunkReader
+from text_verifier.transport import RelayTransport
+from text_verifier.verifier_engine import VerifierEngine, create_endpoint_pool
+
+
+class MultiFileRunner:
+    """
+    여러 엑셀 파일을 공용 전송 계층의 이벤트 루프에서 동시에 검증합니다.
+
+    동시에 처리하는 파일 수는 MULTI_FILE_PARALLEL, 모든 파일을 합친 동시 요청 수는
+    MULTI_FILE_MAX_REQUESTS로 제한하며, 중계 서버 주소 목록과 주소별 속도 제한기도 모든 파일이 함께 사용합니다.
+    파일은 한 파일만 검증할 때처럼 ExcelChunkReader로 묶음씩 읽고, 엑셀 파일 저장은 작업 프로세스에서 실행해
+    파일끼리 GIL을 두고 다투지 않도록 합니다. 해시·인증 오류처럼 모든 파일에 해당하는 오류가 나면 모든 파일을 멈춥니다.
+    """
+
+    def __init__(self, file_paths, on_progress, on_error):
+        """
+        :param file_paths: 검증할 엑셀 파일 경로 목록
+        :param on_progress: (파일 번호, 메시지, 진행률) 을 받는 콜백
+        :param on_error: (파일 번호, 오류 메시지) 를 받는 콜백
+        """
+        self.file_paths = file_paths
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.stop_events = [Event() for _ in file_paths]
+        self.engines = [None] * len(file_paths)
+        self.fatal_error = None  # 모든 파일을 멈추게 한 오류 메시지
+
+        config = ConfigSingleton().config['DEFAULT']
+        self.parallel_files = max(1, config.getint('MULTI_FILE_PARALLEL', fallback=DEFAULT_MULTI_FILE_PARALLEL))
+        self.max_requests = max(1, config.getint('MULTI_FILE_MAX_REQUESTS', fallback=DEFAULT_MULTI_FILE_MAX_REQUESTS))
+        self.worker_processes = max(
+            1, config.getint('MULTI_FILE_WORKER_PROCESSES', fallback=DEFAULT_MULTI_FILE_WORKER_PROCESSES)
+        )
+        self.transport = RelayTransport.shared()
+
+    def run(self):
+        """모든 파일의 검증이 끝날 때까지 기다립니다. (작업 쓰레드에서 호출)"""
+        self.transport.run(self._run_all())
+
+    def stop(self):
+        for stop_event in self.stop_events:
+            stop_event.set()
+
+    def _stop_after_fatal(self, message):
+        """한 파일에서 다른 파일도 계속할 수 없는 오류가 나면, 아직 시작하지 않은 파일까지 모두 멈춥니다."""
+        if self.fatal_error is None:
+            self.fatal_error = message
+        self.stop()
+
+    def count_status(self, index):
+        """파일의 (성공 행 수, 실패 행 수, 전체 행 수), 시작하지 못한 파일은 None."""
+        engine = self.engines[index]
+        return None if engine is None else engine.count_status()
+
+    async def _run_all(self):
+        file_slots = asyncio.Semaphore(self.parallel_files)
+        request_semaphore = asyncio.Semaphore(self.max_requests)
+        endpoint_pool = create_endpoint_pool()
+        executor = ProcessPoolExecutor(max_workers=self.worker_processes)
+        try:
+            await asyncio.gather(*(
+                self._verify_file(index, file_slots, request_semaphore, endpoint_pool, executor)
+                for index in range(len(self.file_paths))
+            ))
+        finally:
+            # 모든 작업이 끝난 뒤이므로 기다리지 않고 종료해 이벤트 루프를 막지 않습니다.
+            executor.shutdown(wait=False)
+
+    async def _verify_file(self, index, file_slots, request_semaphore, endpoint_pool, executor):
+        async with file_slots:
+            if self.stop_events[index].is_set():
+                if self.fatal_error is not None:
+                    self.on_progress(index, f"작업이 중단되었습니다: {self.fatal_error}", 0)
+                else:
+                    self.on_progress(index, "작업이 중단되었습니다.", 0)
+                return
+
+            file_path = self.file_paths[index]
+            self.on_progress(index, "파일을 읽는 중", 0)
+            try:
+                loop = asyncio.get_running_loop()
+                reader = await loop.run_in_executor(None, ExcelChunkReader, file_path)
+            except Exception as e:
+                self.on_error(index, f"엑셀 파일 읽기 오류: {e}")
+                return
+
+            if COLUMN_BEFORE not in reader.columns:
+                reader.close()
+                self.on_error(index, f"엑셀 파일에 {COLUMN_BEFORE} 열이 없습니다.")
+                return
+
+            engine = VerifierEngine(
+                file_path,
+                reader,
+                self.stop_events[index],
+                on_progress=lambda message, value: self.on_progress(index, message, value),
+                on_error=lambda message: self.on_error(index, message),
+                request_semaphore=request_semaphore,
+                endpoint_pool=endpoint_pool,
+                executor=executor,
+                on_fatal=self._stop_after_fatal
+            )
+            self.engines[index] = engine
+            await engine.process_text()
+
+            success, fail, total = engine.count_status()
+            if not self.stop_events[index].is_set():
+                self.on_progress(index, f"완료: 성공 {success} / 실패 {fail} / 전체 {total}", 100)
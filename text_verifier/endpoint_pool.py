@@ -0,0 +1,129 @@
+import random
+import re
+import time
+
+from text_verifier.retry_policy import RelayReplyError, is_retryable
+
+MAX_EJECT_SECONDS = 300  # 반복해서 제외될 때 늘어나는 제외 시간의 상한(초)
+
+
+def parse_api_urls(value):
+    """API_URL 값을 쉼표, 공백 또는 줄바꿈으로 나누어 중계 서버 주소 목록을 만듭니다. (중복 제외)"""
+    urls = []
+    for url in re.split(r"[\s,]+", value):
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+class RelayEndpoint:
+    """중계 서버 주소 하나의 응답 시간과 오류 상태."""
+
+    def __init__(self, url, rate_limiter):
+        self.url = url
+        self.rate_limiter = rate_limiter  # 배포마다 실행 할당량이 따로 있으므로 속도 제한도 주소별로 둡니다.
+        self.latency = None  # 응답 시간의 지수 이동 평균(초)
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.ejections = 0
+        self.eject_streak = 0  # 정상 응답 없이 연달아 제외된 횟수
+        self.ejected_until = 0.0
+
+    def is_available(self, now):
+        return now >= self.ejected_until
+
+    def snapshot(self):
+        return {
+            "url": self.url,
+            "latency": self.latency,
+            "requests": self.requests,
+            "errors": self.errors,
+            "ejections": self.ejections,
+            "rate": self.rate_limiter.rate if self.rate_limiter is not None else None,
+        }
+
+
+class EndpointPool:
+    """
+    여러 중계 서버 주소에 요청을 나누어 보냅니다.
+
+    주소마다 응답 시간의 지수 이동 평균과 연속 오류 수를 기록하고, 요청은 건강한 주소 중에서
+    (평균 응답 시간 × 진행 중인 요청 수)가 작을수록 높은 확률로 고릅니다. 과부하나 연결 오류가
+    eject_failures번 연속되면 그 주소를 eject_seconds초 동안 제외하며, 정상 응답 없이 다시 제외될 때마다
+    제외 시간을 두 배로 늘립니다. 모든 주소가 제외되면 가장 먼저 복귀할 주소를 사용합니다.
+    """
+
+    def __init__(self, urls, rate_limiter_factory, eject_failures, eject_seconds, latency_alpha):
+        """
+        :param urls: 중계 서버 주소 목록 (첫 번째 주소가 기본 주소)
+        :param rate_limiter_factory: 주소마다 속도 제한기를 만드는 함수 (None을 반환하면 제한 없음)
+        :param eject_failures: 주소를 제외하기 전까지 허용할 연속 오류 수
+        :param eject_seconds: 처음 제외할 때의 제외 시간(초)
+        :param latency_alpha: 응답 시간 평균에 새 값을 반영할 비율 (0~1)
+        """
+        if not urls:
+            raise ValueError("중계 서버 주소(API_URL)가 비어 있습니다.")
+        self.endpoints = [RelayEndpoint(url, rate_limiter_factory()) for url in urls]
+        self.eject_failures = max(1, eject_failures)
+        self.eject_seconds = eject_seconds
+        self.latency_alpha = latency_alpha
+
+    @property
+    def primary_url(self):
+        """캐시 키처럼 주소에 따라 달라지면 안 되는 값에 사용할 기본 주소."""
+        return self.endpoints[0].url
+
+    def choose(self):
+        """다음 요청을 보낼 주소를 고릅니다."""
+        now = time.monotonic()
+        available = [endpoint for endpoint in self.endpoints if endpoint.is_available(now)]
+        if not available:
+            return min(self.endpoints, key=lambda endpoint: endpoint.ejected_until)
+        if len(available) == 1:
+            return available[0]
+
+        # 아직 응답 시간을 모르는 주소는 가장 빠른 주소와 같다고 보고 한 번씩 시험해 봅니다.
+        known = [endpoint.latency for endpoint in available if endpoint.latency is not None]
+        fastest = min(known, default=1.0)
+        weights = [
+            1 / ((endpoint.latency if endpoint.latency is not None else fastest) * (endpoint.in_flight + 1))
+            for endpoint in available
+        ]
+        return random.choices(available, weights)[0]
+
+    def on_start(self, endpoint):
+        endpoint.in_flight += 1
+        endpoint.requests += 1
+
+    def on_success(self, endpoint, latency):
+        endpoint.in_flight -= 1
+        endpoint.consecutive_errors = 0
+        endpoint.eject_streak = 0
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency += self.latency_alpha * (latency - endpoint.latency)
+
+    def on_failure(self, endpoint, error):
+        """
+        요청 전체가 실패했을 때 호출합니다. 중계 서버가 정상적으로 전달한 실패 응답이나
+        재시도해도 소용없는 오류(예: 응답이 너무 큼)는 주소의 상태와 관계없으므로 연속 오류로 세지 않습니다.
+        """
+        endpoint.in_flight -= 1
+        endpoint.errors += 1
+        if isinstance(error, RelayReplyError) or not is_retryable(error):
+            return
+
+        endpoint.consecutive_errors += 1
+        if endpoint.consecutive_errors >= self.eject_failures:
+            endpoint.consecutive_errors = 0
+            endpoint.ejections += 1
+            endpoint.eject_streak += 1
+            duration = min(MAX_EJECT_SECONDS, self.eject_seconds * 2 ** (endpoint.eject_streak - 1))
+            endpoint.ejected_until = time.monotonic() + duration
+
+    def snapshot(self):
+        """주소별 요청 수, 오류 수, 평균 응답 시간을 반환합니다. (실행 측정 결과에 기록)"""
+        return [endpoint.snapshot() for endpoint in self.endpoints]
@@ -0,0 +1,130 @@
+import os
+from queue import Queue, Empty
+from threading import Thread
+from tkinter import Toplevel, Label, Button, StringVar, Frame, messagebox
+from tkinter.ttk import Progressbar, Treeview
+
+from text_verifier.batch_runner import MultiFileRunner
+
+# 기본 폰트 설정
+default_font = ("맑은 고딕", 25)
+table_font = ("맑은 고딕", 12)
+
+
+class BatchVerifier:
+    """여러 엑셀 파일을 한 번에 검증하고 파일별 진행 상황을 표로 보여 주는 창."""
+
+    def __init__(self, parent, file_paths):
+        self.parent = parent
+        self.file_paths = file_paths
+        self.update_queue = Queue()  # 작업 쓰레드의 진행 상황은 메인 쓰레드에서 표시
+        self.progress_values = [0.0] * len(file_paths)
+        self.running = False
+
+        try:
+            self.runner = MultiFileRunner(
+                file_paths,
+                on_progress=lambda index, message, value: self.update_queue.put(("progress", index, message, value)),
+                on_error=lambda index, message: self.update_queue.put(("error", index, message, None))
+            )
+        except FileNotFoundError:
+            messagebox.showerror("오류", "configs.txt 파일을 찾을 수 없어 종료합니다.")
+            return
+
+        self.create_window()
+
+    def create_window(self):
+        self.window = Toplevel(self.parent)
+        self.window.title(f"여러 파일 검증 ({len(self.file_paths)}개)")
+        self.window.geometry("900x600")
+        self.window.protocol("WM_DELETE_WINDOW", self.close_window)
+
+        frame = Frame(self.window)
+        frame.pack(expand=True, fill='both')
+
+        self.table = Treeview(frame, columns=("file", "progress", "status"), show="headings")
+        self.table.heading("file", text="파일")
+        self.table.heading("progress", text="진행률")
+        self.table.heading("status", text="상태")
+        self.table.column("file", width=250)
+        self.table.column("progress", width=80, anchor="center")
+        self.table.column("status", width=500)
+        for index, file_path in enumerate(self.file_paths):
+            self.table.insert("", "end", iid=str(index), values=(os.path.basename(file_path), "0%", "대기 중"))
+        self.table.pack(expand=True, fill='both', padx=10, pady=10)
+
+        self.status_var = StringVar(value=f"총 파일 개수: {len(self.file_paths)}")
+        Label(frame, textvariable=self.status_var, font=table_font).pack(fill='x')
+
+        self.progress = Progressbar(frame, orient="horizontal", length=400, mode="determinate")
+        self.progress.pack(pady=10, fill='x')
+
+        button_frame = Frame(frame)
+        button_frame.pack(fill='x')
+        self.start_button = Button(button_frame, text="작업 시작", font=default_font, command=self.start_task)
+        self.start_button.pack(side='left', fill='both', expand=True)
+        self.stop_button = Button(button_frame, text="중지", font=default_font, command=self.stop_task,
+                                  state='disabled')
+        self.stop_button.pack(side='left', fill='both', expand=True)
+        Button(button_frame, text="닫기", font=default_font, command=self.close_window).pack(
+            side='left', fill='both', expand=True
+        )
+
+        self.status_after_id = self.window.after(100, self.update_status)
+
+    def start_task(self):
+        self.start_button.config(state='disabled')
+        self.stop_button.config(state='normal')
+        self.running = True
+        Thread(target=self.run_in_thread, daemon=True).start()
+
+    def run_in_thread(self):
+        """새 쓰레드에서 모든 파일의 검증이 끝날 때까지 기다립니다."""
+        try:
+            self.runner.run()
+        finally:
+            self.update_queue.put(("done", None, None, None))
+
+    def stop_task(self):
+        self.stop_button.config(state='disabled')
+        self.runner.stop()
+
+    def update_status(self):
+        """큐에서 파일별 진행 상황을 꺼내 표와 전체 진행률을 갱신합니다."""
+        try:
+            while True:
+                kind, index, message, value = self.update_queue.get_nowait()
+                if kind == "done":
+                    self.finish()
+                    continue
+                row = str(index)
+                if kind == "error":
+                    self.table.set(row, "status", f"오류: {message}")
+                    continue
+                self.progress_values[index] = value
+                self.table.set(row, "progress", f"{value:.0f}%")
+                self.table.set(row, "status", message)
+        except Empty:
+            pass
+
+        self.progress["value"] = sum(self.progress_values) / max(1, len(self.progress_values))
+        self.status_after_id = self.window.after(100, self.update_status)
+
+    def finish(self):
+        """모든 파일의 작업이 끝나면 결과를 요약해 보여 줍니다."""
+        self.running = False
+        self.stop_button.config(state='disabled')
+
+        success = fail = 0
+        for index in range(len(self.file_paths)):
+            status = self.runner.count_status(index)
+            if status is not None:
+                success += status[0]
+                fail += status[1]
+        self.status_var.set(f"모든 파일의 작업이 끝났습니다. (성공 {success}행 / 실패 {fail}행)")
+
+    def close_window(self):
+        """창을 닫으면 진행 중인 작업을 멈춥니다. 처리된 결과는 각 파일에 저장됩니다."""
+        self.runner.stop()
+        self.window.after_cancel(self.status_after_id)
+        self.window.destroy()
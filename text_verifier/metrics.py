@@ -0,0 +1,143 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+
+# 행마다 기록하는 소요 시간(초)
+# queue_wait: 대기열에서 작업자를 기다린 시간, wait: 속도 제한과 재시도 전 대기 시간,
+# request: 중계 서버 응답을 기다린 시간, parse: 응답 JSON 해석 시간,
+# write_back: 결과를 저널과 저장 대기 목록에 넣는 데 걸린 시간, total: 대기열에 들어간 뒤 기록까지 걸린 전체 시간
+# 엑셀 파일 저장은 백그라운드에서 여러 행을 한 번에 저장하므로 행별 시간에 넣지 않고, 요약의 checkpoint_* 항목에 기록합니다.
+TIMING_FIELDS = ("queue_wait", "wait", "request", "parse", "write_back", "total")
+ROW_FIELDS = ("row", "source", "success", "attempts") + TIMING_FIELDS
+
+THROUGHPUT_WINDOW_SECONDS = 30  # 처리 속도를 계산할 최근 구간(초)
+
+
+def percentile(values, q):
+    """정렬한 값에서 q(0~100) 백분위 값을 반환합니다. 값이 없으면 0을 반환합니다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def describe(values):
+    """값 목록의 평균, 백분위(50/95/99), 최댓값을 dict로 반환합니다."""
+    return {
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values, default=0.0),
+    }
+
+
+def new_timing(queue_wait=0.0):
+    """요청 묶음 하나의 소요 시간을 모으는 dict를 만듭니다. 묶음 안의 행은 같은 값을 공유합니다."""
+    timing = {field: 0.0 for field in TIMING_FIELDS}
+    timing["queue_wait"] = queue_wait
+    timing["attempts"] = 0
+    return timing
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
+    if seconds >= 60:
+        return f"{seconds // 60}분 {seconds % 60}초"
+    return f"{seconds}초"
+
+
+class RunMetrics:
+    """
+    검증 실행 한 번의 행별 소요 시간과 처리량을 기록합니다.
+
+    처리 속도는 최근 THROUGHPUT_WINDOW_SECONDS초 동안 처리한 행 수로 계산하므로,
+    속도 제한기가 요청 속도를 바꾸면 남은 시간 예상도 함께 바뀝니다.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.started = time.monotonic()
+        self.rows = []
+        self.skipped_rows = 0
+        self.checkpoints = []  # (저장한 행 수, 소요 시간)
+        self._recent = deque()  # 최근에 처리를 마친 시각
+
+    def add_row(self, idx, source, success, timing, write_back, enqueued):
+        """
+        :param source: "request"(중계 서버 요청) 또는 "cache"(캐시 사용)
+        :param enqueued: 대기열에 들어간 시각 (time.perf_counter 기준)
+        """
+        now = time.perf_counter()
+        row = {"row": idx, "source": source, "success": success, "attempts": timing["attempts"]}
+        row.update({field: timing[field] for field in TIMING_FIELDS})
+        row["write_back"] = write_back
+        row["total"] = now - enqueued
+        self.rows.append(row)
+        self._recent.append(time.monotonic())
+
+    def add_checkpoint(self, rows, seconds):
+        self.checkpoints.append((rows, seconds))
+
+    def throughput(self):
+        """최근 구간의 초당 처리 행 수를 반환합니다."""
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > THROUGHPUT_WINDOW_SECONDS:
+            self._recent.popleft()
+        if not self._recent:
+            return 0.0
+        elapsed = max(now - max(self._recent[0], self.started), 1.0)
+        return len(self._recent) / elapsed
+
+    def eta(self, remaining):
+        """남은 행을 처리하는 데 걸릴 것으로 예상되는 시간(초), 예상할 수 없으면 None."""
+        rate = self.throughput()
+        return remaining / rate if rate > 0 else None
+
+    def summary(self, file_path, settings):
+        elapsed = time.monotonic() - self.started
+        summary = {
+            "file": os.path.abspath(file_path),
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "elapsed_seconds": elapsed,
+            "settings": settings,
+            "rows": len(self.rows),
+            "success": sum(1 for row in self.rows if row["success"]),
+            "fail": sum(1 for row in self.rows if not row["success"]),
+            "cache_hits": sum(1 for row in self.rows if row["source"] == "cache"),
+            "skipped_rows": self.skipped_rows,
+            "rows_per_sec": len(self.rows) / elapsed if elapsed else 0.0,
+            # 엑셀 파일 저장 (백그라운드에서 실행되어 행별 write_back에는 포함되지 않음)
+            "checkpoints": len(self.checkpoints),
+            "checkpoint_rows": sum(rows for rows, _ in self.checkpoints),
+            "checkpoint_seconds": sum(seconds for _, seconds in self.checkpoints),
+            "checkpoint_timings": describe([seconds for _, seconds in self.checkpoints]),
+            "timings": {},
+        }
+        requested = [row for row in self.rows if row["source"] == "request"]
+        for field in TIMING_FIELDS:
+            summary["timings"][field] = describe([row[field] for row in requested])
+        return summary
+
+    def save(self, directory, file_path, settings):
+        """
+        행별 기록(CSV)과 요약(JSON)을 directory에 저장하고 요약 파일 경로를 반환합니다.
+        파일 이름은 실행 시작 시각과 엑셀 파일 이름으로 만듭니다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        base = os.path.join(directory, f"{self.started_at:%Y%m%d-%H%M%S}_{stem}")
+
+        with open(f"{base}.csv", "w", encoding="utf-8-sig", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=ROW_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump(self.summary(file_path, settings), file, ensure_ascii=False, indent=2)
+        return f"{base}.json"
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import re
+import time
+
+import aiohttp
+
+# 프로그램 해시가 등록되지 않은 경우: 모든 행이 같은 이유로 실패하므로 작업을 멈춥니다.
+HASH_FAILURE_PREFIX = "해시 검증 실패"
+
+# 일괄 요청의 항목 수가 중계 서버의 BATCH_MAX_ITEMS를 넘은 경우 (doPost가 "서버 내부 오류: "를 붙여 반환)
+BATCH_TOO_LARGE_PREFIX = "일괄 요청은 최대"
+
+# 재시도해도 결과가 바뀌지 않는 중계 서버 응답
+NON_RETRYABLE_REPLY_PREFIXES = (
+    HASH_FAILURE_PREFIX, "content가 비어있습니다.", BATCH_TOO_LARGE_PREFIX, f"서버 내부 오류: {BATCH_TOO_LARGE_PREFIX}"
+)
+
+# 중계 서버가 전달한 OpenAI 응답 코드 중 속도를 줄여야 하는 경우 (예: "API 응답 오류 (코드 429)")
+THROTTLE_REPLY_PATTERN = re.compile(r"코드 (429|5\d\d)")
+
+
+class RelayHTTPError(Exception):
+    """중계 서버가 200이 아닌 HTTP 상태 코드를 반환한 경우."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RelayReplyError(Exception):
+    """중계 서버가 {"success": false} 응답을 반환한 경우."""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class ResponseTooLargeError(Exception):
+    """응답 본문이 HTTP_MAX_RESPONSE_BYTES보다 큰 경우. 재시도하지 않고 해당 행만 실패로 기록합니다."""
+
+
+def describe_error(error):
+    """행의 수정후 열에 기록할 오류 메시지를 만듭니다."""
+    if isinstance(error, asyncio.TimeoutError):
+        return "요청 시간이 초과되었습니다."
+    if isinstance(error, aiohttp.ClientError):
+        return f"클라이언트 오류: {str(error)}"
+    return f"오류: {str(error)}"
+
+
+def is_throttle(error):
+    """요청 속도를 줄여야 한다는 신호인지 확인합니다. (429, 5xx, 시간 초과 등)"""
+    if isinstance(error, RelayHTTPError):
+        return error.status == 429 or error.status >= 500
+    if isinstance(error, RelayReplyError):
+        return THROTTLE_REPLY_PATTERN.search(error.message) is not None
+    # Apps Script는 할당량을 넘으면 JSON 대신 HTML 오류 페이지를 반환합니다.
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ContentTypeError, aiohttp.ServerConnectionError))
+
+
+def is_retryable(error):
+    """같은 요청을 다시 보내면 성공할 수 있는 오류인지 확인합니다."""
+    if isinstance(error, RelayHTTPError):
+        return is_throttle(error)
+    if isinstance(error, RelayReplyError):
+        return not error.message.startswith(NON_RETRYABLE_REPLY_PREFIXES)
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError))
+
+
+def is_fatal(error):
+    """다른 행도 같은 이유로 실패할 오류라서 작업 전체를 멈춰야 하는지 확인합니다."""
+    if isinstance(error, RelayReplyError):
+        return error.message.startswith(HASH_FAILURE_PREFIX)
+    if isinstance(error, ResponseTooLargeError):
+        return False
+    return not is_retryable(error)
+
+
+class RetryPolicy:
+    """지터를 섞은 지수 백오프로 재시도 간격을 정합니다."""
+
+    def __init__(self, max_attempts, base_delay, max_delay):
+        """
+        :param max_attempts: 한 행에 대해 요청을 보낼 수 있는 최대 횟수 (첫 요청 포함)
+        :param base_delay: 첫 번째 재시도 전 최대 대기 시간(초)
+        :param max_delay: 재시도 전 대기 시간의 상한(초)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt, error=None):
+        """attempt번째 실패 후 기다릴 시간(초)을 반환합니다. 서버가 Retry-After를 주면 그 값을 따릅니다."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+
+        # 전체 지터: 0과 지수적으로 늘어나는 상한 사이에서 무작위로 고릅니다.
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD 방식으로 초당 요청 수를 조절하는 속도 제한기.
+
+    응답이 정상이면 속도를 조금씩 올리고(가산 증가), 429/5xx 같은 과부하 신호를 받으면
+    속도를 절반 수준으로 줄입니다(승산 감소). 동시에 도착한 여러 과부하 신호로 속도가
+    한꺼번에 떨어지지 않도록, 감소 후 잠시 동안은 추가 감소를 무시합니다.
+    """
+
+    def __init__(self, initial_rate, min_rate, max_rate, increase, decrease):
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._next_slot = 0.0
+        self._last_decrease = 0.0
+
+    async def acquire(self):
+        """다음 요청을 보낼 수 있을 때까지 기다립니다."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        now = time.monotonic()
+        if now - self._last_decrease < 1 / self.rate:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        # 이미 예약된 요청 간격도 새 속도에 맞춰 늦춥니다.
+        self._next_slot = max(self._next_slot, now + 1 / self.rate)
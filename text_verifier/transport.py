@@ -0,0 +1,145 @@
+import asyncio
+import atexit
+import concurrent.futures
+import json
+import threading
+import time
+
+import aiohttp
+
+from configs.config import *
+from text_verifier.retry_policy import RelayHTTPError, ResponseTooLargeError
+
+
+class RelayTransport:
+    """
+    중계 서버 요청에 사용하는 HTTP 전송 계층.
+
+    이벤트 루프를 실행하는 스레드 하나와 그 위의 aiohttp 세션 하나를 프로그램 전체에서 함께 사용합니다.
+    여러 검증 창과 여러 번의 실행이 같은 연결 풀을 쓰므로, script.google.com과의 TLS 연결을
+    매번 새로 맺지 않고 재사용합니다. 설정은 configs.txt의 HTTP_* 값을 읽습니다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, pool_size, keepalive, connect_timeout, read_timeout, total_timeout, dns_cache_ttl,
+                 max_response_bytes):
+        """
+        :param pool_size: 동시에 열어 둘 수 있는 최대 연결 수
+        :param keepalive: 사용하지 않는 연결을 유지할 시간(초)
+        :param connect_timeout: 연결을 맺을 때까지 기다릴 최대 시간(초)
+        :param read_timeout: 응답 데이터를 기다릴 최대 시간(초)
+        :param total_timeout: 요청 하나에 걸리는 전체 시간의 상한(초)
+        :param dns_cache_ttl: DNS 조회 결과를 재사용할 시간(초)
+        :param max_response_bytes: 허용할 응답 본문의 최대 크기(바이트)
+        """
+        self.pool_size = pool_size
+        self.keepalive = keepalive
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, sock_connect=connect_timeout, sock_read=read_timeout)
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_response_bytes = max_response_bytes
+
+        self._session = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="RelayTransport", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def shared(cls):
+        """configs.txt 설정으로 만든 공용 전송 계층을 반환합니다."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                config = ConfigSingleton().config['DEFAULT']
+                cls._instance = cls(
+                    max(1, config.getint('HTTP_POOL_SIZE', fallback=DEFAULT_HTTP_POOL_SIZE)),
+                    config.getfloat('HTTP_KEEPALIVE_SECONDS', fallback=DEFAULT_HTTP_KEEPALIVE_SECONDS),
+                    config.getfloat('HTTP_CONNECT_TIMEOUT', fallback=DEFAULT_HTTP_CONNECT_TIMEOUT),
+                    config.getfloat('HTTP_READ_TIMEOUT', fallback=DEFAULT_HTTP_READ_TIMEOUT),
+                    config.getfloat('HTTP_TOTAL_TIMEOUT', fallback=DEFAULT_HTTP_TOTAL_TIMEOUT),
+                    config.getint('HTTP_DNS_CACHE_TTL', fallback=DEFAULT_HTTP_DNS_CACHE_TTL),
+                    config.getint('HTTP_MAX_RESPONSE_BYTES', fallback=DEFAULT_HTTP_MAX_RESPONSE_BYTES)
+                )
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    def run(self, coro):
+        """
+        코루틴을 공용 이벤트 루프에서 실행하고 끝날 때까지 기다려 결과를 반환합니다. (다른 스레드에서 호출)
+        기다리는 동안에도 Ctrl+C 같은 신호를 처리할 수 있도록 짧은 간격으로 확인합니다.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        while not future.done():
+            concurrent.futures.wait([future], timeout=0.5)
+        return future.result()
+
+    def _get_session(self):
+        # 세션은 이벤트 루프 스레드 안에서만 만들고 사용합니다.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def post_json(self, url, data, timing=None):
+        """
+        JSON 요청을 보내고 JSON 응답을 반환합니다.
+
+        200이 아닌 응답은 RelayHTTPError, 너무 큰 응답은 ResponseTooLargeError,
+        JSON이 아닌 응답(할당량 초과 시의 HTML 페이지 등)은 aiohttp.ContentTypeError로 알립니다.
+        timing dict를 주면 응답을 기다린 시간과 JSON 해석 시간을 "request", "parse"에 더합니다.
+        """
+        start = time.perf_counter()
+        try:
+            body, charset = await self._post(url, data)
+        finally:
+            if timing is not None:
+                timing["request"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            return json.loads(body.decode(charset or "utf-8"))
+        finally:
+            if timing is not None:
+                timing["parse"] += time.perf_counter() - start
+
+    async def _post(self, url, data):
+        """요청을 보내고 (응답 본문, 문자 집합)을 반환합니다."""
+        async with self._get_session().post(url, json=data) as response:
+            if response.status != 200:
+                retry_after = response.headers.get("Retry-After")
+                raise RelayHTTPError(
+                    response.status, float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+
+            if "json" not in response.content_type:
+                raise aiohttp.ContentTypeError(
+                    response.request_info, response.history,
+                    message=f"JSON이 아닌 응답입니다. ({response.content_type})"
+                )
+            if response.content_length is not None and response.content_length > self.max_response_bytes:
+                raise ResponseTooLargeError(f"응답이 너무 큽니다. ({response.content_length} 바이트)")
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                body.extend(chunk)
+                if len(body) > self.max_response_bytes:
+                    raise ResponseTooLargeError(f"응답이 {self.max_response_bytes} 바이트를 넘습니다.")
+            return bytes(body), response.charset
+
+    def close(self):
+        """세션을 닫고 이벤트 루프 스레드를 멈춥니다."""
+        if self._loop.is_closed() or not self._loop.is_running():
+            return
+
+        async def close_session():
+            if self._session is not None:
+                await self._session.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_session(), self._loop).result(timeout=5)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,667 @@
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from configs.config import *
+from configs.excel_handler import save_excel_cells
+from configs.hash import sha_256_hash
+from configs.journal import ResultJournal, fingerprint
+from configs.response_cache import ResponseCache, make_cache_key, normalize_text
+from configs.sentence_splitter import split_sentences
+from text_verifier.endpoint_pool import EndpointPool, parse_api_urls
+from text_verifier.metrics import RunMetrics, format_duration, new_timing
+from text_verifier.retry_policy import (
+    AdaptiveRateLimiter, RelayReplyError, RetryPolicy,
+    describe_error, is_fatal, is_retryable, is_throttle
+)
+from text_verifier.transport import RelayTransport
+
+PROGRESS_INTERVAL_SECONDS = 0.2  # 진행 상황을 알리는 최소 간격(초)
+
+# 문장 앞뒤의 공백과 줄바꿈을 본문과 나눕니다. (교정 결과를 원래 공백 사이에 다시 넣기 위해)
+SENTENCE_PARTS = re.compile(r'(\s*)(.*?)(\s*)', re.S)
+
+
+def create_rate_limiter():
+    """configs.txt의 RATE_LIMIT_* 값으로 속도 제한기를 만듭니다. RATE_LIMIT_ENABLED=false면 None."""
+    config = ConfigSingleton().config['DEFAULT']
+    if not config.getboolean('RATE_LIMIT_ENABLED', fallback=True):
+        return None
+    return AdaptiveRateLimiter(
+        config.getfloat('RATE_LIMIT_INITIAL', fallback=DEFAULT_RATE_LIMIT_INITIAL),
+        config.getfloat('RATE_LIMIT_MIN', fallback=DEFAULT_RATE_LIMIT_MIN),
+        config.getfloat('RATE_LIMIT_MAX', fallback=DEFAULT_RATE_LIMIT_MAX),
+        config.getfloat('RATE_LIMIT_INCREASE', fallback=DEFAULT_RATE_LIMIT_INCREASE),
+        config.getfloat('RATE_LIMIT_DECREASE', fallback=DEFAULT_RATE_LIMIT_DECREASE)
+    )
+
+
+def create_endpoint_pool():
+    """
+    configs.txt의 API_URL에 적힌 중계 서버 주소로 주소 목록을 만듭니다.
+    API_URL에는 쉼표나 줄바꿈으로 구분해 여러 주소를 적을 수 있으며, 주소마다 속도 제한기를 따로 둡니다.
+    """
+    config = ConfigSingleton().config['DEFAULT']
+    return EndpointPool(
+        parse_api_urls(config['API_URL']),
+        create_rate_limiter,
+        config.getint('ENDPOINT_EJECT_FAILURES', fallback=DEFAULT_ENDPOINT_EJECT_FAILURES),
+        config.getfloat('ENDPOINT_EJECT_SECONDS', fallback=DEFAULT_ENDPOINT_EJECT_SECONDS),
+        config.getfloat('ENDPOINT_LATENCY_ALPHA', fallback=DEFAULT_ENDPOINT_LATENCY_ALPHA)
+    )
+
+
+class VerifierEngine:
+    """
+    엑셀 데이터의 각 행을 중계 서버로 보내 교정 결과를 기록하는 검증 엔진.
+
+    화면에 의존하지 않으므로 GUI와 명령줄 도구가 같은 처리 과정을 사용합니다.
+    진행 상황과 오류는 생성 시 전달받은 콜백으로 알립니다.
+    """
+
+    def __init__(self, file_path, reader, stop_event, on_progress, on_error,
+                 request_semaphore=None, endpoint_pool=None, executor=None, on_fatal=None):
+        """
+        :param file_path: 결과를 저장할 엑셀 파일 경로
+        :param reader: 같은 파일을 여는 ExcelChunkReader
+        :param stop_event: 설정되면 작업을 중단하는 threading.Event
+        :param on_progress: (메시지, 진행률) 을 받는 콜백
+        :param on_error: 오류 메시지를 받는 콜백
+        :param request_semaphore: 여러 파일을 동시에 처리할 때 전체 동시 요청 수를 제한하는 asyncio.Semaphore
+        :param endpoint_pool: 여러 파일이 함께 사용할 EndpointPool (없으면 설정으로 새로 만듦)
+        :param executor: 엑셀 파일 저장에 사용할 실행기 (없으면 실행하는 동안 작업 프로세스 하나를 만듦)
+        :param on_fatal: 해시 불일치·인증 오류처럼 다른 파일도 계속할 수 없는 오류가 나면 메시지를 받는 콜백
+        """
+        self.file_path = file_path
+        self.reader = reader
+        self.stop_event = stop_event
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.on_fatal = on_fatal
+
+        self.total_rows = reader.estimated_rows
+        self.completed_rows = 0
+        self.success_rows = 0
+        self.fail_rows = 0
+        self.consecutive_failures = 0
+
+        config = ConfigSingleton().config['DEFAULT']
+        self.max_concurrency = max(1, config.getint('MAX_CONCURRENCY', fallback=DEFAULT_MAX_CONCURRENCY))
+        self.checkpoint_rows = max(1, config.getint('CHECKPOINT_ROWS', fallback=DEFAULT_CHECKPOINT_ROWS))
+        self.checkpoint_seconds = config.getfloat('CHECKPOINT_SECONDS', fallback=DEFAULT_CHECKPOINT_SECONDS)
+        self.journal_sync_rows = config.getint('JOURNAL_SYNC_ROWS', fallback=DEFAULT_JOURNAL_SYNC_ROWS)
+        self.journal_sync_seconds = config.getfloat('JOURNAL_SYNC_SECONDS', fallback=DEFAULT_JOURNAL_SYNC_SECONDS)
+        self.cache_enabled = config.getboolean('CACHE_ENABLED', fallback=True)
+        self.cache_path = config.get('CACHE_PATH', fallback='') or os.path.join(get_cache_dir(), "responses.sqlite3")
+        self.cache_max_entries = config.getint('CACHE_MAX_ENTRIES', fallback=DEFAULT_CACHE_MAX_ENTRIES)
+        self.cache_max_age_days = config.getfloat('CACHE_MAX_AGE_DAYS', fallback=DEFAULT_CACHE_MAX_AGE_DAYS)
+        self.cache_commit_rows = config.getint('CACHE_COMMIT_ROWS', fallback=DEFAULT_CACHE_COMMIT_ROWS)
+        self.batch_enabled = config.getboolean('BATCH_ENABLED', fallback=False)
+        self.batch_max_items = max(1, config.getint('BATCH_MAX_ITEMS', fallback=DEFAULT_BATCH_MAX_ITEMS))
+        self.batch_max_bytes = config.getint('BATCH_MAX_BYTES', fallback=DEFAULT_BATCH_MAX_BYTES)
+        self.sentence_mode = config.getboolean('SENTENCE_MODE_ENABLED', fallback=False)
+
+        self.retry_policy = RetryPolicy(
+            config.getint('RETRY_MAX_ATTEMPTS', fallback=DEFAULT_RETRY_MAX_ATTEMPTS),
+            config.getfloat('RETRY_BASE_DELAY', fallback=DEFAULT_RETRY_BASE_DELAY),
+            config.getfloat('RETRY_MAX_DELAY', fallback=DEFAULT_RETRY_MAX_DELAY)
+        )
+        self.retry_stop_after_failed_rows = max(
+            1, config.getint('RETRY_STOP_AFTER_FAILED_ROWS', fallback=DEFAULT_RETRY_STOP_AFTER_FAILED_ROWS)
+        )
+
+        self.transport = RelayTransport.shared()
+
+        self.metrics = RunMetrics()
+        self.metrics_enabled = config.getboolean('METRICS_ENABLED', fallback=True)
+        self.metrics_dir = config.get('METRICS_DIR', fallback='') or os.path.join(get_cache_dir(), "metrics")
+        self.metrics_path = None
+        self.last_progress = 0.0
+
+        self.request_semaphore = request_semaphore
+        self.endpoint_pool = endpoint_pool if endpoint_pool is not None else create_endpoint_pool()
+        # 응답 캐시는 어느 주소가 응답했는지와 관계없이 기본 주소를 기준으로 저장합니다.
+        self.API_URL = self.endpoint_pool.primary_url
+        self.executor = executor
+
+    def count_status(self):
+        """이번 실행 기준 (성공 행 수, 실패 행 수, 전체 행 수) 를 반환합니다."""
+        return self.success_rows, self.fail_rows, self.total_rows
+
+    async def process_text(self):
+        """엑셀 파일 처리 및 HTTP POST 요청."""
+        if COLUMN_BEFORE not in self.reader.columns:
+            self.on_error(f"엑셀 파일에 {COLUMN_BEFORE} 열이 없습니다.")
+            return
+
+        file_path = self.file_path
+
+        self.checkpoint_lock = asyncio.Lock()
+        self.checkpoint_task = None  # 진행 중인 백그라운드 저장 작업
+        self.pending_updates = {}  # 아직 엑셀 파일에 저장하지 않은 {행 번호: {열 이름: 값}}
+        self.last_checkpoint = time.monotonic()
+
+        self.metrics = RunMetrics()
+        self.journal = ResultJournal(file_path, self.journal_sync_rows, self.journal_sync_seconds)
+        self.replayed = self.journal.replay()
+        self.loading_finished = False
+
+        self.cache = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.sentence_futures = {}  # 문장 단위 모드: {정규화한 문장: (성공 여부, 메시지, 소요 시간) Future}
+        self.sentence_reused = 0
+        if self.cache_enabled:
+            self.cache = ResponseCache(self.cache_path, self.cache_max_entries, self.cache_max_age_days,
+                                       self.cache_commit_rows)
+
+        # openpyxl 저장은 수 초가 걸리고 그동안 GIL을 잡으므로, 이벤트 루프와 다른 프로세스에서 실행합니다.
+        owned_executor = None
+        if self.executor is None:
+            owned_executor = self.executor = ProcessPoolExecutor(max_workers=1)
+
+        try:
+            try:
+                # 시작할 때 미리 계산해 둔 해시를 사용하며, 아직 계산 중이면 이벤트 루프를 막지 않고 기다립니다.
+                self.program_hash = await asyncio.get_running_loop().run_in_executor(None, sha_256_hash)
+                await self._process_rows(file_path)
+            except Exception as e:
+                # 파일 읽기 오류 등 예상하지 못한 오류도 화면에 알리고, 처리한 결과는 아래에서 저장합니다.
+                self.stop_event.set()
+                self.on_error(f"작업 중 오류가 발생하여 중단합니다: {e}")
+                self.on_progress("오류로 작업이 중단되었습니다.", 0)
+            finally:
+                self.reader.close()
+                self.journal.close()
+                if self.cache is not None:
+                    self.cache.close()
+
+            # 모든 행을 읽었고 마지막 결과까지 엑셀 파일에 반영되면 저널은 더 이상 필요하지 않습니다.
+            # 중간에 멈춘 경우에는 아직 읽지 못한 행의 결과가 남아 있을 수 있어 저널을 유지합니다.
+            if await self._checkpoint(file_path, force=True):
+                if self.loading_finished:
+                    self.journal.clear()
+                else:
+                    self.journal.compact({})  # 복원하지 않기로 한 이전 결과를 지움
+        finally:
+            if owned_executor is not None:
+                owned_executor.shutdown()
+                self.executor = None
+
+        if self.metrics_enabled:
+            self._save_metrics(file_path)
+
+        if not self.stop_event.is_set():
+            summary = f"캐시 사용 {self.cache_hits}건, API 요청 {self.cache_misses}건"
+            if self.sentence_mode:
+                summary += f", 중복 문장 재사용 {self.sentence_reused}건"
+            self.on_progress(f"작업이 완료되었습니다. ({summary})", 100)
+
+    def _save_metrics(self, file_path):
+        """이번 실행의 행별 소요 시간(CSV)과 요약(JSON)을 METRICS_DIR에 저장합니다."""
+        settings = {
+            "max_concurrency": self.max_concurrency,
+            "batch_enabled": self.batch_enabled,
+            "batch_max_items": self.batch_max_items,
+            "sentence_mode": self.sentence_mode,
+            "rate_limit_enabled": self.endpoint_pool.endpoints[0].rate_limiter is not None,
+            "checkpoint_rows": self.checkpoint_rows,
+            "endpoints": self.endpoint_pool.snapshot(),
+        }
+        try:
+            self.metrics_path = self.metrics.save(self.metrics_dir, file_path, settings)
+        except OSError as e:
+            self.on_error(f"실행 측정 결과를 저장하지 못했습니다: {e}")
+
+    def _replay_row(self, idx, content):
+        """이전 실행이 저장하지 못한 이 행의 결과가 저널에 있으면 (수정후, 상태) 를 반환합니다."""
+        entry = self.replayed.pop(idx, None)
+        if entry is None:
+            return None
+        # 행이 삭제되었거나 내용이 바뀐 경우에는 복원하지 않습니다.
+        if fingerprint(content) != entry[0]:
+            self.journal.discard(idx)
+            return None
+        return entry[1], entry[2]
+
+    def _plan_chunk(self, chunk):
+        """
+        읽어 온 묶음에서 이미 성공한 행 수와 처리할 (행 번호, 수정전, 상태) 목록을 반환합니다.
+
+        상태 열을 한 번에 비교해 성공한 행을 거르므로, 이어서 처리할 때 완료된 행마다 비용이 들지 않습니다.
+        엑셀 파일에서 이미 성공한 행은 저널에 이전 결과가 남아 있어도 복원하지 않습니다.
+        (그 뒤에 사용자가 고친 수정후를 덮어쓰지 않도록)
+        """
+        if COLUMN_STATUS in chunk.columns:
+            statuses = chunk[COLUMN_STATUS]
+        else:
+            statuses = pd.Series("", index=chunk.index)
+
+        pending = statuses != PLAG_STATUS_SUCCESS
+        if self.replayed:
+            for idx in chunk.index[~pending & chunk.index.isin(list(self.replayed))]:
+                del self.replayed[idx]
+                self.journal.discard(idx)
+
+        rows = zip(chunk.index[pending], chunk[COLUMN_BEFORE][pending], statuses[pending])
+        return len(chunk) - int(pending.sum()), list(rows)
+
+    async def _process_rows(self, file_path):
+        """
+        작업자 풀을 띄우고, 엑셀 파일을 묶음 단위로 읽으면서 처리할 행을 대기열에 넣습니다.
+
+        다음 묶음은 별도 쓰레드에서 읽으므로 앞쪽 행의 요청이 먼저 시작됩니다.
+        """
+        queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        self.completed_rows = 0
+
+        workers = [
+            asyncio.create_task(self._worker(queue, file_path))
+            for _ in range(self.max_concurrency)
+        ]
+
+        # 일괄 요청을 사용하지 않으면 묶음마다 한 행씩만 담습니다.
+        max_items = self.batch_max_items if self.batch_enabled else 1
+        batch, batch_bytes = [], 0
+
+        async def enqueue(key, content):
+            """요청할 항목을 묶음에 담고, 묶음이 가득 차면 대기열에 넣습니다."""
+            nonlocal batch, batch_bytes
+            size = len(content.encode('utf-8'))
+            if batch and (len(batch) >= max_items or batch_bytes + size > self.batch_max_bytes):
+                await queue.put((batch, time.perf_counter()))
+                batch, batch_bytes = [], 0
+
+            batch.append((key, content))
+            batch_bytes += size
+
+        row_tasks = []  # 문장 단위 모드에서 문장 결과를 기다려 행을 완성하는 작업
+
+        loop = asyncio.get_running_loop()
+        chunks = iter(self.reader)
+        try:
+            while not self.stop_event.is_set():
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    self.total_rows = self.reader.rows_read
+                    self.loading_finished = True
+                    break
+                self.total_rows = max(self.total_rows, self.reader.rows_read)
+
+                skipped, rows = self._plan_chunk(chunk)
+                if skipped:
+                    self.success_rows += skipped
+                    self.metrics.skipped_rows += skipped
+                    self._update_progress(skipped)
+
+                for idx, content, status in rows:
+                    if self.stop_event.is_set():
+                        break
+
+                    replayed = self._replay_row(idx, content)
+                    if replayed is not None:
+                        message, status = replayed
+                        self._stage_update(idx, message, status)
+
+                    if status == PLAG_STATUS_SUCCESS:
+                        self.success_rows += 1
+                        self.metrics.skipped_rows += 1
+                        self._update_progress()
+                        continue
+
+                    if self.sentence_mode:
+                        enqueued = time.perf_counter()
+                        parts = await self._plan_sentences(content, enqueue)
+                        row_tasks.append(asyncio.create_task(
+                            self._assemble_row(idx, content, parts, file_path, enqueued)
+                        ))
+                        continue
+
+                    cached = self._lookup_cache(content)
+                    if cached is not None:
+                        await self._record_result(idx, content, True, cached, file_path,
+                                                  new_timing(), time.perf_counter(), source="cache")
+                        continue
+
+                    await enqueue(idx, content)
+        except Exception:
+            # 파일 읽기 오류 등으로 멈추면, 작업자가 남은 항목을 요청 없이 비우고 끝나도록 중단 신호를 보냅니다.
+            self.stop_event.set()
+            raise
+        finally:
+            if batch and not self.stop_event.is_set():
+                await queue.put((batch, time.perf_counter()))
+
+            # 작업자마다 종료 신호를 하나씩 넣습니다.
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+
+            if row_tasks:
+                # 중단되어 요청하지 못한 문장을 기다리는 행은 기록하지 않고 끝냅니다. (다음 실행 때 다시 처리)
+                for future in self.sentence_futures.values():
+                    future.cancel()
+                await asyncio.gather(*row_tasks, return_exceptions=True)
+
+        if self.stop_event.is_set():
+            self.on_progress("작업이 중단되었습니다.", 0)
+
+    async def _worker(self, queue, file_path):
+        """대기열에서 묶음을 꺼내 요청을 보내고 결과를 각 행에 기록합니다."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            # 중단된 경우 남은 항목은 요청 없이 비워서 생산자가 막히지 않도록 합니다.
+            if self.stop_event.is_set():
+                continue
+
+            batch, enqueued = item
+            timing = new_timing(time.perf_counter() - enqueued)
+            self.cache_misses += len(batch)
+            results = await self._send_with_retry(batch, timing)
+
+            if self.sentence_mode:
+                for (key, sentence), (success, message) in zip(batch, results):
+                    self._resolve_sentence(key, sentence, success, message, timing)
+                continue
+
+            for (idx, content), (success, message) in zip(batch, results):
+                if success and self.cache is not None:
+                    self.cache.put(make_cache_key(content, self.API_URL), message)
+                await self._record_result(idx, content, success, message, file_path, timing, enqueued)
+
+    async def _plan_sentences(self, content, enqueue):
+        """
+        문장 단위 모드에서 행의 텍스트를 문장으로 나누고, 처음 나온 문장만 요청 대기열에 넣습니다.
+
+        같은 문장은 파일 전체에서 한 번만 요청하며, 캐시에 있는 문장은 요청하지 않습니다.
+        (앞 공백, 문장 결과 Future 또는 None, 뒤 공백) 목록을 반환하며, 공백뿐인 조각은 Future 없이 그대로 둡니다.
+        """
+        loop = asyncio.get_running_loop()
+        parts = []
+        for piece in split_sentences(content):
+            lead, sentence, trail = SENTENCE_PARTS.fullmatch(piece).groups()
+            if not sentence:
+                parts.append((piece, None, ""))
+                continue
+
+            key = normalize_text(sentence)
+            future = self.sentence_futures.get(key)
+            if future is not None:
+                self.sentence_reused += 1
+            else:
+                future = loop.create_future()
+                self.sentence_futures[key] = future
+                cached = self._lookup_cache(sentence)
+                if cached is not None:
+                    future.set_result((True, cached, None))
+                else:
+                    await enqueue(key, sentence)
+            parts.append((lead, future, trail))
+        return parts
+
+    def _resolve_sentence(self, key, sentence, success, message, timing):
+        """문장 하나의 결과를 그 문장을 기다리는 행에 알립니다. 실패한 문장은 뒤에 다시 나오면 새로 요청합니다."""
+        future = self.sentence_futures[key]
+        if success:
+            if self.cache is not None:
+                self.cache.put(make_cache_key(sentence, self.API_URL), message)
+        else:
+            del self.sentence_futures[key]
+        if not future.done():
+            future.set_result((success, message, timing))
+
+    async def _assemble_row(self, idx, content, parts, file_path, enqueued):
+        """
+        행의 모든 문장 결과를 기다려 원래 순서와 공백대로 이어 붙이고 기록합니다.
+        문장 하나라도 실패하면 그 오류 메시지로 행을 실패 처리합니다.
+        """
+        pieces = []
+        timing = None  # 이번 실행에서 요청한 문장 중 가장 오래 걸린 문장의 소요 시간
+        for lead, future, trail in parts:
+            if future is None:
+                pieces.append(lead)
+                continue
+
+            success, message, sentence_timing = await future
+            if sentence_timing is not None and (
+                    timing is None or sentence_timing["request"] > timing["request"]):
+                timing = sentence_timing
+            if not success:
+                await self._record_result(idx, content, False, message, file_path,
+                                          timing or new_timing(), enqueued)
+                return
+            pieces.append(lead + message.strip() + trail)
+
+        source = "request" if timing is not None else "cache"
+        await self._record_result(idx, content, True, "".join(pieces), file_path,
+                                  timing or new_timing(), enqueued, source=source)
+
+    def _stage_update(self, idx, message, status):
+        """다음 저장 때 엑셀 파일에 기록할 결과를 모아 둡니다."""
+        self.pending_updates[idx] = {COLUMN_AFTER: message, COLUMN_STATUS: status}
+
+    async def _record_result(self, idx, content, success, message, file_path, timing, enqueued, source="request"):
+        """
+        결과를 저널에 기록하고 저장 대기 목록에 넣은 뒤 진행률을 갱신합니다.
+
+        :param timing: 이 행이 속한 요청 묶음의 소요 시간 (new_timing)
+        :param enqueued: 행이 대기열에 들어간 시각 (time.perf_counter 기준)
+        :param source: "request"(중계 서버 요청) 또는 "cache"(캐시 사용)
+        """
+        status = PLAG_STATUS_SUCCESS if success else PLAG_STATUS_FAIL
+        if success:
+            self.success_rows += 1
+            self.consecutive_failures = 0
+        else:
+            self.fail_rows += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.retry_stop_after_failed_rows:
+                self._stop_with_error(f"{self.consecutive_failures}개 행이 연속으로 실패하여 작업을 중단합니다: {message}")
+
+        start = time.perf_counter()
+        self.journal.append(idx, content, message, status)  # 즉시 결과 기록 (fsync는 모아서)
+        self._stage_update(idx, message, status)
+        self._schedule_checkpoint(file_path)
+        self.metrics.add_row(idx, source, success, timing, time.perf_counter() - start, enqueued)
+
+        self._update_progress()
+
+    def _schedule_checkpoint(self, file_path):
+        """
+        CHECKPOINT_ROWS개 행 또는 CHECKPOINT_SECONDS초마다 저장을 백그라운드 작업으로 시작합니다.
+
+        작업자는 저장을 기다리지 않고 다음 요청을 보내며, 이전 저장이 아직 진행 중이면 건너뜁니다.
+        그동안 모인 결과는 다음 저장이 한 번에 가져갑니다.
+        """
+        due = (len(self.pending_updates) >= self.checkpoint_rows
+               or time.monotonic() - self.last_checkpoint >= self.checkpoint_seconds)
+        if not due or self.checkpoint_lock.locked() or (
+                self.checkpoint_task is not None and not self.checkpoint_task.done()):
+            return
+        self.checkpoint_task = asyncio.create_task(self._checkpoint(file_path))
+
+    async def _checkpoint(self, file_path, force=False):
+        """
+        모인 결과를 엑셀 파일의 해당 셀에 저장하고, 저장에 성공하면 True를 반환합니다.
+
+        force가 아니면 다른 저장이 진행 중일 때 건너뛰고, force면 진행 중인 저장이 끝난 뒤 남은 결과를 저장합니다.
+        """
+        if not force and self.checkpoint_lock.locked():
+            return False
+
+        async with self.checkpoint_lock:
+            if not self.pending_updates:
+                return True
+
+            updates, self.pending_updates = self.pending_updates, {}
+            start = time.perf_counter()
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, partial(save_excel_cells, file_path, updates))
+            except Exception as e:
+                # 저장하지 못한 결과는 다음 저장 때 다시 시도합니다. (그 사이 새로 모인 결과가 우선)
+                self.pending_updates = {**updates, **self.pending_updates}
+                self.stop_event.set()
+                if isinstance(e, PermissionError):
+                    self.on_error("파일이 다른 프로그램에서 열려 있습니다. 처리된 결과는 다음 실행 때 복원됩니다.")
+                else:
+                    self.on_error(f"결과를 엑셀 파일에 저장하지 못했습니다: {e}. 처리된 결과는 다음 실행 때 복원됩니다.")
+                return False
+
+            # 저장한 결과는 저널에서 지워, 다음 실행이 그 뒤에 고친 셀을 저널 내용으로 덮어쓰지 않도록 합니다.
+            self.journal.compact({
+                idx: (values[COLUMN_AFTER], values[COLUMN_STATUS]) for idx, values in updates.items()
+            })
+            self.metrics.add_checkpoint(len(updates), time.perf_counter() - start)
+            self.last_checkpoint = time.monotonic()
+            return True
+
+    def _lookup_cache(self, content):
+        """캐시에 같은 내용의 교정 결과가 있으면 반환합니다."""
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get(make_cache_key(content, self.API_URL))
+        if cached is not None:
+            self.cache_hits += 1
+        return cached
+
+    async def _send_with_retry(self, batch, timing):
+        """
+        행 묶음을 보내고, 행 순서대로 (성공 여부, 메시지) 목록을 반환합니다.
+
+        일시적인 오류로 실패한 행만 골라 지수 백오프 후 다시 보내며, 한 행은 최대
+        RETRY_MAX_ATTEMPTS번까지 요청합니다. 요청마다 주소 목록에서 주소를 새로 고르므로
+        재시도는 보통 다른 주소로 갑니다. 해시 검증 실패처럼 재시도해도 소용없는
+        오류가 나면 작업 전체를 멈춥니다.
+        """
+        results = [None] * len(batch)
+        pending = list(range(len(batch)))
+        attempt = 0
+
+        while pending:
+            endpoint = self.endpoint_pool.choose()
+            rate_limiter = endpoint.rate_limiter
+            if rate_limiter is not None:
+                start = time.perf_counter()
+                await rate_limiter.acquire()
+                timing["wait"] += time.perf_counter() - start
+
+            timing["attempts"] += 1
+            request_time = timing["request"]
+            self.endpoint_pool.on_start(endpoint)
+            try:
+                replies = await self._post_items([batch[i] for i in pending], timing, endpoint.url)
+                self.endpoint_pool.on_success(endpoint, timing["request"] - request_time)
+                errors = {}
+                for i, (success, message) in zip(pending, replies):
+                    if success:
+                        results[i] = (True, message)
+                    else:
+                        errors[i] = RelayReplyError(message)
+            except Exception as e:
+                self.endpoint_pool.on_failure(endpoint, e)
+                errors = {i: e for i in pending}
+
+            if rate_limiter is not None:
+                if any(is_throttle(error) for error in errors.values()):
+                    rate_limiter.on_throttle()
+                elif len(errors) < len(pending):
+                    rate_limiter.on_success()
+
+            attempt += 1
+            pending = []
+            for i, error in errors.items():
+                if not is_retryable(error):
+                    results[i] = (False, describe_error(error))
+                    if is_fatal(error):
+                        self._stop_with_error(describe_error(error))
+                        if self.on_fatal is not None:
+                            self.on_fatal(describe_error(error))
+                elif attempt >= self.retry_policy.max_attempts or self.stop_event.is_set():
+                    results[i] = (False, describe_error(error))
+                else:
+                    pending.append(i)
+
+            if pending:
+                delay = self.retry_policy.delay(attempt, errors[pending[0]])
+                timing["wait"] += delay
+                await asyncio.sleep(delay)
+
+        return results
+
+    async def _post_items(self, items, timing=None, url=None):
+        """
+        행 목록을 한 번 요청하고 (성공 여부, 메시지) 목록을 반환합니다.
+
+        일괄 요청을 사용하면 items 배열로 보내고 항목별 결과를 행에 맞춰 돌려주며,
+        요청 전체가 실패하면 예외를 발생시킵니다. url을 주지 않으면 기본 주소로 보냅니다.
+        """
+        if not self.batch_enabled:
+            _, content = items[0]
+            response = await self.send_post_request({"hash": self.program_hash, "content": content}, timing, url)
+            return [(bool(response["success"]), response["message"])]
+
+        data = {
+            "hash": self.program_hash,
+            "items": [{"id": i, "content": content} for i, (_, content) in enumerate(items)]
+        }
+        response = await self.send_post_request(data, timing, url)
+        if not response["success"]:
+            raise RelayReplyError(response["message"])
+
+        replies = {reply["id"]: reply for reply in response["results"]}
+        results = []
+        for i in range(len(items)):
+            reply = replies.get(i)
+            if reply is None:
+                results.append((False, "응답에 이 행의 결과가 없습니다."))
+            else:
+                results.append((bool(reply["success"]), reply["message"]))
+        return results
+
+    async def send_post_request(self, data, timing=None, url=None):
+        """HTTP POST 요청을 보내는 함수. 공용 전송 계층의 연결 풀을 사용하며, 실패는 예외로 알립니다."""
+        url = url or self.API_URL
+        if self.request_semaphore is None:
+            return await self.transport.post_json(url, data, timing)
+        start = time.perf_counter()
+        async with self.request_semaphore:
+            if timing is not None:
+                timing["wait"] += time.perf_counter() - start
+            return await self.transport.post_json(url, data, timing)
+
+    def _stop_with_error(self, message):
+        """작업 전체를 멈추고 오류를 한 번만 알립니다."""
+        if not self.stop_event.is_set():
+            self.stop_event.set()
+            self.on_error(message)
+
+    def _update_progress(self, count=1):
+        """
+        완료된 행 수를 count만큼 늘리고, 처리 속도와 남은 시간을 포함한 진행 상황을 알립니다.
+        화면 갱신이 작업을 늦추지 않도록 PROGRESS_INTERVAL_SECONDS마다 한 번(과 마지막 행)만 알립니다.
+        """
+        self.completed_rows += count
+        total_rows = max(self.total_rows, self.completed_rows)
+        now = time.monotonic()
+        if now - self.last_progress < PROGRESS_INTERVAL_SECONDS and self.completed_rows < total_rows:
+            return
+        self.last_progress = now
+
+        message = f"진행 중: {self.completed_rows}/{total_rows} 처리 완료"
+        rate = self.metrics.throughput()
+        if rate > 0:
+            message += f" · {rate:.1f}행/초"
+            eta = self.metrics.eta(total_rows - self.completed_rows)
+            if self.completed_rows < total_rows and eta is not None:
+                message += f" · 남은 시간 약 {format_duration(eta)}"
+        self.on_progress(message, self.completed_rows / total_rows * 100)